@@ -2,5 +2,21 @@ from . import functional
 from . import misc
 from . import modules
 from .misc import *
-from .modules import *
 from .version import __version__
+
+# The modules are loaded on first access; see diffsptk/modules/__init__.py.
+__all__ = [name for name in globals() if not name.startswith("_")]
+__all__ += modules.__all__
+
+
+def __getattr__(name):
+    try:
+        value = getattr(modules, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(modules.__all__))
@@ -233,6 +233,7 @@ def chroma(x, n_channel, sample_rate, norm=float("inf")):
         sample_rate=sample_rate,
         norm=norm,
         use_power=True,
+        algorithm="auto",
     )
 
 
@@ -253,7 +254,7 @@ def csm2acr(c):
     return nn.CompositeSinusoidalModelCoefficientsToAutocorrelation._func(c)
 
 
-def dct(x, dct_type=2):
+def dct(x, dct_type=2, algorithm="auto"):
     """Compute DCT.
 
     Parameters
@@ -264,13 +265,16 @@ def dct(x, dct_type=2):
     dct_type : int in [1, 4]
         DCT type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long input.
+
     Returns
     -------
     out : Tensor [shape=(..., L)]
         DCT output.
 
     """
-    return nn.DiscreteCosineTransform._func(x, dct_type=dct_type)
+    return nn.DiscreteCosineTransform._func(x, dct_type=dct_type, algorithm=algorithm)
 
 
 def decimate(x, period=1, start=0, dim=-1):
@@ -399,7 +403,7 @@ def dfs(x, b=None, a=None):
     return nn.InfiniteImpulseResponseDigitalFilter._func(x, b=b, a=a)
 
 
-def dht(x, dht_type=2):
+def dht(x, dht_type=2, algorithm="auto"):
     """Compute DHT.
 
     Parameters
@@ -410,13 +414,16 @@ def dht(x, dht_type=2):
     dht_type : int in [1, 4]
         DHT type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long input.
+
     Returns
     -------
     out : Tensor [shape=(..., L)]
         DHT output.
 
     """
-    return nn.DiscreteHartleyTransform._func(x, dht_type=dht_type)
+    return nn.DiscreteHartleyTransform._func(x, dht_type=dht_type, algorithm=algorithm)
 
 
 def drc(
@@ -475,7 +482,7 @@ def drc(
     )
 
 
-def dst(x, dst_type=2):
+def dst(x, dst_type=2, algorithm="auto"):
     """Compute DST.
 
     Parameters
@@ -486,13 +493,16 @@ def dst(x, dst_type=2):
     dst_type : int in [1, 4]
         DST type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long input.
+
     Returns
     -------
     out : Tensor [shape=(..., L)]
         DST output.
 
     """
-    return nn.DiscreteSineTransform._func(x, dst_type=dst_type)
+    return nn.DiscreteSineTransform._func(x, dst_type=dst_type, algorithm=algorithm)
 
 
 def entropy(p, out_format="nat"):
@@ -591,6 +601,7 @@ def fbank(x, n_channel, sample_rate, f_min=0, f_max=None, floor=1e-5, out_format
         floor=floor,
         use_power=False,
         out_format=out_format,
+        algorithm="auto",
     )
 
 
@@ -827,7 +838,7 @@ def ialaw(y, abs_max=1, a=87.6):
     return nn.ALawExpansion._func(y, abs_max=abs_max, a=a)
 
 
-def idct(y, dct_type=2):
+def idct(y, dct_type=2, algorithm="auto"):
     """Compute inverse DCT.
 
     Parameters
@@ -838,16 +849,21 @@ def idct(y, dct_type=2):
     dct_type : int in [1, 4]
         DCT type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long input.
+
     Returns
     -------
     out : Tensor [shape=(..., L)]
         Inverse DCT output.
 
     """
-    return nn.InverseDiscreteCosineTransform._func(y, dct_type=dct_type)
+    return nn.InverseDiscreteCosineTransform._func(
+        y, dct_type=dct_type, algorithm=algorithm
+    )
 
 
-def idht(y, dht_type=2):
+def idht(y, dht_type=2, algorithm="auto"):
     """Compute inverse DHT.
 
     Parameters
@@ -858,16 +874,21 @@ def idht(y, dht_type=2):
     dht_type : int in [1, 4]
         DHT type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long input.
+
     Returns
     -------
     out : Tensor [shape=(..., L)]
         Inverse DHT output.
 
     """
-    return nn.InverseDiscreteHartleyTransform._func(y, dht_type=dht_type)
+    return nn.InverseDiscreteHartleyTransform._func(
+        y, dht_type=dht_type, algorithm=algorithm
+    )
 
 
-def idst(y, dst_type=2):
+def idst(y, dst_type=2, algorithm="auto"):
     """Compute inverse DST.
 
     Parameters
@@ -878,13 +899,18 @@ def idst(y, dst_type=2):
     dst_type : int in [1, 4]
         DST type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long input.
+
     Returns
     -------
     out : Tensor [shape=(..., L)]
         Inverse DST output.
 
     """
-    return nn.InverseDiscreteSineTransform._func(y, dst_type=dst_type)
+    return nn.InverseDiscreteSineTransform._func(
+        y, dst_type=dst_type, algorithm=algorithm
+    )
 
 
 def ifreqt2(c, out_order, alpha=0, theta=0, n_fft=512):
@@ -941,7 +967,7 @@ def ignorm(y, gamma=0, c=None):
     return nn.GeneralizedCepstrumInverseGainNormalization._func(y, gamma=gamma, c=c)
 
 
-def imdct(y, out_length=None, frame_length=400, window="sine"):
+def imdct(y, out_length=None, frame_length=400, window="sine", algorithm="auto"):
     """Compute inverse modified discrete cosine transform.
 
     Parameters
@@ -958,13 +984,20 @@ def imdct(y, out_length=None, frame_length=400, window="sine"):
     window : ['sine', 'vorbis', 'kbd', 'rectangular']
         Window type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long frame.
+
     """
     return nn.InverseModifiedDiscreteCosineTransform._func(
-        y, out_length=out_length, frame_length=frame_length, window=window
+        y,
+        out_length=out_length,
+        frame_length=frame_length,
+        window=window,
+        algorithm=algorithm,
     )
 
 
-def imdst(y, out_length=None, frame_length=400, window="sine"):
+def imdst(y, out_length=None, frame_length=400, window="sine", algorithm="auto"):
     """Compute inverse modified discrete sine transform.
 
     Parameters
@@ -981,9 +1014,16 @@ def imdst(y, out_length=None, frame_length=400, window="sine"):
     window : ['sine', 'vorbis', 'kbd', 'rectangular']
         Window type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long frame.
+
     """
     return nn.InverseModifiedDiscreteSineTransform._func(
-        y, out_length=out_length, frame_length=frame_length, window=window
+        y,
+        out_length=out_length,
+        frame_length=frame_length,
+        window=window,
+        algorithm=algorithm,
     )
 
 
@@ -1129,7 +1169,7 @@ def lar2par(g):
     return nn.LogAreaRatioToParcorCoefficients._func(g)
 
 
-def levdur(r, eps=0):
+def levdur(r, eps=0, algorithm="recursive", return_parcor=False):
     """Solve a Yule-Walker linear system.
 
     Parameters
@@ -1140,13 +1180,24 @@ def levdur(r, eps=0):
     eps : float >= 0
         A small value to improve numerical stability.
 
+    algorithm : ['recursive', 'inverse']
+        Algorithm to solve the system.
+
+    return_parcor : bool
+        If True, return PARCOR coefficients in addition to LPC coefficients.
+
     Returns
     -------
-    out : Tensor [shape=(..., M+1)]
+    a : Tensor [shape=(..., M+1)]
         Gain and LPC coefficients.
 
+    k : Tensor [shape=(..., M+1)]
+        Gain and PARCOR coefficients, returned only if **return_parcor** is True.
+
     """
-    return nn.LevinsonDurbin._func(r, eps=eps)
+    return nn.LevinsonDurbin._func(
+        r, eps=eps, algorithm=algorithm, return_parcor=return_parcor
+    )
 
 
 def linear_intpl(x, upsampling_factor=80):
@@ -1192,7 +1243,15 @@ def lpc(x, lpc_order, eps=1e-6):
     return nn.LinearPredictiveCodingAnalysis._func(x, lpc_order=lpc_order, eps=eps)
 
 
-def lpc2lsp(a, log_gain=False, sample_rate=None, out_format="radian"):
+def lpc2lsp(
+    a,
+    log_gain=False,
+    sample_rate=None,
+    out_format="radian",
+    algorithm="chebyshev",
+    n_split=128,
+    n_iter=8,
+):
     """Convert LPC to LSP.
 
     Parameters
@@ -1209,6 +1268,15 @@ def lpc2lsp(a, log_gain=False, sample_rate=None, out_format="radian"):
     out_format : ['radian', 'cycle', 'khz', 'hz']
         Output format.
 
+    algorithm : ['chebyshev', 'eig']
+        Root finding algorithm.
+
+    n_split : int >= 1
+        Number of splits of the interval :math:`[0, \\pi]` used for bracketing.
+
+    n_iter : int >= 1
+        Number of iterations of Newton's method.
+
     Returns
     -------
     out : Tensor [shape=(..., M+1)]
@@ -1216,7 +1284,13 @@ def lpc2lsp(a, log_gain=False, sample_rate=None, out_format="radian"):
 
     """
     return nn.LinearPredictiveCoefficientsToLineSpectralPairs._func(
-        a, log_gain=log_gain, sample_rate=sample_rate, out_format=out_format
+        a,
+        log_gain=log_gain,
+        sample_rate=sample_rate,
+        out_format=out_format,
+        algorithm=algorithm,
+        n_split=n_split,
+        n_iter=n_iter,
     )
 
 
@@ -1399,7 +1473,7 @@ def mc2b(mc, alpha=0):
     return nn.MelCepstrumToMLSADigitalFilterCoefficients._func(mc, alpha=alpha)
 
 
-def mdct(x, frame_length=400, window="sine"):
+def mdct(x, frame_length=400, window="sine", algorithm="auto"):
     """Compute modified discrete cosine transform.
 
     Parameters
@@ -1413,6 +1487,9 @@ def mdct(x, frame_length=400, window="sine"):
     window : ['sine', 'vorbis', 'kbd', 'rectangular']
         Window type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long frame.
+
     Returns
     -------
     out : Tensor [shape=(..., 2T/L, L/2)]
@@ -1420,11 +1497,11 @@ def mdct(x, frame_length=400, window="sine"):
 
     """
     return nn.ModifiedDiscreteCosineTransform._func(
-        x, frame_length=frame_length, window=window
+        x, frame_length=frame_length, window=window, algorithm=algorithm
     )
 
 
-def mdst(x, frame_length=400, window="sine"):
+def mdst(x, frame_length=400, window="sine", algorithm="auto"):
     """Compute modified discrete sine transform.
 
     Parameters
@@ -1438,6 +1515,9 @@ def mdst(x, frame_length=400, window="sine"):
     window : ['sine', 'vorbis', 'kbd', 'rectangular']
         Window type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long frame.
+
     Returns
     -------
     out : Tensor [shape=(..., 2T/L, L/2)]
@@ -1445,7 +1525,7 @@ def mdst(x, frame_length=400, window="sine"):
 
     """
     return nn.ModifiedDiscreteSineTransform._func(
-        x, frame_length=frame_length, window=window
+        x, frame_length=frame_length, window=window, algorithm=algorithm
     )
 
 
@@ -1577,7 +1657,7 @@ def mgc2sp(
     )
 
 
-def mlpg(u, seed=[[-0.5, 0, 0.5], [1, -2, 1]]):
+def mlpg(u, seed=[[-0.5, 0, 0.5], [1, -2, 1]], *, v=None, algorithm="dense"):
     """Perform MLPG to obtain smoothed static sequence.
 
     Parameters
@@ -1588,13 +1668,22 @@ def mlpg(u, seed=[[-0.5, 0, 0.5], [1, -2, 1]]):
     seed : list[list[float]] or list[int]
         Delta coefficients or width(s) of 1st (and 2nd) regression coefficients.
 
+    v : Tensor [shape=(..., T, DxH)] or None
+        Time-variant variance vectors with delta components. If None, unit variance
+        is assumed.
+
+    algorithm : ['dense', 'banded']
+        Algorithm to solve the linear system.
+
     Returns
     -------
     out : Tensor [shape=(..., T, D)]
         Static components.
 
     """
-    return nn.MaximumLikelihoodParameterGeneration._func(u, seed=seed)
+    return nn.MaximumLikelihoodParameterGeneration._func(
+        u, v, seed=seed, algorithm=algorithm
+    )
 
 
 def mlsacheck(
@@ -1832,7 +1921,9 @@ def pol_root(x, real=False):
     return nn.RootsToPolynomial._func(x, real=real)
 
 
-def poledf(x, a, frame_period=80, ignore_gain=False):
+def poledf(
+    x, a, frame_period=80, ignore_gain=False, algorithm="sequential", chunk_length=256
+):
     """Apply an all-pole digital filter.
 
     Parameters
@@ -1849,6 +1940,12 @@ def poledf(x, a, frame_period=80, ignore_gain=False):
     ignore_gain : bool
         If True, perform filtering without gain.
 
+    algorithm : ['sequential', 'scan']
+        Algorithm of time-varying all-pole filtering.
+
+    chunk_length : int >= 1
+        Chunk length used only when **algorithm** is 'scan'.
+
     Returns
     -------
     out : Tensor [shape=(..., T)]
@@ -1856,7 +1953,12 @@ def poledf(x, a, frame_period=80, ignore_gain=False):
 
     """
     return nn.AllPoleDigitalFilter._func(
-        x, a, frame_period=frame_period, ignore_gain=ignore_gain
+        x,
+        a,
+        frame_period=frame_period,
+        ignore_gain=ignore_gain,
+        algorithm=algorithm,
+        chunk_length=chunk_length,
     )
 
 
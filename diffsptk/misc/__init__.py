@@ -1,3 +1,6 @@
+from .cache import cache_info
+from .cache import clear_cache
+from .cache import set_cache_size
 from .signals import *
 from .utils import TWO_PI as two_pi
 from .utils import get_alpha
@@ -0,0 +1,214 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import collections
+import threading
+
+import torch
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ["hits", "misses", "maxsize", "currsize", "maxbytes", "currbytes"]
+)
+
+
+class ConstantCache:
+    """Bounded and thread-safe LRU cache for precomputed constants.
+
+    Parameters
+    ----------
+    maxsize : int >= 0
+        Maximum number of cached entries. If zero, caching is disabled.
+
+    maxbytes : int >= 0
+        Maximum total size of the cached tensors in bytes. A constant larger than
+        this value is not cached.
+
+    """
+
+    def __init__(self, maxsize=128, maxbytes=2**27):
+        assert 0 <= maxsize
+        assert 0 <= maxbytes
+
+        self._maxsize = maxsize
+        self._maxbytes = maxbytes
+        self._data = collections.OrderedDict()
+        self._nbytes = {}
+        self._currbytes = 0
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def __call__(self, fn, *args, **kwargs):
+        try:
+            key = (fn.__module__, fn.__qualname__, _freeze(args), _freeze(kwargs))
+            hash(key)
+        except TypeError:
+            # Unhashable arguments, e.g., tensors, are not cached.
+            return fn(*args, **kwargs)
+
+        with self._lock:
+            if key in self._data:
+                self._hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+            self._misses += 1
+
+        # The constants must be usable outside of the inference mode.
+        with torch.inference_mode(False):
+            value = fn(*args, **kwargs)
+
+        nbytes = _nbytes(value)
+        with self._lock:
+            if 0 < self._maxsize and nbytes <= self._maxbytes:
+                if key in self._data:
+                    self._currbytes -= self._nbytes[key]
+                self._data[key] = value
+                self._data.move_to_end(key)
+                self._nbytes[key] = nbytes
+                self._currbytes += nbytes
+                self._evict()
+        return value
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._maxsize,
+                len(self._data),
+                self._maxbytes,
+                self._currbytes,
+            )
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._nbytes.clear()
+            self._currbytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def resize(self, maxsize=None, maxbytes=None):
+        assert maxsize is None or 0 <= maxsize
+        assert maxbytes is None or 0 <= maxbytes
+        with self._lock:
+            if maxsize is not None:
+                self._maxsize = maxsize
+            if maxbytes is not None:
+                self._maxbytes = maxbytes
+            self._evict()
+
+    def _evict(self):
+        # Discard the least recently used entries until both limits are satisfied.
+        while self._maxsize < len(self._data) or self._maxbytes < self._currbytes:
+            key, _ = self._data.popitem(last=False)
+            self._currbytes -= self._nbytes.pop(key)
+
+
+def _freeze(x):
+    if isinstance(x, (list, tuple)):
+        return (type(x).__name__,) + tuple(_freeze(v) for v in x)
+    if isinstance(x, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in x.items()))
+    if isinstance(x, torch.Tensor):
+        raise TypeError("tensor is not cached.")
+    if isinstance(x, str):
+        return x
+    if isinstance(x, (bool, int, float)):
+        # Distinguish, e.g., 1 and True, which have the same hash value.
+        return (type(x).__name__, x)
+    return x
+
+
+def _nbytes(x):
+    if isinstance(x, torch.Tensor):
+        return x.numel() * x.element_size()
+    if isinstance(x, (list, tuple)):
+        return sum(_nbytes(v) for v in x)
+    if isinstance(x, dict):
+        return sum(_nbytes(v) for v in x.values())
+    return 0
+
+
+_cache = ConstantCache()
+
+
+def cached(fn, *args, **kwargs):
+    """Call a function computing constants through the shared cache.
+
+    Parameters
+    ----------
+    fn : Callable
+        Function whose output depends only on its arguments.
+
+    *args : tuple
+        Positional arguments of **fn**.
+
+    **kwargs : dict
+        Keyword arguments of **fn**.
+
+    Returns
+    -------
+    out : Any
+        Output of **fn**, which must not be modified in place.
+
+    """
+    return _cache(fn, *args, **kwargs)
+
+
+def cache_info():
+    """Get the statistics of the constant cache used by the functional API.
+
+    Returns
+    -------
+    out : CacheInfo
+        Numbers of hits and misses, maximum and current numbers of entries, and
+        maximum and current total sizes of the cached tensors in bytes.
+
+    Examples
+    --------
+    >>> diffsptk.clear_cache()
+    >>> c = diffsptk.functional.freqt(diffsptk.ramp(3), 4, 0.1)
+    >>> c = diffsptk.functional.freqt(diffsptk.ramp(3), 4, 0.1)
+    >>> diffsptk.cache_info()
+    CacheInfo(hits=1, misses=1, maxsize=128, currsize=1, maxbytes=134217728, currbytes=80)
+
+    """
+    return _cache.info()
+
+
+def clear_cache():
+    """Clear the constant cache used by the functional API and reset its
+    statistics."""
+    _cache.clear()
+
+
+def set_cache_size(maxsize=None, maxbytes=None):
+    """Set the limits of the constant cache used by the functional API. The least
+    recently used entries are discarded if the cache is full.
+
+    Parameters
+    ----------
+    maxsize : int >= 0 or None
+        Maximum number of entries. If zero, caching is disabled. If None, the
+        current limit is kept.
+
+    maxbytes : int >= 0 or None
+        Maximum total size of the cached tensors in bytes. If None, the current
+        limit is kept.
+
+    """
+    _cache.resize(maxsize, maxbytes)
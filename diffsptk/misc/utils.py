@@ -18,11 +18,9 @@ from importlib import import_module
 import math
 
 import numpy as np
-import soundfile as sf
 import torch
 from torch import nn
 import torch.nn.functional as F
-import torchaudio
 
 UNVOICED_SYMBOL = 0
 TWO_PI = math.tau
@@ -237,6 +235,389 @@ def hankel(x):
     return X
 
 
+def iterate_until_convergence(step, x, state, n_iter, convergence_threshold):
+    """Iterate a frame-wise update and stop updating the frames whose residual
+    energy has converged.
+
+    Parameters
+    ----------
+    step : Callable
+        Function that takes the input and the state of the active frames, and returns
+        the updated state and the residual energy of the frames.
+
+    x : Tensor [shape=(B, ...)]
+        Input of the frames.
+
+    state : tuple[Tensor [shape=(B, ...)]]
+        Initial state of the frames.
+
+    n_iter : int >= 0
+        Maximum number of iterations.
+
+    convergence_threshold : float >= 0
+        Convergence threshold on the relative change of the residual energy. If zero,
+        all frames are updated **n_iter** times.
+
+    Returns
+    -------
+    state : tuple[Tensor [shape=(B, ...)]]
+        Final state of the frames.
+
+    n_iter : Tensor [shape=(B,)]
+        Number of iterations of each frame.
+
+    """
+    count = torch.zeros(len(x), dtype=torch.long, device=x.device)
+    active = torch.arange(len(x), device=x.device)
+    state_active = state
+    prev_eps = None
+
+    for _ in range(n_iter):
+        state_active, eps = step(x, *state_active)
+        count[active] += 1
+
+        if convergence_threshold == 0:
+            continue
+
+        if prev_eps is not None:
+            done = (prev_eps - eps).abs() < convergence_threshold * eps.abs()
+            if done.any():
+                state = tuple(
+                    s.index_copy(0, active[done], t[done])
+                    for s, t in zip(state, state_active)
+                )
+                keep = ~done
+                active = active[keep]
+                if len(active) == 0:
+                    break
+                state_active = tuple(t[keep] for t in state_active)
+                x = x[keep]
+                eps = eps[keep]
+        prev_eps = eps
+
+    if len(active) == len(count):
+        state = state_active
+    elif 0 < len(active):
+        state = tuple(s.index_copy(0, active, t) for s, t in zip(state, state_active))
+    return state, count
+
+
+def solve_block_tridiagonal(D, L, y):
+    """Solve a symmetric positive definite block tridiagonal system of equations
+    by the block cyclic reduction, which requires :math:`O(\\log N)` sequential
+    steps.
+
+    Parameters
+    ----------
+    D : Tensor [shape=(..., N, K, K)]
+        Diagonal blocks.
+
+    L : Tensor [shape=(..., N, K, K)]
+        Subdiagonal blocks, where the n-th block couples the n-th and (n-1)-th
+        unknowns. The first block is ignored.
+
+    y : Tensor [shape=(..., N, K, R)]
+        Right-hand side.
+
+    Returns
+    -------
+    out : Tensor [shape=(..., N, K, R)]
+        Solution.
+
+    """
+    N, K = D.shape[-3:-1]
+    if N == 1:
+        return torch.linalg.solve(D, y)
+
+    def shift(x, right=True):
+        pad = (0, 0, 0, 0, 1, 0) if right else (0, 0, 0, 0, 0, 1)
+        x = x[..., :-1, :, :] if right else x[..., 1:, :, :]
+        return F.pad(x, pad)
+
+    # Append a dummy unknown to make the number of unknowns even.
+    if N % 2 == 1:
+        eye = torch.eye(K, dtype=D.dtype, device=D.device)
+        D = torch.cat((D, eye.expand(*D.shape[:-3], 1, K, K)), dim=-3)
+        L = F.pad(L, (0, 0, 0, 0, 0, 1))
+        y = F.pad(y, (0, 0, 0, 0, 0, 1))
+
+    L = torch.cat((torch.zeros_like(L[..., :1, :, :]), L[..., 1:, :, :]), dim=-3)
+    De, Do = D[..., 0::2, :, :], D[..., 1::2, :, :]
+    Le, Lo = L[..., 0::2, :, :], L[..., 1::2, :, :]
+    ye, yo = y[..., 0::2, :, :], y[..., 1::2, :, :]
+
+    # Eliminate the odd unknowns.
+    Z = torch.linalg.solve(Do, torch.cat((Lo, shift(Le, False).mT, yo), dim=-1))
+    A, B, z = torch.split(Z, [K, K, y.size(-1)], dim=-1)
+    De = De - torch.matmul(Le, shift(B)) - torch.matmul(Lo.mT, A)
+    ye = ye - torch.matmul(Le, shift(z)) - torch.matmul(Lo.mT, z)
+    Le = -torch.matmul(Le, shift(A))
+
+    # Solve the reduced system and recover the odd unknowns.
+    xe = solve_block_tridiagonal(De, Le, ye)
+    xo = z - torch.matmul(A, xe) - torch.matmul(B, shift(xe, False))
+    x = torch.stack((xe, xo), dim=-3).flatten(-4, -3)
+    return x[..., :N, :, :]
+
+
+def linear_recurrence(x, a):
+    """Compute :math:`y_n = a y_{n-1} + x_n` along the last axis in :math:`O(\\log N)`
+    vectorized steps.
+
+    Parameters
+    ----------
+    x : Tensor [shape=(..., N)]
+        Input sequence.
+
+    a : float
+        Coefficient of the recurrence.
+
+    Returns
+    -------
+    out : Tensor [shape=(..., N)]
+        Output sequence.
+
+    """
+    N = x.size(-1)
+    s = 1
+    while s < N:
+        x = torch.cat((x[..., :s], x[..., s:] + a * x[..., :-s]), dim=-1)
+        a = a * a
+        s *= 2
+    return x
+
+
+def fill_warping_matrix(A, alpha, start):
+    """Fill a frequency warping matrix using the recurrence
+    :math:`A_{i,j} = A_{i-1,j-1} + \\alpha (A_{i,j-1} - A_{i-1,j})`.
+
+    The matrix is filled row by row or column by column, whichever is shorter, and
+    each row or column is computed by a vectorized linear recurrence.
+
+    Parameters
+    ----------
+    A : Tensor [shape=(M2+1, M1+1)]
+        Matrix whose first **start** rows and first column are initial conditions.
+
+    alpha : float in (-1, 1)
+        Frequency warping factor, :math:`\\alpha`.
+
+    start : int >= 1
+        Index of the first row to be filled.
+
+    Returns
+    -------
+    out : Tensor [shape=(M2+1, M1+1)]
+        Filled matrix.
+
+    """
+    L2, L1 = A.shape
+    if L2 <= start or L1 <= 1:
+        return A
+
+    if L2 - start <= L1 - 1:
+        rows = list(A[:start])
+        for i in range(start, L2):
+            prev = rows[-1]
+            x = torch.cat((A[i, :1], prev[:-1] - alpha * prev[1:]))
+            rows.append(linear_recurrence(x, alpha))
+        return torch.stack(rows)
+
+    cols = [A[:, 0]]
+    for j in range(1, L1):
+        prev = cols[-1]
+        x = torch.cat(
+            (A[start - 1 : start, j], prev[start - 1 : -1] + alpha * prev[start:])
+        )
+        cols.append(torch.cat((A[: start - 1, j], linear_recurrence(x, -alpha))))
+    return torch.stack(cols, dim=1)
+
+
+def precompute_trigonometric_transform(
+    in_length,
+    out_length,
+    fft_length,
+    in_offset=0,
+    out_offset=0,
+    in_scale=1,
+    out_scale=1,
+    kernel="cos",
+    algorithm="auto",
+    dtype=None,
+    device=None,
+):
+    """Precompute constants of the trigonometric transform
+
+    .. math::
+        y_k = s_k \\sum_{n=0}^{N_i-1} r_n x_n
+              f\\left(\\frac{2\\pi}{N}(n + a)(k + b)\\right),
+
+    where :math:`f` is cos, sin, or cas.
+
+    Parameters
+    ----------
+    in_length : int <= N
+        Input length, :math:`N_i`.
+
+    out_length : int <= N
+        Output length, :math:`N_o`.
+
+    fft_length : int
+        Period of the kernel, :math:`N`.
+
+    in_offset : float
+        Offset of input index, :math:`a`.
+
+    out_offset : float
+        Offset of output index, :math:`b`.
+
+    in_scale : float or Tensor [shape=(N_i,)]
+        Input scale, :math:`r`.
+
+    out_scale : float or Tensor [shape=(N_o,)]
+        Output scale, :math:`s`.
+
+    kernel : ['cos', 'sin', 'cas']
+        Kernel function, :math:`f`.
+
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'dense', the transform matrix is computed. If 'fft', the
+        twiddle factors for the :math:`N`-point FFT are computed. If 'auto', the
+        FFT-based algorithm is used for long input or output.
+
+    dtype : torch.dtype or None
+        Data type of the constants.
+
+    device : torch.device or None
+        Device of the constants.
+
+    Returns
+    -------
+    W : Tensor [shape=(N_i, N_o)] or None
+        Transform matrix.
+
+    u : Tensor [shape=(N_i, 2)] or None
+        Pre-twiddle factors represented as real tensor.
+
+    v : Tensor [shape=(N_o, 2)] or None
+        Post-twiddle factors represented as real tensor.
+
+    fft_length : int or None
+        Number of FFT points.
+
+    """
+    if algorithm == "auto":
+        # The crossover point is roughly estimated on CPU.
+        algorithm = "fft" if 512 <= max(in_length, out_length) else "dense"
+
+    w = 2 * torch.pi / fft_length
+    n = torch.arange(in_length, dtype=torch.double, device=device)
+    k = torch.arange(out_length, dtype=torch.double, device=device) + out_offset
+    r = torch.as_tensor(in_scale, dtype=torch.double, device=device)
+    s = torch.as_tensor(out_scale, dtype=torch.double, device=device)
+
+    if algorithm == "dense":
+        theta = (w * (n + in_offset)).unsqueeze(1) * k.unsqueeze(0)
+        if kernel == "cos":
+            W = torch.cos(theta)
+        elif kernel == "sin":
+            W = torch.sin(theta)
+        elif kernel == "cas":
+            W = cas(theta)
+        else:
+            raise ValueError(f"kernel {kernel} is not supported.")
+        W = r.unsqueeze(-1) * W * s
+        return to(W, dtype=dtype), None, None, None
+    elif algorithm == "fft":
+        assert in_length <= fft_length
+        assert out_length <= fft_length
+        u = r * torch.exp(-1j * (w * out_offset) * n)
+        v = s * torch.exp(-1j * (w * in_offset) * k)
+        # The real part of the product is taken in the end. Note that
+        # Re[j exp(-jx)] = sin(x).
+        if kernel == "cos":
+            pass
+        elif kernel == "sin":
+            v = v * 1j
+        elif kernel == "cas":
+            v = v * (1 + 1j)
+        else:
+            raise ValueError(f"kernel {kernel} is not supported.")
+        u = to(torch.view_as_real(u), dtype=dtype)
+        v = to(torch.view_as_real(v), dtype=dtype)
+        return None, u, v, fft_length
+    else:
+        raise ValueError(f"algorithm {algorithm} is not supported.")
+
+
+def register_trigonometric_transform(module, W, u, v):
+    """Register the constants of the trigonometric transform as buffers of a module.
+
+    Only the transform matrix is saved in the state dict. The twiddle factors are
+    not saved, and the transform matrix saved by the dense algorithm is ignored
+    when the FFT-based algorithm is used, so that the state dicts are compatible
+    between the algorithms.
+
+    Parameters
+    ----------
+    module : nn.Module
+        Module to which the buffers are registered.
+
+    W : Tensor [shape=(N_i, N_o)] or None
+        Transform matrix.
+
+    u : Tensor [shape=(N_i, 2)] or None
+        Pre-twiddle factors.
+
+    v : Tensor [shape=(N_o, 2)] or None
+        Post-twiddle factors.
+
+    """
+    module.register_buffer("W", W)
+    module.register_buffer("u", u, persistent=False)
+    module.register_buffer("v", v, persistent=False)
+    if W is None:
+        module._register_load_state_dict_pre_hook(_ignore_transform_matrix)
+
+
+def _ignore_transform_matrix(state_dict, prefix, *args):
+    state_dict.pop(prefix + "W", None)
+
+
+def trigonometric_transform(x, W, u, v, fft_length):
+    """Apply trigonometric transform to input.
+
+    Parameters
+    ----------
+    x : Tensor [shape=(..., N_i)]
+        Input.
+
+    W : Tensor [shape=(N_i, N_o)] or None
+        Transform matrix.
+
+    u : Tensor [shape=(N_i, 2)] or None
+        Pre-twiddle factors.
+
+    v : Tensor [shape=(N_o, 2)] or None
+        Post-twiddle factors.
+
+    fft_length : int or None
+        Number of FFT points.
+
+    Returns
+    -------
+    out : Tensor [shape=(..., N_o)]
+        Output.
+
+    """
+    if W is not None:
+        return torch.matmul(x, W)
+    u = torch.view_as_complex(u)
+    v = torch.view_as_complex(v)
+    X = torch.fft.fft(x * u, n=fft_length)[..., : v.size(0)]
+    return (X * v).real
+
+
 def vander(x):
     X = torch.linalg.vander(x).transpose(-2, -1)
     return X
@@ -265,7 +646,8 @@ def iir(x, b=None, a=None):
         a = F.pad(a, (0, diff))
     elif diff < 0:
         b = F.pad(b, (0, -diff))
-    y = torchaudio.functional.lfilter(x, a, b, clamp=False, batching=True)
+    lfilter = delayed_import("torchaudio.functional", "lfilter")
+    y = lfilter(x, a, b, clamp=False, batching=True)
     return y
 
 
@@ -303,6 +685,203 @@ def deconv1d(x, weight):
     return y
 
 
+def conv1d(x, weight, stride=1, algorithm="auto"):
+    """Apply :func:`torch.nn.functional.conv1d` without padding, where the FFT-based
+    overlap-save method can be used instead of the direct convolution.
+
+    Parameters
+    ----------
+    x : Tensor [shape=(B, C, T)]
+        Input signal.
+
+    weight : Tensor [shape=(C', C, L)]
+        Filter coefficients applied as a correlation.
+
+    stride : int >= 1
+        Stride of the convolution.
+
+    algorithm : ['auto', 'direct', 'fft']
+        Algorithm of the convolution. If 'auto', the faster one is selected based on
+        the estimated number of operations.
+
+    Returns
+    -------
+    out : Tensor [shape=(B, C', (T-L)/S+1)]
+        Output signal.
+
+    """
+    if algorithm == "auto":
+        algorithm = _select_conv1d_algorithm(x.shape, weight.shape, stride)
+
+    if algorithm == "direct":
+        return F.conv1d(x, weight, stride=stride)
+    elif algorithm == "fft":
+        fft_length = _get_conv1d_fft_length(x.size(-1), weight.size(-1))
+        return _fft_conv1d(x, weight, fft_length)[..., ::stride]
+    raise ValueError(f"algorithm {algorithm} is not supported.")
+
+
+def _fft_conv1d(x, weight, fft_length):
+    N = fft_length
+    L = weight.size(-1)
+    T = x.size(-1) - L + 1
+    hop = N - L + 1
+    n_block = (T + hop - 1) // hop
+
+    # Each block of N samples yields N-L+1 outputs free from circular aliasing.
+    x = F.pad(x, (0, n_block * hop + L - 1 - x.size(-1)))
+    x = x.unfold(-1, N, hop)  # (B, C, n_block, N)
+    X = torch.fft.rfft(x, n=N)
+    W = torch.fft.rfft(weight.flip(-1), n=N)  # (C', C, N/2+1)
+    Y = torch.einsum("bcnk,dck->bdnk", X, W)
+    y = torch.fft.irfft(Y, n=N)[..., L - 1 :]
+    y = y.flatten(-2)[..., :T]
+    return y
+
+
+def _get_conv1d_fft_length(in_length, filter_length):
+    # Use four times the filter length, which balances the cost per block and the
+    # number of valid outputs per block, without exceeding the input length.
+    L = filter_length
+    return next_power_of_two(max(2, min(4 * L, in_length)))
+
+
+def _select_conv1d_algorithm(x_shape, weight_shape, stride):
+    B, C, T = x_shape
+    D, _, L = weight_shape
+    T_out = T - L + 1
+    if T_out <= 0:
+        return "direct"
+    N = _get_conv1d_fft_length(T, L)
+    n_block = -(-T_out // (N - L + 1))
+    direct_cost = B * C * D * L * -(-T_out // stride)
+    fft_cost = n_block * B * ((C + D) * N * math.log2(N) + 2 * C * D * N)
+    return "fft" if fft_cost < direct_cost else "direct"
+
+
+def get_band_blocks(H, block_size=16):
+    """Find the rows of the non-zero elements of each block of the columns of a
+    banded matrix, e.g., filter banks.
+
+    Parameters
+    ----------
+    H : Tensor [shape=(K, C)]
+        Banded matrix.
+
+    block_size : int >= 1
+        Number of columns in a block.
+
+    Returns
+    -------
+    out : list[tuple[int, int, int, int]]
+        Start and end rows and start and end columns of each block.
+
+    """
+    assert 1 <= block_size
+
+    C = H.size(-1)
+    blocks = []
+    for c0 in range(0, C, block_size):
+        c1 = min(c0 + block_size, C)
+        rows = torch.nonzero(H[:, c0:c1].ne(0).any(-1)).view(-1)
+        r0, r1 = (0, 0) if len(rows) == 0 else (int(rows[0]), int(rows[-1]) + 1)
+        blocks.append((r0, r1, c0, c1))
+    return blocks
+
+
+def banded_matmul(x, H, blocks=None, algorithm="auto"):
+    """Multiply a banded matrix from the right.
+
+    Parameters
+    ----------
+    x : Tensor [shape=(..., K)]
+        Input.
+
+    H : Tensor [shape=(K, C)]
+        Banded matrix.
+
+    blocks : list[tuple[int, int, int, int]] or None
+        Output of :func:`get_band_blocks`. If None, the dense matrix is used.
+
+    algorithm : ['auto', 'dense', 'banded']
+        Algorithm of the multiplication. `banded` multiplies only the blocks of the
+        non-zero elements. If `auto`, the faster one is selected by a rough cost
+        model including the overhead of each block.
+
+    Returns
+    -------
+    out : Tensor [shape=(..., C)]
+        Output.
+
+    """
+    if blocks is None or algorithm == "dense":
+        return torch.matmul(x, H)
+    if algorithm == "auto":
+        algorithm = _select_matmul_algorithm(x.shape, H.shape, blocks)
+        if algorithm == "dense":
+            return torch.matmul(x, H)
+    elif algorithm != "banded":
+        raise ValueError(f"algorithm {algorithm} is not supported.")
+    y = [torch.matmul(x[..., r0:r1], H[r0:r1, c0:c1]) for r0, r1, c0, c1 in blocks]
+    return torch.cat(y, dim=-1)
+
+
+def _select_matmul_algorithm(x_shape, H_shape, blocks):
+    # The overhead of a block is roughly equal to 5e5 multiply-adds on CPU.
+    n_row = np.prod(x_shape[:-1])
+    area = sum((r1 - r0) * (c1 - c0) for r0, r1, c0, c1 in blocks)
+    saved_cost = n_row * (H_shape[0] * H_shape[1] - area)
+    return "banded" if 5e5 * len(blocks) < saved_cost else "dense"
+
+
+def time_varying_fir(x, h, frame_period):
+    """Apply a time-varying FIR filter whose coefficients are linearly interpolated
+    between frames. Since the output of the filter is linear in its coefficients,
+    each frame is filtered by the filters at the current and the next frames, and
+    the two outputs are crossfaded. The sample-wise coefficients are never
+    materialized.
+
+    Parameters
+    ----------
+    x : Tensor [shape=(..., T+L-1)]
+        Padded input signal.
+
+    h : Tensor [shape=(..., T/P, L) or (..., T/P+1, L)]
+        Frame-wise filter coefficients applied as a correlation. The last frame is
+        used only for the interpolation if given.
+
+    frame_period : int >= 1
+        Frame period, :math:`P`.
+
+    Returns
+    -------
+    out : Tensor [shape=(..., T)]
+        Output signal.
+
+    """
+    P = frame_period
+    L = h.size(-1)
+    N = (x.size(-1) - L + 1) // P
+    h = torch.cat((h, h[..., -1:, :]), dim=-2)
+    h = torch.stack((h[..., :N, :], h[..., 1 : N + 1, :]), dim=-2)
+
+    batch_size = torch.broadcast_shapes(x.shape[:-1], h.shape[:-3])
+    x = x.expand(batch_size + x.shape[-1:])
+    h = h.expand(batch_size + h.shape[-3:])
+
+    # Filter the frames by grouped convolution, where each group is a frame.
+    x = x[..., : N * P + L - 1].unfold(-1, P + L - 1, P)  # (..., N, P+L-1)
+    x = x.reshape(1, -1, P + L - 1)
+    w = h.reshape(-1, 1, L)
+    y = F.conv1d(x, w, groups=x.size(1))
+    y = y.view(batch_size + (N, 2, P))
+
+    w = torch.arange(P, dtype=y.dtype, device=y.device) / P
+    y = torch.lerp(y[..., 0, :], y[..., 1, :], w)
+    y = y.flatten(-2)
+    return y
+
+
 def check_size(x, y, cause):
     assert x == y, f"Unexpected {cause} (input {x} vs target {y})."
 
@@ -342,7 +921,8 @@ def read(filename, double=False, device=None, **kwargs):
     16000
 
     """
-    x, sr = sf.read(filename, **kwargs)
+    sf_read = delayed_import("soundfile", "read")
+    x, sr = sf_read(filename, **kwargs)
     if double:
         x = torch.DoubleTensor(x)
     else:
@@ -377,4 +957,5 @@ def write(filename, x, sr, **kwargs):
 
     """
     x = x.cpu().numpy() if torch.is_tensor(x) else x
-    sf.write(filename, x, sr, **kwargs)
+    sf_write = delayed_import("soundfile", "write")
+    sf_write(filename, x, sr, **kwargs)
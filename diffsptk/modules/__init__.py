@@ -1,135 +1,252 @@
-from .acorr import Autocorrelation
-from .acr2csm import AutocorrelationToCompositeSinusoidalModelCoefficients
-from .alaw import ALawCompression
-from .ap import Aperiodicity
-from .b2mc import MLSADigitalFilterCoefficientsToMelCepstrum
-from .c2acr import CepstrumToAutocorrelation
-from .c2mpir import CepstrumToMinimumPhaseImpulseResponse
-from .c2ndps import CepstrumToNegativeDerivativeOfPhaseSpectrum
-from .cdist import CepstralDistance
-from .chroma import ChromaFilterBankAnalysis
-from .cqt import ConstantQTransform
-from .cqt import ConstantQTransform as CQT
-from .csm2acr import CompositeSinusoidalModelCoefficientsToAutocorrelation
-from .dct import DiscreteCosineTransform
-from .dct import DiscreteCosineTransform as DCT
-from .decimate import Decimation
-from .delay import Delay
-from .delta import Delta
-from .dequantize import InverseUniformQuantization
-from .df2 import SecondOrderDigitalFilter
-from .dfs import InfiniteImpulseResponseDigitalFilter
-from .dfs import InfiniteImpulseResponseDigitalFilter as IIR
-from .dht import DiscreteHartleyTransform
-from .dht import DiscreteHartleyTransform as DHT
-from .drc import DynamicRangeCompression
-from .drc import DynamicRangeCompression as DRC
-from .dst import DiscreteSineTransform
-from .dst import DiscreteSineTransform as DST
-from .entropy import Entropy
-from .excite import ExcitationGeneration
-from .fbank import MelFilterBankAnalysis
-from .fbank import MelFilterBankAnalysis as FBANK
-from .fftcep import CepstralAnalysis
-from .frame import Frame
-from .freqt import FrequencyTransform
-from .freqt2 import SecondOrderAllPassFrequencyTransform
-from .gmm import GaussianMixtureModeling
-from .gmm import GaussianMixtureModeling as GMM
-from .gnorm import GeneralizedCepstrumGainNormalization
-from .grpdelay import GroupDelay
-from .histogram import Histogram
-from .ialaw import ALawExpansion
-from .icqt import InverseConstantQTransform
-from .icqt import InverseConstantQTransform as ICQT
-from .idct import InverseDiscreteCosineTransform
-from .idct import InverseDiscreteCosineTransform as IDCT
-from .idht import InverseDiscreteHartleyTransform
-from .idht import InverseDiscreteHartleyTransform as IDHT
-from .idst import InverseDiscreteSineTransform
-from .idst import InverseDiscreteSineTransform as IDST
-from .ifreqt2 import SecondOrderAllPassInverseFrequencyTransform
-from .ignorm import GeneralizedCepstrumInverseGainNormalization
-from .imdct import InverseModifiedDiscreteCosineTransform
-from .imdct import InverseModifiedDiscreteCosineTransform as IMDCT
-from .imdst import InverseModifiedDiscreteSineTransform
-from .imdst import InverseModifiedDiscreteSineTransform as IMDST
-from .imglsadf import PseudoInverseMGLSADigitalFilter
-from .imglsadf import PseudoInverseMGLSADigitalFilter as IMLSA
-from .imsvq import InverseMultiStageVectorQuantization
-from .interpolate import Interpolation
-from .ipnorm import MelCepstrumInversePowerNormalization
-from .ipqmf import InversePseudoQuadratureMirrorFilterBanks
-from .ipqmf import InversePseudoQuadratureMirrorFilterBanks as IPQMF
-from .istft import InverseShortTimeFourierTransform
-from .istft import InverseShortTimeFourierTransform as ISTFT
-from .iulaw import MuLawExpansion
-from .ivq import InverseVectorQuantization
-from .lar2par import LogAreaRatioToParcorCoefficients
-from .lbg import LindeBuzoGrayAlgorithm
-from .lbg import LindeBuzoGrayAlgorithm as LBG
-from .levdur import LevinsonDurbin
-from .linear_intpl import LinearInterpolation
-from .lpc import LinearPredictiveCodingAnalysis
-from .lpc import LinearPredictiveCodingAnalysis as LPC
-from .lpc2lsp import LinearPredictiveCoefficientsToLineSpectralPairs
-from .lpc2par import LinearPredictiveCoefficientsToParcorCoefficients
-from .lpccheck import LinearPredictiveCoefficientsStabilityCheck
-from .lsp2lpc import LineSpectralPairsToLinearPredictiveCoefficients
-from .lsp2sp import LineSpectralPairsToSpectrum
-from .lspcheck import LineSpectralPairsStabilityCheck
-from .magic_intpl import MagicNumberInterpolation
-from .mc2b import MelCepstrumToMLSADigitalFilterCoefficients
-from .mcpf import MelCepstrumPostfiltering
-from .mdct import ModifiedDiscreteCosineTransform
-from .mdct import ModifiedDiscreteCosineTransform as MDCT
-from .mdst import ModifiedDiscreteSineTransform
-from .mdst import ModifiedDiscreteSineTransform as MDST
-from .mfcc import MelFrequencyCepstralCoefficientsAnalysis
-from .mfcc import MelFrequencyCepstralCoefficientsAnalysis as MFCC
-from .mgc2mgc import MelGeneralizedCepstrumToMelGeneralizedCepstrum
-from .mgc2sp import MelGeneralizedCepstrumToSpectrum
-from .mgcep import MelGeneralizedCepstralAnalysis
-from .mgcep import MelGeneralizedCepstralAnalysis as MelCepstralAnalysis
-from .mglsadf import PseudoMGLSADigitalFilter
-from .mglsadf import PseudoMGLSADigitalFilter as MLSA
-from .mlpg import MaximumLikelihoodParameterGeneration
-from .mlpg import MaximumLikelihoodParameterGeneration as MLPG
-from .mlsacheck import MLSADigitalFilterStabilityCheck
-from .mpir2c import MinimumPhaseImpulseResponseToCepstrum
-from .msvq import MultiStageVectorQuantization
-from .ndps2c import NegativeDerivativeOfPhaseSpectrumToCepstrum
-from .norm0 import AllPoleToAllZeroDigitalFilterCoefficients
-from .par2lar import ParcorCoefficientsToLogAreaRatio
-from .par2lpc import ParcorCoefficientsToLinearPredictiveCoefficients
-from .pca import PrincipalComponentAnalysis
-from .pca import PrincipalComponentAnalysis as PCA
-from .phase import Phase
-from .pitch import Pitch
-from .plp import PerceptualLinearPredictiveCoefficientsAnalysis
-from .plp import PerceptualLinearPredictiveCoefficientsAnalysis as PLP
-from .pnorm import MelCepstrumPowerNormalization
-from .pol_root import RootsToPolynomial
-from .poledf import AllPoleDigitalFilter
-from .pqmf import PseudoQuadratureMirrorFilterBanks
-from .pqmf import PseudoQuadratureMirrorFilterBanks as PQMF
-from .quantize import UniformQuantization
-from .rlevdur import ReverseLevinsonDurbin
-from .rmse import RootMeanSquareError
-from .rmse import RootMeanSquareError as RMSE
-from .root_pol import PolynomialToRoots
-from .smcep import SecondOrderAllPassMelCepstralAnalysis
-from .snr import SignalToNoiseRatio
-from .snr import SignalToNoiseRatio as SNR
-from .spec import Spectrum
-from .ssim import StructuralSimilarityIndex
-from .ssim import StructuralSimilarityIndex as SSIM
-from .stft import ShortTimeFourierTransform
-from .stft import ShortTimeFourierTransform as STFT
-from .ulaw import MuLawCompression
-from .unframe import Unframe
-from .vq import VectorQuantization
-from .window import Window
-from .yingram import Yingram
-from .zcross import ZeroCrossingAnalysis
-from .zerodf import AllZeroDigitalFilter
+# Public names are loaded on first access (PEP 562) so that importing the package
+# does not load all the modules and their optional dependencies.
+
+from importlib import import_module
+
+_name_to_module = {
+    "Autocorrelation": ("acorr", "Autocorrelation"),
+    "AutocorrelationToCompositeSinusoidalModelCoefficients": (
+        "acr2csm",
+        "AutocorrelationToCompositeSinusoidalModelCoefficients",
+    ),
+    "ALawCompression": ("alaw", "ALawCompression"),
+    "Aperiodicity": ("ap", "Aperiodicity"),
+    "MLSADigitalFilterCoefficientsToMelCepstrum": (
+        "b2mc",
+        "MLSADigitalFilterCoefficientsToMelCepstrum",
+    ),
+    "CepstrumToAutocorrelation": ("c2acr", "CepstrumToAutocorrelation"),
+    "CepstrumToMinimumPhaseImpulseResponse": (
+        "c2mpir",
+        "CepstrumToMinimumPhaseImpulseResponse",
+    ),
+    "CepstrumToNegativeDerivativeOfPhaseSpectrum": (
+        "c2ndps",
+        "CepstrumToNegativeDerivativeOfPhaseSpectrum",
+    ),
+    "CepstralDistance": ("cdist", "CepstralDistance"),
+    "ChromaFilterBankAnalysis": ("chroma", "ChromaFilterBankAnalysis"),
+    "ConstantQTransform": ("cqt", "ConstantQTransform"),
+    "CQT": ("cqt", "ConstantQTransform"),
+    "CompositeSinusoidalModelCoefficientsToAutocorrelation": (
+        "csm2acr",
+        "CompositeSinusoidalModelCoefficientsToAutocorrelation",
+    ),
+    "DiscreteCosineTransform": ("dct", "DiscreteCosineTransform"),
+    "DCT": ("dct", "DiscreteCosineTransform"),
+    "Decimation": ("decimate", "Decimation"),
+    "Delay": ("delay", "Delay"),
+    "Delta": ("delta", "Delta"),
+    "InverseUniformQuantization": ("dequantize", "InverseUniformQuantization"),
+    "SecondOrderDigitalFilter": ("df2", "SecondOrderDigitalFilter"),
+    "InfiniteImpulseResponseDigitalFilter": (
+        "dfs",
+        "InfiniteImpulseResponseDigitalFilter",
+    ),
+    "IIR": ("dfs", "InfiniteImpulseResponseDigitalFilter"),
+    "DiscreteHartleyTransform": ("dht", "DiscreteHartleyTransform"),
+    "DHT": ("dht", "DiscreteHartleyTransform"),
+    "DynamicRangeCompression": ("drc", "DynamicRangeCompression"),
+    "DRC": ("drc", "DynamicRangeCompression"),
+    "DiscreteSineTransform": ("dst", "DiscreteSineTransform"),
+    "DST": ("dst", "DiscreteSineTransform"),
+    "Entropy": ("entropy", "Entropy"),
+    "ExcitationGeneration": ("excite", "ExcitationGeneration"),
+    "MelFilterBankAnalysis": ("fbank", "MelFilterBankAnalysis"),
+    "FBANK": ("fbank", "MelFilterBankAnalysis"),
+    "CepstralAnalysis": ("fftcep", "CepstralAnalysis"),
+    "Frame": ("frame", "Frame"),
+    "FrequencyTransform": ("freqt", "FrequencyTransform"),
+    "SecondOrderAllPassFrequencyTransform": (
+        "freqt2",
+        "SecondOrderAllPassFrequencyTransform",
+    ),
+    "GaussianMixtureModeling": ("gmm", "GaussianMixtureModeling"),
+    "GMM": ("gmm", "GaussianMixtureModeling"),
+    "GeneralizedCepstrumGainNormalization": (
+        "gnorm",
+        "GeneralizedCepstrumGainNormalization",
+    ),
+    "GroupDelay": ("grpdelay", "GroupDelay"),
+    "Histogram": ("histogram", "Histogram"),
+    "ALawExpansion": ("ialaw", "ALawExpansion"),
+    "InverseConstantQTransform": ("icqt", "InverseConstantQTransform"),
+    "ICQT": ("icqt", "InverseConstantQTransform"),
+    "InverseDiscreteCosineTransform": ("idct", "InverseDiscreteCosineTransform"),
+    "IDCT": ("idct", "InverseDiscreteCosineTransform"),
+    "InverseDiscreteHartleyTransform": ("idht", "InverseDiscreteHartleyTransform"),
+    "IDHT": ("idht", "InverseDiscreteHartleyTransform"),
+    "InverseDiscreteSineTransform": ("idst", "InverseDiscreteSineTransform"),
+    "IDST": ("idst", "InverseDiscreteSineTransform"),
+    "SecondOrderAllPassInverseFrequencyTransform": (
+        "ifreqt2",
+        "SecondOrderAllPassInverseFrequencyTransform",
+    ),
+    "GeneralizedCepstrumInverseGainNormalization": (
+        "ignorm",
+        "GeneralizedCepstrumInverseGainNormalization",
+    ),
+    "InverseModifiedDiscreteCosineTransform": (
+        "imdct",
+        "InverseModifiedDiscreteCosineTransform",
+    ),
+    "IMDCT": ("imdct", "InverseModifiedDiscreteCosineTransform"),
+    "InverseModifiedDiscreteSineTransform": (
+        "imdst",
+        "InverseModifiedDiscreteSineTransform",
+    ),
+    "IMDST": ("imdst", "InverseModifiedDiscreteSineTransform"),
+    "PseudoInverseMGLSADigitalFilter": ("imglsadf", "PseudoInverseMGLSADigitalFilter"),
+    "IMLSA": ("imglsadf", "PseudoInverseMGLSADigitalFilter"),
+    "InverseMultiStageVectorQuantization": (
+        "imsvq",
+        "InverseMultiStageVectorQuantization",
+    ),
+    "Interpolation": ("interpolate", "Interpolation"),
+    "MelCepstrumInversePowerNormalization": (
+        "ipnorm",
+        "MelCepstrumInversePowerNormalization",
+    ),
+    "InversePseudoQuadratureMirrorFilterBanks": (
+        "ipqmf",
+        "InversePseudoQuadratureMirrorFilterBanks",
+    ),
+    "IPQMF": ("ipqmf", "InversePseudoQuadratureMirrorFilterBanks"),
+    "InverseShortTimeFourierTransform": ("istft", "InverseShortTimeFourierTransform"),
+    "ISTFT": ("istft", "InverseShortTimeFourierTransform"),
+    "MuLawExpansion": ("iulaw", "MuLawExpansion"),
+    "InverseVectorQuantization": ("ivq", "InverseVectorQuantization"),
+    "LogAreaRatioToParcorCoefficients": ("lar2par", "LogAreaRatioToParcorCoefficients"),
+    "LindeBuzoGrayAlgorithm": ("lbg", "LindeBuzoGrayAlgorithm"),
+    "LBG": ("lbg", "LindeBuzoGrayAlgorithm"),
+    "LevinsonDurbin": ("levdur", "LevinsonDurbin"),
+    "LinearInterpolation": ("linear_intpl", "LinearInterpolation"),
+    "LinearPredictiveCodingAnalysis": ("lpc", "LinearPredictiveCodingAnalysis"),
+    "LPC": ("lpc", "LinearPredictiveCodingAnalysis"),
+    "LinearPredictiveCoefficientsToLineSpectralPairs": (
+        "lpc2lsp",
+        "LinearPredictiveCoefficientsToLineSpectralPairs",
+    ),
+    "LinearPredictiveCoefficientsToParcorCoefficients": (
+        "lpc2par",
+        "LinearPredictiveCoefficientsToParcorCoefficients",
+    ),
+    "LinearPredictiveCoefficientsStabilityCheck": (
+        "lpccheck",
+        "LinearPredictiveCoefficientsStabilityCheck",
+    ),
+    "LineSpectralPairsToLinearPredictiveCoefficients": (
+        "lsp2lpc",
+        "LineSpectralPairsToLinearPredictiveCoefficients",
+    ),
+    "LineSpectralPairsToSpectrum": ("lsp2sp", "LineSpectralPairsToSpectrum"),
+    "LineSpectralPairsStabilityCheck": ("lspcheck", "LineSpectralPairsStabilityCheck"),
+    "MagicNumberInterpolation": ("magic_intpl", "MagicNumberInterpolation"),
+    "MelCepstrumToMLSADigitalFilterCoefficients": (
+        "mc2b",
+        "MelCepstrumToMLSADigitalFilterCoefficients",
+    ),
+    "MelCepstrumPostfiltering": ("mcpf", "MelCepstrumPostfiltering"),
+    "ModifiedDiscreteCosineTransform": ("mdct", "ModifiedDiscreteCosineTransform"),
+    "MDCT": ("mdct", "ModifiedDiscreteCosineTransform"),
+    "ModifiedDiscreteSineTransform": ("mdst", "ModifiedDiscreteSineTransform"),
+    "MDST": ("mdst", "ModifiedDiscreteSineTransform"),
+    "MelFrequencyCepstralCoefficientsAnalysis": (
+        "mfcc",
+        "MelFrequencyCepstralCoefficientsAnalysis",
+    ),
+    "MFCC": ("mfcc", "MelFrequencyCepstralCoefficientsAnalysis"),
+    "MelGeneralizedCepstrumToMelGeneralizedCepstrum": (
+        "mgc2mgc",
+        "MelGeneralizedCepstrumToMelGeneralizedCepstrum",
+    ),
+    "MelGeneralizedCepstrumToSpectrum": ("mgc2sp", "MelGeneralizedCepstrumToSpectrum"),
+    "MelGeneralizedCepstralAnalysis": ("mgcep", "MelGeneralizedCepstralAnalysis"),
+    "MelCepstralAnalysis": ("mgcep", "MelGeneralizedCepstralAnalysis"),
+    "PseudoMGLSADigitalFilter": ("mglsadf", "PseudoMGLSADigitalFilter"),
+    "MLSA": ("mglsadf", "PseudoMGLSADigitalFilter"),
+    "MaximumLikelihoodParameterGeneration": (
+        "mlpg",
+        "MaximumLikelihoodParameterGeneration",
+    ),
+    "MLPG": ("mlpg", "MaximumLikelihoodParameterGeneration"),
+    "MLSADigitalFilterStabilityCheck": ("mlsacheck", "MLSADigitalFilterStabilityCheck"),
+    "MinimumPhaseImpulseResponseToCepstrum": (
+        "mpir2c",
+        "MinimumPhaseImpulseResponseToCepstrum",
+    ),
+    "MultiStageVectorQuantization": ("msvq", "MultiStageVectorQuantization"),
+    "NegativeDerivativeOfPhaseSpectrumToCepstrum": (
+        "ndps2c",
+        "NegativeDerivativeOfPhaseSpectrumToCepstrum",
+    ),
+    "AllPoleToAllZeroDigitalFilterCoefficients": (
+        "norm0",
+        "AllPoleToAllZeroDigitalFilterCoefficients",
+    ),
+    "ParcorCoefficientsToLogAreaRatio": ("par2lar", "ParcorCoefficientsToLogAreaRatio"),
+    "ParcorCoefficientsToLinearPredictiveCoefficients": (
+        "par2lpc",
+        "ParcorCoefficientsToLinearPredictiveCoefficients",
+    ),
+    "PrincipalComponentAnalysis": ("pca", "PrincipalComponentAnalysis"),
+    "PCA": ("pca", "PrincipalComponentAnalysis"),
+    "Phase": ("phase", "Phase"),
+    "Pitch": ("pitch", "Pitch"),
+    "PerceptualLinearPredictiveCoefficientsAnalysis": (
+        "plp",
+        "PerceptualLinearPredictiveCoefficientsAnalysis",
+    ),
+    "PLP": ("plp", "PerceptualLinearPredictiveCoefficientsAnalysis"),
+    "MelCepstrumPowerNormalization": ("pnorm", "MelCepstrumPowerNormalization"),
+    "RootsToPolynomial": ("pol_root", "RootsToPolynomial"),
+    "AllPoleDigitalFilter": ("poledf", "AllPoleDigitalFilter"),
+    "PseudoQuadratureMirrorFilterBanks": ("pqmf", "PseudoQuadratureMirrorFilterBanks"),
+    "PQMF": ("pqmf", "PseudoQuadratureMirrorFilterBanks"),
+    "UniformQuantization": ("quantize", "UniformQuantization"),
+    "ReverseLevinsonDurbin": ("rlevdur", "ReverseLevinsonDurbin"),
+    "RootMeanSquareError": ("rmse", "RootMeanSquareError"),
+    "RMSE": ("rmse", "RootMeanSquareError"),
+    "PolynomialToRoots": ("root_pol", "PolynomialToRoots"),
+    "SecondOrderAllPassMelCepstralAnalysis": (
+        "smcep",
+        "SecondOrderAllPassMelCepstralAnalysis",
+    ),
+    "SignalToNoiseRatio": ("snr", "SignalToNoiseRatio"),
+    "SNR": ("snr", "SignalToNoiseRatio"),
+    "Spectrum": ("spec", "Spectrum"),
+    "StructuralSimilarityIndex": ("ssim", "StructuralSimilarityIndex"),
+    "SSIM": ("ssim", "StructuralSimilarityIndex"),
+    "ShortTimeFourierTransform": ("stft", "ShortTimeFourierTransform"),
+    "STFT": ("stft", "ShortTimeFourierTransform"),
+    "MuLawCompression": ("ulaw", "MuLawCompression"),
+    "Unframe": ("unframe", "Unframe"),
+    "VectorQuantization": ("vq", "VectorQuantization"),
+    "Window": ("window", "Window"),
+    "Yingram": ("yingram", "Yingram"),
+    "ZeroCrossingAnalysis": ("zcross", "ZeroCrossingAnalysis"),
+    "AllZeroDigitalFilter": ("zerodf", "AllZeroDigitalFilter"),
+}
+
+__all__ = list(_name_to_module)
+
+
+def __getattr__(name):
+    if name in _name_to_module:
+        module_name, attr_name = _name_to_module[name]
+        value = getattr(import_module(f".{module_name}", __name__), attr_name)
+    else:
+        try:
+            value = import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
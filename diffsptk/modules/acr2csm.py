@@ -19,6 +19,7 @@ import torch
 from torch import nn
 import torch.nn.functional as F
 
+from ..misc.cache import cached
 from ..misc.utils import check_size
 from ..misc.utils import hankel
 from ..misc.utils import to
@@ -93,8 +94,11 @@ class AutocorrelationToCompositeSinusoidalModelCoefficients(nn.Module):
 
     @staticmethod
     def _func(r):
-        C = AutocorrelationToCompositeSinusoidalModelCoefficients._precompute(
-            r.size(-1) - 1, dtype=r.dtype, device=r.device
+        C = cached(
+            AutocorrelationToCompositeSinusoidalModelCoefficients._precompute,
+            r.size(-1) - 1,
+            dtype=r.dtype,
+            device=r.device,
         )
         return AutocorrelationToCompositeSinusoidalModelCoefficients._forward(r, C)
 
@@ -164,7 +164,7 @@ class AperiodicityExtractionByTandem(nn.Module):
         assert self.n_band <= fft_length // 2
 
         self.default_f0 = 150
-        self.n_trial = 10
+        self.eps = eps
 
         self.cutoff_list = [sample_rate / 2**i for i in range(2, self.n_band + 1)]
         self.cutoff_list.append(self.cutoff_list[-1])
@@ -187,8 +187,6 @@ class AperiodicityExtractionByTandem(nn.Module):
         self.segment_length = [
             int(i * window_length_ms / 500 + 1.5) for i in self.cutoff_list
         ]
-        ramp = torch.arange(-1, self.segment_length[0] + 1).view(1, 1, -1)
-        self.register_buffer("ramp", ramp)
         self.register_buffer("eye", torch.eye(6) * eps)
 
         hHP = self._qmf_high()
@@ -203,6 +201,7 @@ class AperiodicityExtractionByTandem(nn.Module):
             window[i, :s] = np.hanning(s + 2)[1:-1]
         self.register_buffer("window", numpy_to_torch(window))
         self.register_buffer("window_sqrt", self.window.sqrt())
+        self._register_load_state_dict_pre_hook(_ignore_ramp)
 
     def forward(self, x, f0):
         f0 = f0.detach().clone()
@@ -213,7 +212,8 @@ class AperiodicityExtractionByTandem(nn.Module):
             self.frame_period / self.sample_rate
         )
 
-        bap = []
+        # Build the normal equations of all the subbands.
+        H, X, R, b = [], [], [], []
         lx = x.unsqueeze(1)
         for i in range(self.n_band):
             if i < self.n_band - 1:
@@ -230,46 +230,47 @@ class AperiodicityExtractionByTandem(nn.Module):
             curr_pos = (time_axis * tmp_fs + 1.5).int().unsqueeze(0)  # (1, N)
             origin = curr_pos - index_bias  # (B, N)
 
-            j = self.ramp[..., : self.segment_length[i] + 2]
-            xx = x.expand(-1, N, -1)
-            T1 = x.size(-1) - 1
-
-            index_alpha = (origin - t0).unsqueeze(-1) + j  # (B, N, J + 2)
-            index_alpha = torch.clip(index_alpha, min=0, max=T1)
-            H_alpha = torch.gather(xx, -1, index_alpha)
-            H_alpha = H_alpha.unfold(2, 3, 1)  # (B, N, J, 3)
-
-            index_beta = (origin + t0).unsqueeze(-1) + j  # (B, N, J + 2)
-            index_beta = torch.clip(index_beta, min=0, max=T1)
-            H_beta = torch.gather(xx, -1, index_beta)
-            H_beta = H_beta.unfold(2, 3, 1)  # (B, N, J, 3)
-
-            H = torch.cat((H_alpha, H_beta), dim=-1)  # (B, N, J, 6)
-            w = self.window[i, : self.segment_length[i]]  # (J,)
-            Hw = H.transpose(-2, -1) * w  # (B, N, 6, J)
-            R = torch.matmul(Hw, H)  # (B, N, 6, 6)
-
-            index_gamma = origin.unsqueeze(-1) + j[..., 1:-1]  # (B, N, J)
-            index_gamma = torch.clip(index_gamma, 0, T1)
-            X = torch.gather(xx, -1, index_gamma).unsqueeze(-1)
-
-            for n in range(self.n_trial):
-                m = 10**n
-                u, info = torch.linalg.cholesky_ex(R + self.eye * m)
-                if 0 == info.sum().item():
-                    if n == self.n_trial - 1:
-                        raise RuntimeError("Failed to compute Cholesky decomposition.")
-                    break
-
-            b = torch.matmul(Hw, X)  # (B, N, 6, 1)
-            a = torch.cholesky_solve(b, u)
-            Ha = torch.matmul(H, a)  # (B, N, J, 1)
-
-            wsqrt = self.window_sqrt[i, : self.segment_length[i]]
-            wx = wsqrt * X.squeeze(-1)
-            wxHa = wsqrt * (X - Ha).squeeze(-1)
-            denom = wx.std(dim=-1, unbiased=True)
-            numer = wxHa.std(dim=-1, unbiased=True)
+            # Take the segments from the strided view of the padded waveform, which
+            # is equivalent to clipping the sample indices to the valid range.
+            J = self.segment_length[i]
+            T = x.size(-1)
+            xx = F.pad(x, (J + 2, J + 2), mode="replicate").squeeze(1)
+            xx = xx.unfold(-1, J + 2, 1)  # (B, T+J+3, J+2)
+            start = torch.stack((origin - t0, origin + t0, origin), dim=-1) - 1
+            start = torch.clip(start, min=-(J + 2), max=T) + (J + 2)
+            batch = torch.arange(B, device=x.device).view(-1, 1, 1)
+            segments = xx[batch, start.long()]  # (B, N, 3, J + 2)
+
+            # Weight the segments in advance as R = H^T W H and b = H^T W X.
+            wsqrt = self.window_sqrt[i, :J]  # (J,)
+            HT = [segments[..., :2, k : k + J] for k in range(3)]
+            HT = torch.stack(HT, dim=-2).reshape(B, N, 6, J) * wsqrt
+            XT = segments[..., 2:, 1:-1] * wsqrt  # (B, N, 1, J)
+            H.append(HT)
+            X.append(XT)
+            R.append(torch.matmul(HT, HT.transpose(-2, -1)))  # (B, N, 6, 6)
+            b.append(torch.matmul(HT, XT.transpose(-2, -1)))  # (B, N, 6, 1)
+
+        # Solve the equations of all the subbands at once. Instead of retrying the
+        # whole batch, which requires the synchronization with the host at every
+        # trial, the diagonal loading is increased relative to the scale of the
+        # frame only where the decomposition fails.
+        R = torch.stack(R, dim=-3)  # (B, N, K, 6, 6)
+        b = torch.stack(b, dim=-3)  # (B, N, K, 6, 1)
+        _, info = torch.linalg.cholesky_ex(R.detach() + self.eye)
+        scale = R.detach().diagonal(dim1=-2, dim2=-1).mean(-1)
+        scale = scale * torch.finfo(R.dtype).eps ** 0.5
+        scale = torch.where(info == 0, 0, scale / self.eps)
+        u, info = torch.linalg.cholesky_ex(R + self.eye * (1 + scale[..., None, None]))
+        if torch.any(info != 0):
+            raise RuntimeError("Failed to compute Cholesky decomposition.")
+        a = torch.cholesky_solve(b, u)
+
+        bap = []
+        for i in range(self.n_band):
+            Ha = torch.matmul(a[..., i, :, :].transpose(-2, -1), H[i])  # (B, N, 1, J)
+            denom = X[i].squeeze(-2).std(dim=-1, unbiased=True)
+            numer = (X[i] - Ha).squeeze(-2).std(dim=-1, unbiased=True)
             A = numer / (denom + 1e-16)
             bap.append(A)
 
@@ -336,3 +337,8 @@ class AperiodicityExtractionByTandem(nn.Module):
         hLP[18] = +0.52827343594055032
         hLP[19:] = hLP[17::-1]
         return hLP
+
+
+def _ignore_ramp(state_dict, prefix, *args):
+    # The state dicts saved by older versions have the unused ramp buffer.
+    state_dict.pop(prefix + "ramp", None)
@@ -19,7 +19,10 @@ import torch
 from torch import nn
 import torch.nn.functional as F
 
+from ..misc.cache import cached
+from ..misc.utils import banded_matmul
 from ..misc.utils import check_size
+from ..misc.utils import get_band_blocks
 from ..misc.utils import to
 
 
@@ -43,6 +46,11 @@ class ChromaFilterBankAnalysis(nn.Module):
     use_power : bool
         If True, use power spectrum instead of amplitude spectrum.
 
+    algorithm : ['auto', 'dense', 'banded']
+        Algorithm to apply the filter banks. `banded` multiplies only the non-zero
+        band of each group of channels. If `auto`, `banded` is used when the bands
+        are narrow and the number of frames is large enough.
+
     """
 
     def __init__(
@@ -52,6 +60,7 @@ class ChromaFilterBankAnalysis(nn.Module):
         sample_rate,
         norm=float("inf"),
         use_power=True,
+        algorithm="auto",
     ):
         super().__init__()
 
@@ -63,7 +72,10 @@ class ChromaFilterBankAnalysis(nn.Module):
         self.norm = norm
         self.use_power = use_power
 
-        self.register_buffer("H", self._precompute(n_channel, fft_length, sample_rate))
+        H, blocks = self._precompute(n_channel, fft_length, sample_rate, algorithm)
+        self.register_buffer("H", H)
+        self.blocks = blocks
+        self.algorithm = algorithm
 
     def forward(self, x):
         """Apply chroma-filter banks to STFT.
@@ -91,12 +103,14 @@ class ChromaFilterBankAnalysis(nn.Module):
 
         """
         check_size(x.size(-1), self.fft_length // 2 + 1, "dimension of spectrum")
-        return self._forward(x, self.norm, self.use_power, self.H)
+        return self._forward(
+            x, self.norm, self.use_power, self.H, self.blocks, self.algorithm
+        )
 
     @staticmethod
-    def _forward(x, norm, use_power, H):
+    def _forward(x, norm, use_power, H, blocks, algorithm):
         y = x if use_power else torch.sqrt(x)
-        y = torch.matmul(y, H)
+        y = banded_matmul(y, H, blocks, algorithm)
         y = F.normalize(y, p=norm, dim=-1)
         return y
 
@@ -107,18 +121,25 @@ class ChromaFilterBankAnalysis(nn.Module):
         sample_rate,
         norm,
         use_power,
+        algorithm,
     ):
-        H = ChromaFilterBankAnalysis._precompute(
+        H, blocks = cached(
+            ChromaFilterBankAnalysis._precompute,
             n_channel,
             2 * (x.size(-1) - 1),
             sample_rate,
+            algorithm,
             dtype=x.dtype,
             device=x.device,
         )
-        return ChromaFilterBankAnalysis._forward(x, norm, use_power, H)
+        return ChromaFilterBankAnalysis._forward(
+            x, norm, use_power, H, blocks, algorithm
+        )
 
     @staticmethod
-    def _precompute(n_channel, fft_length, sample_rate, dtype=None, device=None):
+    def _precompute(
+        n_channel, fft_length, sample_rate, algorithm="auto", dtype=None, device=None
+    ):
         import librosa
 
         weights = librosa.filters.chroma(
@@ -129,4 +150,12 @@ class ChromaFilterBankAnalysis(nn.Module):
             dtype=np.float64,
         ).T
         weights = torch.from_numpy(weights)
-        return to(weights, dtype=dtype, device=device)
+
+        if algorithm == "dense":
+            blocks = None
+        elif algorithm in ("auto", "banded"):
+            blocks = get_band_blocks(weights)
+        else:
+            raise ValueError(f"algorithm {algorithm} is not supported.")
+
+        return to(weights, dtype=dtype, device=device), blocks
@@ -38,7 +38,7 @@ import torchaudio
 from ..misc.utils import Lambda
 from ..misc.utils import delayed_import
 from ..misc.utils import numpy_to_torch
-from .stft import ShortTimeFourierTransform as STFT
+from .frame import Frame
 
 
 class ConstantQTransform(nn.Module):
@@ -191,8 +191,9 @@ class ConstantQTransform(nn.Module):
                 fp.append(fp[i])
                 sr.append(sr[i])
 
-        transforms = []
+        frames = []
         resamplers = []
+        self.bands = []
 
         for i in range(n_octave):
             sl = slice(-n_filter * (i + 1), None if i == 0 else (-n_filter * i))
@@ -207,23 +208,14 @@ class ConstantQTransform(nn.Module):
                 alpha=alpha[sl],
             )
 
-            fft_basis *= np.sqrt(sample_rate / sr[i])
-            self.register_buffer(
-                f"fft_basis_{i}", numpy_to_torch(fft_basis.todense()).T
-            )
+            # Keep only the band of the FFT bins used by the sparse basis.
+            fft_basis = fft_basis.toarray().T * np.sqrt(sample_rate / sr[i])
+            nonzero = np.flatnonzero(np.any(fft_basis != 0, axis=1))
+            lo, hi = int(nonzero[0]), int(nonzero[-1]) + 1
+            self.register_buffer(f"fft_basis_{i}", numpy_to_torch(fft_basis[lo:hi]))
+            self.bands.append((lo, hi))
 
-            transforms.append(
-                STFT(
-                    frame_length=fft_length,
-                    frame_period=fp[i],
-                    fft_length=fft_length,
-                    center=True,
-                    window="rectangular",
-                    norm="none",
-                    eps=0,
-                    out_format="complex",
-                )
-            )
+            frames.append(Frame(fft_length, fp[i], center=True))
 
             if fp[i] % 2 == 0:
                 resample_scale = np.sqrt(2)
@@ -241,8 +233,9 @@ class ConstantQTransform(nn.Module):
             else:
                 resamplers.append(Lambda(lambda x: x))
 
-        self.transforms = nn.ModuleList(transforms)
+        self.frames = nn.ModuleList(frames)
         self.resamplers = nn.ModuleList(resamplers)
+        self._register_load_state_dict_pre_hook(_slice_fft_basis, with_module=True)
 
     def forward(self, x):
         """Compute constant-Q transform.
@@ -269,31 +262,28 @@ class ConstantQTransform(nn.Module):
         x = self.early_downsample(x)
 
         cs = []
-        for i in range(len(self.transforms)):
-            X = self.transforms[i](x)
+        for i in range(len(self.frames)):
+            lo, hi = self.bands[i]
+            X = torch.fft.rfft(self.frames[i](x))[..., lo:hi]
             W = getattr(self, f"fft_basis_{i}")
             cs.append(torch.matmul(X, W))
-            if i != len(self.transforms) - 1:
+            if i != len(self.frames) - 1:
                 x = self.resamplers[i](x)
-        c = self._trim_stack(cs) * self.cqt_scale
+
+        # Sort the CQ-bins in ascending order of frequency.
+        n_frame = min(c.size(-2) for c in cs)
+        c = torch.cat([c[..., :n_frame, :] for c in reversed(cs)], dim=-1)
+        c = c * self.cqt_scale
         return c
 
-    def _trim_stack(self, cqt_response):
-        max_col = min(c.shape[-2] for c in cqt_response)
-        n_bin = len(self.cqt_scale)
-        shape = list(cqt_response[0].shape)
-        shape[-2] = max_col
-        shape[-1] = n_bin
-        output = torch.empty(
-            shape, dtype=cqt_response[0].dtype, device=cqt_response[0].device
-        )
 
-        end = n_bin
-        for c in cqt_response:
-            n_octave = c.shape[-1]
-            if end < n_octave:
-                output[..., :end] = c[..., :max_col, -end:]
-            else:
-                output[..., end - n_octave : end] = c[..., :max_col, :]
-            end -= n_octave
-        return output
+def _slice_fft_basis(module, state_dict, prefix, *args):
+    # The state dicts saved by older versions have the windows of the STFT modules
+    # and the FFT bases over all the FFT bins.
+    for key in list(state_dict):
+        if key.startswith(prefix + "transforms.") and key.endswith(".window"):
+            del state_dict[key]
+    for i, (lo, hi) in enumerate(module.bands):
+        key = prefix + f"fft_basis_{i}"
+        if key in state_dict and state_dict[key].size(0) != hi - lo:
+            state_dict[key] = state_dict[key][lo:hi]
@@ -17,9 +17,12 @@
 import torch
 from torch import nn
 
+from ..misc.cache import cached
 from ..misc.utils import check_size
 from ..misc.utils import plateau
-from ..misc.utils import to
+from ..misc.utils import precompute_trigonometric_transform
+from ..misc.utils import register_trigonometric_transform
+from ..misc.utils import trigonometric_transform
 
 
 class DiscreteCosineTransform(nn.Module):
@@ -34,16 +37,21 @@ class DiscreteCosineTransform(nn.Module):
     dct_type : int in [1, 4]
         DCT type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long input.
+
     """
 
-    def __init__(self, dct_length, dct_type=2):
+    def __init__(self, dct_length, dct_type=2, algorithm="auto"):
         super().__init__()
 
         assert 1 <= dct_length
         assert 1 <= dct_type <= 4
+        assert 2 <= dct_length or dct_type != 1
 
         self.dct_length = dct_length
-        self.register_buffer("W", self._precompute(dct_length, dct_type))
+        W, u, v, self.fft_length = self._precompute(dct_length, dct_type, algorithm)
+        register_trigonometric_transform(self, W, u, v)
 
     def forward(self, x):
         """Apply DCT to input.
@@ -68,44 +76,55 @@ class DiscreteCosineTransform(nn.Module):
 
         """
         check_size(x.size(-1), self.dct_length, "dimension of input")
-        return self._forward(x, self.W)
+        return self._forward(x, self.W, self.u, self.v, self.fft_length)
 
     @staticmethod
-    def _forward(x, W):
-        return torch.matmul(x, W)
+    def _forward(x, W, u, v, fft_length):
+        return trigonometric_transform(x, W, u, v, fft_length)
 
     @staticmethod
-    def _func(x, dct_type):
-        W = DiscreteCosineTransform._precompute(
-            x.size(-1), dct_type, dtype=x.dtype, device=x.device
+    def _func(x, dct_type, algorithm="auto"):
+        params = cached(
+            DiscreteCosineTransform._precompute,
+            x.size(-1),
+            dct_type,
+            algorithm,
+            dtype=x.dtype,
+            device=x.device,
         )
-        return DiscreteCosineTransform._forward(x, W)
+        return DiscreteCosineTransform._forward(x, *params)
 
     @staticmethod
-    def _precompute(length, dct_type, dtype=None, device=None):
+    def _precompute(length, dct_type, algorithm="auto", dtype=None, device=None):
         L = length
-        n = torch.arange(L, dtype=torch.double, device=device)
-        k = torch.arange(L, dtype=torch.double, device=device)
-        if dct_type == 2 or dct_type == 4:
-            n += 0.5
-        if dct_type == 3 or dct_type == 4:
-            k += 0.5
-        n *= torch.pi / ((L - 1) if dct_type == 1 else L)
-
         if dct_type == 1:
             c = (1 / 2) ** 0.5
-            z0 = plateau(L, c, 1, c, dtype=torch.double, device=device)
-            z1 = plateau(L, 1, 2, 1, dtype=torch.double, device=device)
-            z = z0.unsqueeze(0) * torch.sqrt(z1 / (L - 1)).unsqueeze(1)
+            r = plateau(L, 1, 2, 1, dtype=torch.double, device=device)
+            r = torch.sqrt(r / (L - 1))
+            s = plateau(L, c, 1, c, dtype=torch.double, device=device)
         elif dct_type == 2:
-            z = plateau(L, 1, 2, dtype=torch.double, device=device)
-            z = torch.sqrt(z / L).unsqueeze(0)
+            r = 1
+            s = plateau(L, 1, 2, dtype=torch.double, device=device)
+            s = torch.sqrt(s / L)
         elif dct_type == 3:
-            z = plateau(L, 1, 2, dtype=torch.double, device=device)
-            z = torch.sqrt(z / L).unsqueeze(1)
+            r = plateau(L, 1, 2, dtype=torch.double, device=device)
+            r = torch.sqrt(r / L)
+            s = 1
         elif dct_type == 4:
-            z = (2 / L) ** 0.5
+            r = (2 / L) ** 0.5
+            s = 1
         else:
-            raise ValueError
-        W = z * torch.cos(k.unsqueeze(0) * n.unsqueeze(1))
-        return to(W, dtype=dtype)
+            raise ValueError(f"dct_type {dct_type} is not supported.")
+        return precompute_trigonometric_transform(
+            L,
+            L,
+            2 * (L - 1) if dct_type == 1 else 2 * L,
+            in_offset=0.5 if dct_type == 2 or dct_type == 4 else 0,
+            out_offset=0.5 if dct_type == 3 or dct_type == 4 else 0,
+            in_scale=r,
+            out_scale=s,
+            kernel="cos",
+            algorithm=algorithm,
+            dtype=dtype,
+            device=device,
+        )
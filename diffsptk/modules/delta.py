@@ -18,6 +18,7 @@ import torch
 from torch import nn
 import torch.nn.functional as F
 
+from ..misc.cache import cached
 from ..misc.utils import to
 
 
@@ -96,7 +97,9 @@ class Delta(nn.Module):
 
     @staticmethod
     def _func(x, seed, static_out):
-        window = Delta._precompute(seed, static_out, dtype=x.dtype, device=x.device)
+        window = cached(
+            Delta._precompute, seed, static_out, dtype=x.dtype, device=x.device
+        )
         return Delta._forward(x, window)
 
     @staticmethod
@@ -18,6 +18,7 @@ import torch
 from torch import nn
 import torch.nn.functional as F
 
+from ..misc.utils import conv1d
 from ..misc.utils import iir
 from ..misc.utils import to
 from ..misc.utils import to_3d
@@ -41,9 +42,17 @@ class InfiniteImpulseResponseDigitalFilter(nn.Module):
     learnable : bool
         If True, the filter coefficients are learnable.
 
+    algorithm : ['auto', 'direct', 'fft']
+        Algorithm of the convolution with the truncated impulse response. 'fft'
+        performs the overlap-save convolution, which is faster for long impulse
+        responses. If 'auto', the faster one is selected based on the estimated
+        number of operations.
+
     """
 
-    def __init__(self, b=None, a=None, ir_length=None, learnable=False):
+    def __init__(
+        self, b=None, a=None, ir_length=None, learnable=False, algorithm="auto"
+    ):
         super().__init__()
 
         if b is None:
@@ -57,18 +66,9 @@ class InfiniteImpulseResponseDigitalFilter(nn.Module):
             ir_length = len(b)
         assert 1 <= ir_length
 
-        # Pre-compute impulse response.
-        d = torch.zeros(max(len(b), len(a)), dtype=torch.double)
-        h = torch.empty(ir_length, dtype=torch.double)
-        a0 = a[0]
-        a1 = a[1:]
-        for t in range(ir_length):
-            x = a0 if t == 0 else 0
-            y = x - torch.sum(d[: len(a1)] * a1)
-            d = torch.roll(d, 1)
-            d[0] = y
-            y = torch.sum(d[: len(b)] * b)
-            h[t] = y
+        self.algorithm = algorithm
+
+        h = self._precompute(b, a, ir_length)
         h = to(h.reshape(1, 1, -1).flip(-1))
         if learnable:
             self.h = nn.Parameter(h)
@@ -97,16 +97,40 @@ class InfiniteImpulseResponseDigitalFilter(nn.Module):
         tensor([0.0000, 1.0000, 1.0300, 1.0600, 1.0900])
 
         """
-        return self._forward(x, self.h)
+        return self._forward(x, self.h, self.algorithm)
 
     @staticmethod
-    def _forward(x, h):
+    def _forward(x, h, algorithm):
         y = to_3d(x)
         y = F.pad(y, (h.size(-1) - 1, 0))
-        y = F.conv1d(y, h)
+        y = conv1d(y, h, algorithm=algorithm)
         y = y.view_as(x)
         return y
 
     @staticmethod
     def _func(x, b=None, a=None):
         return iir(x, b, a)
+
+    @staticmethod
+    def _precompute(b, a, ir_length):
+        b = b.double()
+        a = a.double()
+
+        # Compute the impulse response of the all-pole part by the first rows of
+        # the powers of the companion matrix, which are doubled at each step.
+        a0, a1 = a[0], a[1:]
+        N = len(a1)
+        if N == 0:
+            g = F.pad(a0.view(1), (0, ir_length - 1))
+        else:
+            C = torch.cat((-a1.view(1, -1), torch.eye(N - 1, N, dtype=a.dtype)))
+            g = torch.eye(1, N, dtype=a.dtype)
+            while len(g) < ir_length:
+                g = torch.cat((g, torch.matmul(g, C)))
+                C = torch.matmul(C, C)
+            g = a0 * g[:ir_length, 0]
+
+        # Apply the all-zero part.
+        g = F.pad(g.view(1, 1, -1), (len(b) - 1, 0))
+        h = F.conv1d(g, b.flip(-1).view(1, 1, -1)).view(-1)
+        return h
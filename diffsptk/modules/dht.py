@@ -14,12 +14,13 @@
 # limitations under the License.                                           #
 # ------------------------------------------------------------------------ #
 
-import torch
 from torch import nn
 
-from ..misc.utils import cas
+from ..misc.cache import cached
 from ..misc.utils import check_size
-from ..misc.utils import to
+from ..misc.utils import precompute_trigonometric_transform
+from ..misc.utils import register_trigonometric_transform
+from ..misc.utils import trigonometric_transform
 
 
 class DiscreteHartleyTransform(nn.Module):
@@ -33,16 +34,20 @@ class DiscreteHartleyTransform(nn.Module):
     dht_type : int in [1, 4]
         DHT type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long input.
+
     """
 
-    def __init__(self, dht_length, dht_type=2):
+    def __init__(self, dht_length, dht_type=2, algorithm="auto"):
         super().__init__()
 
         assert 1 <= dht_length
         assert 1 <= dht_type <= 4
 
         self.dht_length = dht_length
-        self.register_buffer("W", self._precompute(dht_length, dht_type))
+        W, u, v, self.fft_length = self._precompute(dht_length, dht_type, algorithm)
+        register_trigonometric_transform(self, W, u, v)
 
     def forward(self, x):
         """Apply DHT to input.
@@ -67,29 +72,35 @@ class DiscreteHartleyTransform(nn.Module):
 
         """
         check_size(x.size(-1), self.dht_length, "dimension of input")
-        return self._forward(x, self.W)
+        return self._forward(x, self.W, self.u, self.v, self.fft_length)
 
     @staticmethod
-    def _forward(x, W):
-        return torch.matmul(x, W)
+    def _forward(x, W, u, v, fft_length):
+        return trigonometric_transform(x, W, u, v, fft_length)
 
     @staticmethod
-    def _func(x, dht_type):
-        W = DiscreteHartleyTransform._precompute(
-            x.size(-1), dht_type, dtype=x.dtype, device=x.device
+    def _func(x, dht_type, algorithm="auto"):
+        params = cached(
+            DiscreteHartleyTransform._precompute,
+            x.size(-1),
+            dht_type,
+            algorithm,
+            dtype=x.dtype,
+            device=x.device,
         )
-        return DiscreteHartleyTransform._forward(x, W)
+        return DiscreteHartleyTransform._forward(x, *params)
 
     @staticmethod
-    def _precompute(length, dht_type, dtype=None, device=None):
-        L = length
-        n = torch.arange(L, dtype=torch.double, device=device)
-        k = torch.arange(L, dtype=torch.double, device=device)
-        if dht_type == 2 or dht_type == 4:
-            n += 0.5
-        if dht_type == 3 or dht_type == 4:
-            k += 0.5
-        n *= 2 * torch.pi / L
-        z = L**-0.5
-        W = z * cas(k.unsqueeze(0) * n.unsqueeze(1))
-        return to(W, dtype=dtype)
+    def _precompute(length, dht_type, algorithm="auto", dtype=None, device=None):
+        return precompute_trigonometric_transform(
+            length,
+            length,
+            length,
+            in_offset=0.5 if dht_type == 2 or dht_type == 4 else 0,
+            out_offset=0.5 if dht_type == 3 or dht_type == 4 else 0,
+            in_scale=length**-0.5,
+            kernel="cas",
+            algorithm=algorithm,
+            dtype=dtype,
+            device=device,
+        )
@@ -17,9 +17,12 @@
 import torch
 from torch import nn
 
+from ..misc.cache import cached
 from ..misc.utils import check_size
 from ..misc.utils import plateau
-from ..misc.utils import to
+from ..misc.utils import precompute_trigonometric_transform
+from ..misc.utils import register_trigonometric_transform
+from ..misc.utils import trigonometric_transform
 
 
 class DiscreteSineTransform(nn.Module):
@@ -33,16 +36,20 @@ class DiscreteSineTransform(nn.Module):
     dst_type : int in [1, 4]
         DST type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long input.
+
     """
 
-    def __init__(self, dst_length, dst_type=2):
+    def __init__(self, dst_length, dst_type=2, algorithm="auto"):
         super().__init__()
 
         assert 1 <= dst_length
         assert 1 <= dst_type <= 4
 
         self.dst_length = dst_length
-        self.register_buffer("W", self._precompute(dst_length, dst_type))
+        W, u, v, self.fft_length = self._precompute(dst_length, dst_type, algorithm)
+        register_trigonometric_transform(self, W, u, v)
 
     def forward(self, x):
         """Apply DST to input.
@@ -67,41 +74,53 @@ class DiscreteSineTransform(nn.Module):
 
         """
         check_size(x.size(-1), self.dst_length, "dimension of input")
-        return self._forward(x, self.W)
+        return self._forward(x, self.W, self.u, self.v, self.fft_length)
 
     @staticmethod
-    def _forward(x, W):
-        return torch.matmul(x, W)
+    def _forward(x, W, u, v, fft_length):
+        return trigonometric_transform(x, W, u, v, fft_length)
 
     @staticmethod
-    def _func(x, dst_type):
-        W = DiscreteSineTransform._precompute(
-            x.size(-1), dst_type, dtype=x.dtype, device=x.device
+    def _func(x, dst_type, algorithm="auto"):
+        params = cached(
+            DiscreteSineTransform._precompute,
+            x.size(-1),
+            dst_type,
+            algorithm,
+            dtype=x.dtype,
+            device=x.device,
         )
-        return DiscreteSineTransform._forward(x, W)
+        return DiscreteSineTransform._forward(x, *params)
 
     @staticmethod
-    def _precompute(length, dst_type, dtype=None, device=None):
+    def _precompute(length, dst_type, algorithm="auto", dtype=None, device=None):
         L = length
-        n = torch.arange(1, L + 1, dtype=torch.double, device=device)
-        k = torch.arange(1, L + 1, dtype=torch.double, device=device)
-        if dst_type == 2 or dst_type == 4:
-            n -= 0.5
-        if dst_type == 3 or dst_type == 4:
-            k -= 0.5
-        n *= torch.pi / ((L + 1) if dst_type == 1 else L)
-
         if dst_type == 1:
-            z = (2 / (L + 1)) ** 0.5
+            r = (2 / (L + 1)) ** 0.5
+            s = 1
         elif dst_type == 2:
-            z = plateau(L, 2, 2, 1, dtype=torch.double, device=device)
-            z = torch.sqrt(z / L).unsqueeze(0)
+            r = 1
+            s = plateau(L, 2, 2, 1, dtype=torch.double, device=device)
+            s = torch.sqrt(s / L)
         elif dst_type == 3:
-            z = plateau(L, 2, 2, 1, dtype=torch.double, device=device)
-            z = torch.sqrt(z / L).unsqueeze(1)
+            r = plateau(L, 2, 2, 1, dtype=torch.double, device=device)
+            r = torch.sqrt(r / L)
+            s = 1
         elif dst_type == 4:
-            z = (2 / L) ** 0.5
+            r = (2 / L) ** 0.5
+            s = 1
         else:
-            raise ValueError
-        W = z * torch.sin(k.unsqueeze(0) * n.unsqueeze(1))
-        return to(W, dtype=dtype)
+            raise ValueError(f"dst_type {dst_type} is not supported.")
+        return precompute_trigonometric_transform(
+            L,
+            L,
+            2 * (L + 1) if dst_type == 1 else 2 * L,
+            in_offset=0.5 if dst_type == 2 or dst_type == 4 else 1,
+            out_offset=0.5 if dst_type == 3 or dst_type == 4 else 1,
+            in_scale=r,
+            out_scale=s,
+            kernel="sin",
+            algorithm=algorithm,
+            dtype=dtype,
+            device=device,
+        )
@@ -18,7 +18,10 @@ import numpy as np
 import torch
 from torch import nn
 
+from ..misc.cache import cached
+from ..misc.utils import banded_matmul
 from ..misc.utils import check_size
+from ..misc.utils import get_band_blocks
 from ..misc.utils import to
 
 
@@ -53,6 +56,11 @@ class MelFilterBankAnalysis(nn.Module):
         `y` is mel-filber bank outpus and `E` is energy. If this is `yE`, the two output
         tensors are concatenated and return the tensor instead of the tuple.
 
+    algorithm : ['auto', 'dense', 'banded']
+        Algorithm to apply the filter banks. `banded` multiplies only the non-zero
+        band of each group of channels. If `auto`, `banded` is used when the bands
+        are narrow and the number of frames is large enough.
+
     References
     ----------
     .. [1] S. Young et al., "The HTK Book," *Cambridge University Press*, 2006.
@@ -69,6 +77,7 @@ class MelFilterBankAnalysis(nn.Module):
         floor=1e-5,
         use_power=False,
         out_format="y",
+        algorithm="auto",
     ):
         super().__init__()
 
@@ -82,10 +91,12 @@ class MelFilterBankAnalysis(nn.Module):
         self.floor = floor
         self.use_power = use_power
         self.formatter = self._formatter(out_format)
-        H, center_frequencies = self._precompute(
-            n_channel, fft_length, sample_rate, f_min, f_max
+        H, blocks, center_frequencies = self._precompute(
+            n_channel, fft_length, sample_rate, f_min, f_max, algorithm
         )
         self.register_buffer("H", H)
+        self.blocks = blocks
+        self.algorithm = algorithm
         self.center_frequencies = center_frequencies  # For PLP.
 
     def forward(self, x):
@@ -116,12 +127,20 @@ class MelFilterBankAnalysis(nn.Module):
 
         """
         check_size(x.size(-1), self.fft_length // 2 + 1, "dimension of spectrum")
-        return self._forward(x, self.floor, self.use_power, self.formatter, self.H)
+        return self._forward(
+            x,
+            self.floor,
+            self.use_power,
+            self.formatter,
+            self.H,
+            self.blocks,
+            self.algorithm,
+        )
 
     @staticmethod
-    def _forward(x, floor, use_power, formatter, H):
+    def _forward(x, floor, use_power, formatter, H, blocks, algorithm):
         y = x if use_power else torch.sqrt(x)
-        y = torch.matmul(y, H)
+        y = banded_matmul(y, H, blocks, algorithm)
         y = torch.log(torch.clip(y, min=floor))
         E = (2 * x[..., 1:-1]).sum(-1) + x[..., 0] + x[..., -1]
         E = torch.log(E / (2 * (x.size(-1) - 1))).unsqueeze(-1)
@@ -137,22 +156,34 @@ class MelFilterBankAnalysis(nn.Module):
         floor,
         use_power,
         out_format,
+        algorithm,
     ):
         formatter = MelFilterBankAnalysis._formatter(out_format)
-        H, _ = MelFilterBankAnalysis._precompute(
+        H, blocks, _ = cached(
+            MelFilterBankAnalysis._precompute,
             n_channel,
             2 * (x.size(-1) - 1),
             sample_rate,
             f_min,
             f_max,
+            algorithm,
             dtype=x.dtype,
             device=x.device,
         )
-        return MelFilterBankAnalysis._forward(x, floor, use_power, formatter, H)
+        return MelFilterBankAnalysis._forward(
+            x, floor, use_power, formatter, H, blocks, algorithm
+        )
 
     @staticmethod
     def _precompute(
-        n_channel, fft_length, sample_rate, f_min, f_max, dtype=None, device=None
+        n_channel,
+        fft_length,
+        sample_rate,
+        f_min,
+        f_max,
+        algorithm="auto",
+        dtype=None,
+        device=None,
     ):
         if f_max is None:
             f_max = sample_rate / 2
@@ -191,7 +222,14 @@ class MelFilterBankAnalysis(nn.Module):
             if m < n_channel:
                 weights[k, m] += 1 - w
 
-        return to(weights, dtype=dtype), center_frequencies_in_hz
+        if algorithm == "dense":
+            blocks = None
+        elif algorithm in ("auto", "banded"):
+            blocks = get_band_blocks(weights)
+        else:
+            raise ValueError(f"algorithm {algorithm} is not supported.")
+
+        return to(weights, dtype=dtype), blocks, center_frequencies_in_hz
 
     @staticmethod
     def _formatter(out_format):
@@ -17,7 +17,9 @@
 import torch
 from torch import nn
 
+from ..misc.cache import cached
 from ..misc.utils import check_size
+from ..misc.utils import fill_warping_matrix
 from ..misc.utils import to
 
 
@@ -47,9 +49,15 @@ class FrequencyTransform(nn.Module):
 
         self.in_order = in_order
         self.out_order = out_order
-        self.register_buffer(
-            "A", self._precompute(self.in_order, self.out_order, alpha)
+        A = cached(
+            self._precompute,
+            self.in_order,
+            self.out_order,
+            alpha,
+            dtype=torch.get_default_dtype(),
         )
+        # Copy the cached matrix to protect it from in-place modification.
+        self.register_buffer("A", A.clone())
 
     def forward(self, c):
         """Perform frequency transform.
@@ -89,8 +97,13 @@ class FrequencyTransform(nn.Module):
     @staticmethod
     def _func(c, out_order, alpha):
         in_order = c.size(-1) - 1
-        A = FrequencyTransform._precompute(
-            in_order, out_order, alpha, dtype=c.dtype, device=c.device
+        A = cached(
+            FrequencyTransform._precompute,
+            in_order,
+            out_order,
+            alpha,
+            dtype=c.dtype,
+            device=c.device,
         )
         return FrequencyTransform._forward(c, A)
 
@@ -106,9 +119,5 @@ class FrequencyTransform(nn.Module):
         A[0, :] = alpha**arange
         if 1 < L2 and 1 < L1:
             A[1, 1:] = A[0, :-1] * beta * arange[1:]
-        for i in range(2, L2):
-            i1 = i - 1
-            for j in range(1, L1):
-                j1 = j - 1
-                A[i, j] = A[i1, j1] + alpha * (A[i, j1] - A[i1, j])
+        A = fill_warping_matrix(A, alpha, 2)
         return to(A.T, dtype=dtype)
@@ -17,6 +17,7 @@
 import torch
 from torch import nn
 
+from ..misc.cache import cached
 from ..misc.utils import check_size
 from ..misc.utils import to
 
@@ -95,8 +96,15 @@ class SecondOrderAllPassFrequencyTransform(nn.Module):
     @staticmethod
     def _func(c, out_order, alpha, theta, n_fft):
         in_order = c.size(-1) - 1
-        A = SecondOrderAllPassFrequencyTransform._precompute(
-            in_order, out_order, alpha, theta, n_fft, dtype=c.dtype, device=c.device
+        A = cached(
+            SecondOrderAllPassFrequencyTransform._precompute,
+            in_order,
+            out_order,
+            alpha,
+            theta,
+            n_fft,
+            dtype=c.dtype,
+            device=c.device,
         )
         return SecondOrderAllPassFrequencyTransform._forward(c, A)
 
@@ -265,21 +265,19 @@ class GaussianMixtureModeling(nn.Module):
 
         """
         x = to_dataloader(x, batch_size=self.batch_size)
-        device = self.w.device
 
         prev_log_likelihood = -torch.inf
         for n in range(self.n_iter):
-            # Compute log probabilities.
-            posterior, log_likelihood = self._e_step(x)
+            # Accumulate sufficient statistics in a single pass.
+            T, y, px, pxx, log_likelihood = self._accumulate(x)
 
             # Update mixture weights.
-            T = len(posterior)
             if self.alpha == 0:
-                z = posterior.sum(dim=0)
+                z = y
                 self.w = z / T
             else:
                 xi = self.ubm_w * self.alpha
-                z = posterior.sum(dim=0) + xi
+                z = y + xi
                 self.w = z / (T + self.alpha)
             z = 1 / z
             self.w = torch.clamp(self.w, min=self.weight_floor)
@@ -289,13 +287,6 @@ class GaussianMixtureModeling(nn.Module):
             self.w = a * self.w + b
 
             # Update mean vectors.
-            px = []
-            b = 0
-            for (batch_x,) in tqdm(x, disable=self.hide_progress_bar):
-                e = b + batch_x.size(0)
-                px.append(torch.matmul(posterior[b:e].t(), batch_x.to(device)))
-                b = e
-            px = sum(px)
             if self.alpha == 0:
                 self.mu = px * z.view(-1, 1)
             else:
@@ -303,19 +294,10 @@ class GaussianMixtureModeling(nn.Module):
 
             # Update covariance matrices.
             if self.is_diag:
-                pxx = []
-                b = 0
-                for (batch_x,) in tqdm(x, disable=self.hide_progress_bar):
-                    e = b + batch_x.size(0)
-                    xx = batch_x.to(device) ** 2
-                    pxx.append(torch.matmul(posterior[b:e].t(), xx))
-                    b = e
-                pxx = sum(pxx)
                 mm = self.mu**2
                 if self.alpha == 0:
                     sigma = pxx * z.view(-1, 1) - mm
                 else:
-                    y = posterior.sum(dim=0)
                     nu = px / y.view(-1, 1)
                     nm = nu * self.mu
                     a = pxx - y.view(-1, 1) * (2 * nm - mm)
@@ -324,20 +306,10 @@ class GaussianMixtureModeling(nn.Module):
                     sigma = (a + b + c) * z.view(-1, 1)
                 self.sigma.diagonal(dim1=-2, dim2=-1).copy_(sigma)
             else:
-                pxx = []
-                b = 0
-                for (batch_x,) in tqdm(x, disable=self.hide_progress_bar):
-                    e = b + batch_x.size(0)
-                    xp = batch_x.to(device)
-                    xx = torch.matmul(xp.unsqueeze(-1), xp.unsqueeze(-2))
-                    pxx.append(torch.einsum("bk,blm->klm", posterior[b:e], xx))
-                    b = e
-                pxx = sum(pxx)
                 mm = torch.matmul(self.mu.unsqueeze(-1), self.mu.unsqueeze(-2))
                 if self.alpha == 0:
                     sigma = pxx * z.view(-1, 1, 1) - mm
                 else:
-                    y = posterior.sum(dim=0)
                     nu = px / y.view(-1, 1)
                     nm = torch.matmul(nu.unsqueeze(-1), self.mu.unsqueeze(-2))
                     mn = nm.transpose(-2, -1)
@@ -431,6 +403,69 @@ class GaussianMixtureModeling(nn.Module):
         x = to_dataloader(x, self.batch_size)
         device = self.w.device
 
+        const = self._precompute_e_step(in_order)
+        posterior = []
+        log_prob = []
+        for (batch_x,) in tqdm(x, disable=self.hide_progress_bar):
+            p, lp = self._posterior(batch_x.to(device), *const)
+            posterior.append(p)
+            log_prob.append(lp)
+        posterior = torch.cat(posterior)  # (T, K)
+        log_prob = torch.cat(log_prob)  # (T,)
+        if reduction == "none":
+            log_likelihood = log_prob
+        elif reduction == "sum":
+            log_likelihood = torch.sum(log_prob)
+        else:
+            raise ValueError(f"reduction {reduction} is not supported.")
+        return posterior, log_likelihood
+
+    def _accumulate(self, x):
+        """Accumulate sufficient statistics without storing posterior probabilities.
+
+        Parameters
+        ----------
+        x : DataLoader
+            Input vectors.
+
+        Returns
+        -------
+        T : int
+            Number of input vectors.
+
+        y : Tensor [shape=(K,)]
+            Zeroth-order statistics.
+
+        px : Tensor [shape=(K, M+1)]
+            First-order statistics.
+
+        pxx : Tensor [shape=(K, M+1) or (K, M+1, M+1)]
+            Second-order statistics.
+
+        log_likelihood : Tensor [scalar]
+            Total log-likelihood.
+
+        """
+        device = self.w.device
+        const = self._precompute_e_step()
+
+        T = 0
+        y = px = pxx = log_likelihood = 0
+        for (batch_x,) in tqdm(x, disable=self.hide_progress_bar):
+            xp = batch_x.to(device)
+            posterior, log_prob = self._posterior(xp, *const)  # (B, K), (B,)
+            T += xp.size(0)
+            y = y + posterior.sum(dim=0)
+            px = px + torch.matmul(posterior.t(), xp)
+            if self.is_diag:
+                pxx = pxx + torch.matmul(posterior.t(), xp**2)
+            else:
+                kx = posterior.unsqueeze(-1) * xp.unsqueeze(-2)  # (B, K, L)
+                pxx = pxx + torch.einsum("bkl,bm->klm", kx, xp)
+            log_likelihood = log_likelihood + log_prob.sum()
+        return T, y, px, pxx, log_likelihood
+
+    def _precompute_e_step(self, in_order=None):
         if in_order is None:
             L = self.order + 1
             mu, sigma = self.mu, self.sigma
@@ -444,34 +479,23 @@ class GaussianMixtureModeling(nn.Module):
             precision = torch.reciprocal(
                 torch.diagonal(sigma, dim1=-2, dim2=-1)
             )  # (K, L)
-            mahala = []
-            for (batch_x,) in tqdm(x, disable=self.hide_progress_bar):
-                xp = batch_x.to(device)
-                diff = xp.unsqueeze(1) - mu.unsqueeze(0)  # (B, K, L)
-                mahala.append((diff**2 * precision).sum(-1))  # (B, K)
-            mahala = torch.cat(mahala)  # (T, K)
         else:
             col = torch.linalg.cholesky(sigma)
             log_det = (
                 torch.log(torch.diagonal(col, dim1=-2, dim2=-1)).sum(-1) * 2
             )  # (K,)
             precision = torch.cholesky_inverse(col).unsqueeze(0)  # (1, K, L, L)
-            mahala = []
-            for (batch_x,) in tqdm(x, disable=self.hide_progress_bar):
-                xp = batch_x.to(device)
-                diff = xp.unsqueeze(1) - mu.unsqueeze(0)  # (B, K, L)
-                right = torch.matmul(precision, diff.unsqueeze(-1))  # (B, K, L, 1)
-                mahala.append(
-                    torch.matmul(diff.unsqueeze(-2), right).squeeze(-1).squeeze(-1)
-                )  # (B, K)
-            mahala = torch.cat(mahala)  # (T, K)
-        numer = torch.log(self.w) - 0.5 * (log_pi + log_det + mahala)  # (T, K)
-        denom = torch.logsumexp(numer, dim=-1, keepdim=True)  # (T, 1)
-        posterior = torch.exp(numer - denom)  # (T, K)
-        if reduction == "none":
-            log_likelihood = denom.squeeze(-1)
-        elif reduction == "sum":
-            log_likelihood = torch.sum(denom)
+        log_const = torch.log(self.w) - 0.5 * (log_pi + log_det)  # (K,)
+        return mu, precision, log_const
+
+    def _posterior(self, x, mu, precision, log_const):
+        diff = x.unsqueeze(1) - mu.unsqueeze(0)  # (B, K, L)
+        if self.is_diag:
+            mahala = (diff**2 * precision).sum(-1)  # (B, K)
         else:
-            raise ValueError(f"reduction {reduction} is not supported.")
-        return posterior, log_likelihood
+            right = torch.matmul(precision, diff.unsqueeze(-1))  # (B, K, L, 1)
+            mahala = torch.matmul(diff.unsqueeze(-2), right).squeeze(-1).squeeze(-1)
+        numer = log_const - 0.5 * mahala  # (B, K)
+        denom = torch.logsumexp(numer, dim=-1)  # (B,)
+        posterior = torch.exp(numer - denom.unsqueeze(-1))  # (B, K)
+        return posterior, denom
@@ -35,6 +35,7 @@ import torch
 from torch import nn
 import torchaudio
 
+from ..misc.utils import Lambda
 from ..misc.utils import delayed_import
 from ..misc.utils import numpy_to_torch
 from .istft import InverseShortTimeFourierTransform as ISTFT
@@ -78,6 +79,11 @@ class InverseConstantQTransform(nn.Module):
     scale : bool
         If True, scale the CQT responce by the length of filter.
 
+    resampling : ['direct', 'cascade']
+        Upsampling scheme of the octave outputs. `direct` upsamples each octave to
+        the sample rate individually. `cascade` accumulates the octaves from the
+        lowest rate upward with upsampling by a factor of two per octave.
+
     **kwargs : additional keyword arguments
         See `torchaudio.transforms.Resample
         <https://pytorch.org/audio/main/generated/torchaudio.transforms.Resample.html>`_.
@@ -98,6 +104,7 @@ class InverseConstantQTransform(nn.Module):
         sparsity=1e-2,
         window="hann",
         scale=True,
+        resampling="direct",
         **kwargs,
     ):
         super().__init__()
@@ -109,6 +116,7 @@ class InverseConstantQTransform(nn.Module):
 
         assert 1 <= frame_period
         assert 1 <= sample_rate
+        assert resampling in ("direct", "cascade")
 
         K = n_bin
         B = n_bin_per_octave
@@ -188,15 +196,26 @@ class InverseConstantQTransform(nn.Module):
                 )
             )
 
-            resamplers.append(
-                torchaudio.transforms.Resample(
-                    orig_freq=1,
-                    new_freq=sample_rate // sr[i],  # must be integer
-                    dtype=torch.get_default_dtype(),
-                    **kwargs,
+            if resampling == "direct":
+                new_freq = sample_rate // sr[i]  # must be integer
+            elif 0 < i:
+                new_freq = sr[i] // sr[i - 1]
+            else:
+                new_freq = 1
+
+            if new_freq == 1:
+                resamplers.append(Lambda(lambda x: x))
+            else:
+                resamplers.append(
+                    torchaudio.transforms.Resample(
+                        orig_freq=1,
+                        new_freq=new_freq,
+                        dtype=torch.get_default_dtype(),
+                        **kwargs,
+                    )
                 )
-            )
 
+        self.cascade = resampling == "cascade"
         self.slices = slices
         self.transforms = nn.ModuleList(transforms)
         self.resamplers = nn.ModuleList(resamplers)
@@ -232,13 +251,13 @@ class InverseConstantQTransform(nn.Module):
             W = getattr(self, f"fft_basis_{i}")
             X = torch.matmul(C, W)
             x = self.transforms[i](X)
-            x = self.resamplers[i](x)
             if i == 0:
-                y = x[..., :out_length]
+                y = self.resamplers[i](x)
+                continue
+            if self.cascade:
+                y = self.resamplers[i](y)
             else:
-                if out_length is None:
-                    end = x.size(-1)
-                else:
-                    end = min(x.size(-1), out_length)
-                y[..., :end] += x[..., :end]
-        return y
+                x = self.resamplers[i](x)
+            end = min(x.size(-1), y.size(-1))
+            y = torch.cat([y[..., :end] + x[..., :end], y[..., end:]], dim=-1)
+        return y[..., :out_length]
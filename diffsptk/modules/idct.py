@@ -14,10 +14,11 @@
 # limitations under the License.                                           #
 # ------------------------------------------------------------------------ #
 
-import torch
 from torch import nn
 
+from ..misc.cache import cached
 from ..misc.utils import check_size
+from ..misc.utils import register_trigonometric_transform
 from .dct import DiscreteCosineTransform as DCT
 
 
@@ -33,16 +34,21 @@ class InverseDiscreteCosineTransform(nn.Module):
     dct_type : int in [1, 4]
         DCT type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long input.
+
     """
 
-    def __init__(self, dct_length, dct_type=2):
+    def __init__(self, dct_length, dct_type=2, algorithm="auto"):
         super().__init__()
 
         assert 1 <= dct_length
         assert 1 <= dct_type <= 4
+        assert 2 <= dct_length or dct_type != 1
 
         self.dct_length = dct_length
-        self.register_buffer("W", self._precompute(dct_length, dct_type))
+        W, u, v, self.fft_length = self._precompute(dct_length, dct_type, algorithm)
+        register_trigonometric_transform(self, W, u, v)
 
     def forward(self, y):
         """Apply inverse DCT to input.
@@ -68,22 +74,27 @@ class InverseDiscreteCosineTransform(nn.Module):
 
         """
         check_size(y.size(-1), self.dct_length, "dimension of input")
-        return self._forward(y, self.W)
+        return self._forward(y, self.W, self.u, self.v, self.fft_length)
 
     @staticmethod
-    def _forward(y, W):
-        return torch.matmul(y, W)
+    def _forward(y, W, u, v, fft_length):
+        return DCT._forward(y, W, u, v, fft_length)
 
     @staticmethod
-    def _func(y, dct_type):
-        W = InverseDiscreteCosineTransform._precompute(
-            y.size(-1), dct_type, dtype=y.dtype, device=y.device
+    def _func(y, dct_type, algorithm="auto"):
+        params = cached(
+            InverseDiscreteCosineTransform._precompute,
+            y.size(-1),
+            dct_type,
+            algorithm,
+            dtype=y.dtype,
+            device=y.device,
         )
-        return InverseDiscreteCosineTransform._forward(y, W)
+        return InverseDiscreteCosineTransform._forward(y, *params)
 
     @staticmethod
-    def _precompute(dct_length, dct_type, dtype=None, device=None):
+    def _precompute(dct_length, dct_type, algorithm="auto", dtype=None, device=None):
         type2type = {1: 1, 2: 3, 3: 2, 4: 4}
         return DCT._precompute(
-            dct_length, type2type[dct_type], dtype=dtype, device=device
+            dct_length, type2type[dct_type], algorithm, dtype=dtype, device=device
         )
@@ -14,10 +14,11 @@
 # limitations under the License.                                           #
 # ------------------------------------------------------------------------ #
 
-import torch
 from torch import nn
 
+from ..misc.cache import cached
 from ..misc.utils import check_size
+from ..misc.utils import register_trigonometric_transform
 from .dht import DiscreteHartleyTransform as DHT
 
 
@@ -32,16 +33,20 @@ class InverseDiscreteHartleyTransform(nn.Module):
     dht_type : int in [1, 4]
         DHT type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long input.
+
     """
 
-    def __init__(self, dht_length, dht_type=2):
+    def __init__(self, dht_length, dht_type=2, algorithm="auto"):
         super().__init__()
 
         assert 1 <= dht_length
         assert 1 <= dht_type <= 4
 
         self.dht_length = dht_length
-        self.register_buffer("W", self._precompute(dht_length, dht_type))
+        W, u, v, self.fft_length = self._precompute(dht_length, dht_type, algorithm)
+        register_trigonometric_transform(self, W, u, v)
 
     def forward(self, y):
         """Apply inverse DHT to input.
@@ -67,22 +72,27 @@ class InverseDiscreteHartleyTransform(nn.Module):
 
         """
         check_size(y.size(-1), self.dht_length, "dimension of input")
-        return self._forward(y, self.W)
+        return self._forward(y, self.W, self.u, self.v, self.fft_length)
 
     @staticmethod
-    def _forward(y, W):
-        return torch.matmul(y, W)
+    def _forward(y, W, u, v, fft_length):
+        return DHT._forward(y, W, u, v, fft_length)
 
     @staticmethod
-    def _func(y, dht_type):
-        W = InverseDiscreteHartleyTransform._precompute(
-            y.size(-1), dht_type, dtype=y.dtype, device=y.device
+    def _func(y, dht_type, algorithm="auto"):
+        params = cached(
+            InverseDiscreteHartleyTransform._precompute,
+            y.size(-1),
+            dht_type,
+            algorithm,
+            dtype=y.dtype,
+            device=y.device,
         )
-        return InverseDiscreteHartleyTransform._forward(y, W)
+        return InverseDiscreteHartleyTransform._forward(y, *params)
 
     @staticmethod
-    def _precompute(dht_length, dht_type, dtype=None, device=None):
+    def _precompute(dht_length, dht_type, algorithm="auto", dtype=None, device=None):
         type2type = {1: 1, 2: 3, 3: 2, 4: 4}
         return DHT._precompute(
-            dht_length, type2type[dht_type], dtype=dtype, device=device
+            dht_length, type2type[dht_type], algorithm, dtype=dtype, device=device
         )
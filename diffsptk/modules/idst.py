@@ -14,10 +14,11 @@
 # limitations under the License.                                           #
 # ------------------------------------------------------------------------ #
 
-import torch
 from torch import nn
 
+from ..misc.cache import cached
 from ..misc.utils import check_size
+from ..misc.utils import register_trigonometric_transform
 from .dst import DiscreteSineTransform as DST
 
 
@@ -32,16 +33,20 @@ class InverseDiscreteSineTransform(nn.Module):
     dst_type : int in [1, 4]
         DST type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long input.
+
     """
 
-    def __init__(self, dst_length, dst_type=2):
+    def __init__(self, dst_length, dst_type=2, algorithm="auto"):
         super().__init__()
 
         assert 1 <= dst_length
         assert 1 <= dst_type <= 4
 
         self.dst_length = dst_length
-        self.register_buffer("W", self._precompute(dst_length, dst_type))
+        W, u, v, self.fft_length = self._precompute(dst_length, dst_type, algorithm)
+        register_trigonometric_transform(self, W, u, v)
 
     def forward(self, y):
         """Apply inverse DST to input.
@@ -67,22 +72,27 @@ class InverseDiscreteSineTransform(nn.Module):
 
         """
         check_size(y.size(-1), self.dst_length, "dimension of input")
-        return self._forward(y, self.W)
+        return self._forward(y, self.W, self.u, self.v, self.fft_length)
 
     @staticmethod
-    def _forward(y, W):
-        return torch.matmul(y, W)
+    def _forward(y, W, u, v, fft_length):
+        return DST._forward(y, W, u, v, fft_length)
 
     @staticmethod
-    def _func(y, dst_type):
-        W = InverseDiscreteSineTransform._precompute(
-            y.size(-1), dst_type, dtype=y.dtype, device=y.device
+    def _func(y, dst_type, algorithm="auto"):
+        params = cached(
+            InverseDiscreteSineTransform._precompute,
+            y.size(-1),
+            dst_type,
+            algorithm,
+            dtype=y.dtype,
+            device=y.device,
         )
-        return InverseDiscreteSineTransform._forward(y, W)
+        return InverseDiscreteSineTransform._forward(y, *params)
 
     @staticmethod
-    def _precompute(dst_length, dst_type, dtype=None, device=None):
+    def _precompute(dst_length, dst_type, algorithm="auto", dtype=None, device=None):
         type2type = {1: 1, 2: 3, 3: 2, 4: 4}
         return DST._precompute(
-            dst_length, type2type[dst_type], dtype=dtype, device=device
+            dst_length, type2type[dst_type], algorithm, dtype=dtype, device=device
         )
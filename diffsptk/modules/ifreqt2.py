@@ -17,6 +17,7 @@
 import torch
 from torch import nn
 
+from ..misc.cache import cached
 from ..misc.utils import check_size
 from ..misc.utils import to
 from .freqt2 import SecondOrderAllPassFrequencyTransform
@@ -96,8 +97,15 @@ class SecondOrderAllPassInverseFrequencyTransform(nn.Module):
     @staticmethod
     def _func(c, out_order, alpha, theta, n_fft):
         in_order = c.size(-1) - 1
-        A = SecondOrderAllPassInverseFrequencyTransform._precompute(
-            in_order, out_order, alpha, theta, n_fft, dtype=c.dtype, device=c.device
+        A = cached(
+            SecondOrderAllPassInverseFrequencyTransform._precompute,
+            in_order,
+            out_order,
+            alpha,
+            theta,
+            n_fft,
+            dtype=c.dtype,
+            device=c.device,
         )
         return SecondOrderAllPassInverseFrequencyTransform._forward(c, A)
 
@@ -14,10 +14,11 @@
 # limitations under the License.                                           #
 # ------------------------------------------------------------------------ #
 
-import torch
 from torch import nn
 
+from ..misc.cache import cached
 from ..misc.utils import check_size
+from ..misc.utils import register_trigonometric_transform
 from .mdct import ModifiedDiscreteTransform
 from .unframe import Unframe
 from .window import Window
@@ -34,14 +35,19 @@ class InverseModifiedDiscreteCosineTransform(nn.Module):
     window : ['sine', 'vorbis', 'kbd', 'rectangular']
         Window type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long frame.
+
     """
 
-    def __init__(self, frame_length, window="sine", **kwargs):
+    def __init__(self, frame_length, window="sine", algorithm="auto", **kwargs):
         super().__init__()
 
         self.frame_period = frame_length // 2
 
-        self.imdct = InverseModifiedDiscreteTransform(frame_length, window, **kwargs)
+        self.imdct = InverseModifiedDiscreteTransform(
+            frame_length, window, algorithm=algorithm, **kwargs
+        )
         self.window = Window(frame_length, window=window, norm="none")
         self.unframe = Unframe(frame_length, self.frame_period)
 
@@ -82,9 +88,11 @@ class InverseModifiedDiscreteCosineTransform(nn.Module):
         return x
 
     @staticmethod
-    def _func(y, out_length, frame_length, window, **kwargs):
+    def _func(y, out_length, frame_length, window, algorithm="auto", **kwargs):
         frame_period = frame_length // 2
-        x = InverseModifiedDiscreteTransform._func(y, window, **kwargs)
+        x = InverseModifiedDiscreteTransform._func(
+            y, window, algorithm=algorithm, **kwargs
+        )
         x = Window._func(x, None, window=window, norm="none")
         x = Unframe._func(
             x,
@@ -114,16 +122,22 @@ class InverseModifiedDiscreteTransform(nn.Module):
     transform : ['cosine', 'sine']
         Transform type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long output.
+
     """
 
-    def __init__(self, length, window, transform="cosine"):
+    def __init__(self, length, window, transform="cosine", algorithm="auto"):
         super().__init__()
 
         assert 2 <= length
         assert length % 2 == 0
 
         self.length = length
-        self.register_buffer("W", self._precompute(length, window, transform))
+        W, u, v, self.fft_length = self._precompute(
+            length, window, transform, algorithm
+        )
+        register_trigonometric_transform(self, W, u, v)
 
     def forward(self, y):
         """Apply inverse MDCT/MDST to input.
@@ -140,21 +154,34 @@ class InverseModifiedDiscreteTransform(nn.Module):
 
         """
         check_size(2 * y.size(-1), self.length, "dimension of input")
-        return self._forward(y, self.W)
+        return self._forward(y, self.W, self.u, self.v, self.fft_length)
 
     @staticmethod
-    def _forward(y, W):
-        return torch.matmul(y, W)
+    def _forward(y, W, u, v, fft_length):
+        return ModifiedDiscreteTransform._forward(y, W, u, v, fft_length)
 
     @staticmethod
     def _func(y, window, **kwargs):
-        W = InverseModifiedDiscreteTransform._precompute(
-            2 * y.size(-1), window, dtype=y.dtype, device=y.device, **kwargs
+        params = cached(
+            InverseModifiedDiscreteTransform._precompute,
+            2 * y.size(-1),
+            window,
+            dtype=y.dtype,
+            device=y.device,
+            **kwargs,
         )
-        return InverseModifiedDiscreteTransform._forward(y, W)
+        return InverseModifiedDiscreteTransform._forward(y, *params)
 
     @staticmethod
-    def _precompute(length, window, transform="cosine", dtype=None, device=None):
+    def _precompute(
+        length, window, transform="cosine", algorithm="auto", dtype=None, device=None
+    ):
         return ModifiedDiscreteTransform._precompute(
-            length, window, transform, dtype=dtype, device=device
-        ).T
+            length,
+            window,
+            transform,
+            algorithm,
+            inverse=True,
+            dtype=dtype,
+            device=device,
+        )
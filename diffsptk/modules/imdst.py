@@ -30,12 +30,15 @@ class InverseModifiedDiscreteSineTransform(nn.Module):
     window : ['sine', 'vorbis', 'kbd', 'rectangular']
         Window type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long frame.
+
     """
 
-    def __init__(self, frame_length, window="sine"):
+    def __init__(self, frame_length, window="sine", algorithm="auto"):
         super().__init__()
 
-        self.imdst = IMDST(frame_length, window, transform="sine")
+        self.imdst = IMDST(frame_length, window, algorithm=algorithm, transform="sine")
 
     def forward(self, y, out_length=None):
         """Compute inverse modified discrete sine transform.
@@ -69,5 +72,7 @@ class InverseModifiedDiscreteSineTransform(nn.Module):
         return self.imdst(y, out_length=out_length)
 
     @staticmethod
-    def _func(y, out_length, frame_length, window):
-        return IMDST._func(y, out_length, frame_length, window, transform="sine")
+    def _func(y, out_length, frame_length, window, algorithm="auto"):
+        return IMDST._func(
+            y, out_length, frame_length, window, algorithm=algorithm, transform="sine"
+        )
@@ -17,9 +17,11 @@
 import warnings
 
 import numpy as np
+import torch
 from torch import nn
 import torch.nn.functional as F
 
+from ..misc.utils import conv1d
 from ..misc.utils import numpy_to_torch
 from .pqmf import make_filter_banks
 
@@ -42,18 +44,42 @@ class InversePseudoQuadratureMirrorFilterBanks(nn.Module):
     learnable : bool
         Whether to make filter-bank coefficients learnable.
 
+    polyphase : bool
+        If True, the subband waveforms are assumed to be decimated by :math:`K`.
+        The interpolation and the filtering are performed at once, which is
+        equivalent to filtering the zero-inserted subband waveforms multiplied by
+        :math:`K`.
+
+    algorithm : ['auto', 'direct', 'fft']
+        Algorithm of the convolution. 'fft' performs the overlap-save convolution,
+        which is faster for high filter orders. If 'auto', the faster one is
+        selected based on the estimated number of operations.
+
     **kwargs : additional keyword arguments
         Parameters to find optimal filter-bank coefficients.
 
     """
 
-    def __init__(self, n_band, filter_order, alpha=100, learnable=False, **kwargs):
+    def __init__(
+        self,
+        n_band,
+        filter_order,
+        alpha=100,
+        learnable=False,
+        polyphase=False,
+        algorithm="auto",
+        **kwargs,
+    ):
         super().__init__()
 
         assert 1 <= n_band
         assert 2 <= filter_order
         assert 0 < alpha
 
+        self.n_band = n_band
+        self.polyphase = polyphase
+        self.algorithm = algorithm
+
         # Make filterbanks.
         filters, is_converged = make_filter_banks(
             n_band, filter_order, mode="synthesis", alpha=alpha, **kwargs
@@ -80,13 +106,28 @@ class InversePseudoQuadratureMirrorFilterBanks(nn.Module):
             nn.ConstantPad1d((delay_left, 0), 0), nn.ReplicationPad1d((0, delay_right))
         )
 
+        # Make indices of polyphase components. The r-th phase of the output is
+        # given by the filter taps mK+r+s, where s is the delay.
+        if polyphase:
+            K = n_band
+            s = filter_order - delay_left
+            m_min = -((K - 1 + s) // K)
+            m_max = (filter_order - s) // K
+            lo = m_min * K + s
+            hi = m_max * K + K - 1 + s
+            self.padding = (max(0, -lo), max(0, hi - filter_order))
+            self.padding_y = (m_max, -m_min)
+            m = torch.arange(m_max, m_min - 1, -1)
+            r = torch.arange(K).unsqueeze(-1)
+            self.register_buffer("index", m * K + r + s + self.padding[0])
+
     def forward(self, y, keepdim=True):
         """Reconstruct waveform from subband waveforms.
 
         Parameters
         ----------
         y : Tensor [shape=(B, K, T) or (K, T)]
-            Subband waveforms.
+            Subband waveforms. If **polyphase** is True, the length is :math:`T/K`.
 
         keepdim : bool
             If True, the output shape is (B, 1, T) instead (B, T).
@@ -112,7 +153,22 @@ class InversePseudoQuadratureMirrorFilterBanks(nn.Module):
             y = y.unsqueeze(0)
         assert y.dim() == 3, "Input must be 3D tensor."
 
-        x = F.conv1d(self.pad(y), self.filters)
+        if self.polyphase and 1 < self.n_band:
+            x = self._interpolate(y)
+        else:
+            x = conv1d(self.pad(y), self.filters, algorithm=self.algorithm)
         if not keepdim:
             x = x.squeeze(1)
         return x
+
+    def _interpolate(self, y):
+        # Split the filters into polyphase components.
+        K = self.n_band
+        h = self.filters[0].flip(-1) * K  # (K, M+1)
+        h = F.pad(h, self.padding)
+        w = h[:, self.index].transpose(0, 1)  # (K, K, L)
+
+        # Compute each phase at the subband rate and interleave them.
+        x = conv1d(F.pad(y, self.padding_y), w, algorithm=self.algorithm)
+        x = x.transpose(-2, -1).reshape(x.size(0), 1, -1)
+        return x
@@ -60,6 +60,10 @@ class LindeBuzoGrayAlgorithm(nn.Module):
     batch_size : int >= 1 or None
         Batch size.
 
+    chunk_size : int >= 1
+        Block size in the nearest neighbour search, :math:`C`. At most
+        :math:`C^2` distances between input vectors and codewords are stored.
+
     seed : int or None
         Random seed.
 
@@ -80,6 +84,7 @@ class LindeBuzoGrayAlgorithm(nn.Module):
         init="mean",
         metric="none",
         batch_size=None,
+        chunk_size=1024,
         seed=None,
         verbose=False,
     ):
@@ -91,6 +96,7 @@ class LindeBuzoGrayAlgorithm(nn.Module):
         assert 1 <= n_iter
         assert 0 <= eps
         assert 0 < perturb_factor
+        assert 1 <= chunk_size
 
         self.order = order
         self.codebook_size = codebook_size
@@ -100,6 +106,7 @@ class LindeBuzoGrayAlgorithm(nn.Module):
         self.perturb_factor = perturb_factor
         self.metric = metric
         self.batch_size = batch_size
+        self.chunk_size = chunk_size
         self.seed = seed
         self.verbose = verbose
 
@@ -171,7 +178,8 @@ class LindeBuzoGrayAlgorithm(nn.Module):
         x = to_dataloader(x, self.batch_size)
         device = self.vq.codebook.device
 
-        # Initalize codebook.
+        # Initalize codebook. The dtype follows the input data.
+        codebook = self.vq.codebook
         if self.init == "none":
             pass
         elif self.init == "mean":
@@ -181,39 +189,26 @@ class LindeBuzoGrayAlgorithm(nn.Module):
             for (batch_x,) in tqdm(x, disable=self.hide_progress_bar):
                 assert batch_x.dim() == 2
                 if first:
+                    codebook = codebook.to(batch_x.dtype)
                     s = batch_x.sum(0)
                     T = batch_x.size(0)
                     first = False
                 else:
                     s += batch_x.sum(0)
                     T += batch_x.size(0)
-            self.vq.codebook[0] = s / T
+            codebook[0] = s / T
         else:
             raise ValueError(f"init {self.init} is not supported.")
-        self.vq.codebook[self.curr_codebook_size :] = 1e10
-
-        def e_step(x):
-            indices = []
-            distance = 0
-            for (batch_x,) in tqdm(x, disable=self.hide_progress_bar):
-                batch_xp = batch_x.to(device)
-                batch_xq, batch_indices, _ = self.vq(batch_xp)
-                indices.append(batch_indices)
-                distance += (batch_xp - batch_xq).square().sum()
-            indices = torch.cat(indices)
-            distance /= len(indices)
-            return indices, distance
+        codebook[self.curr_codebook_size :] = 1e10
 
         distance = torch.inf
         next_codebook_size = self.curr_codebook_size * 2
         while next_codebook_size <= self.codebook_size:
             # Double codebook.
-            codebook = self.vq.codebook[: self.curr_codebook_size]
-            r = torch.randn_like(codebook) * self.perturb_factor
-            self.vq.codebook[self.curr_codebook_size : next_codebook_size] = (
-                codebook - r
-            )
-            self.vq.codebook[: self.curr_codebook_size] += r
+            K = self.curr_codebook_size
+            r = torch.randn_like(codebook[:K]) * self.perturb_factor
+            codebook[K:next_codebook_size] = codebook[:K] - r
+            codebook[:K] += r
             self.curr_codebook_size = next_codebook_size
             next_codebook_size *= 2
             if self.verbose:
@@ -221,8 +216,11 @@ class LindeBuzoGrayAlgorithm(nn.Module):
 
             prev_distance = distance  # Suppress flake8 warnings.
             for n in range(self.n_iter):
-                # E-step: evaluate model.
-                indices, distance = e_step(x)
+                # E-step: evaluate model and accumulate statistics at once.
+                T, n_data, centroids, distance = self._accumulate(
+                    x, codebook[: self.curr_codebook_size]
+                )
+                distance /= T
                 if self.verbose:
                     self.logger.info(f"  iter {n+1:5d}: distance = {distance:g}")
 
@@ -232,27 +230,8 @@ class LindeBuzoGrayAlgorithm(nn.Module):
                     break
                 prev_distance = distance
 
-                # Get number of data points for each cluster.
-                n_data = torch.histc(
-                    indices.float(),
-                    bins=self.curr_codebook_size,
-                    min=0,
-                    max=self.curr_codebook_size - 1,
-                )
-                mask = self.min_data_per_cluster <= n_data
-
                 # M-step: update centroids.
-                centroids = torch.zeros(
-                    (self.curr_codebook_size, self.order + 1),
-                    dtype=distance.dtype,
-                    device=device,
-                )
-                idx = indices.unsqueeze(1).expand(-1, self.order + 1)
-                b = 0
-                for (batch_x,) in tqdm(x, disable=self.hide_progress_bar):
-                    e = b + batch_x.size(0)
-                    centroids.scatter_add_(0, idx[b:e], batch_x.to(device))
-                    b = e
+                mask = self.min_data_per_cluster <= n_data
                 centroids[mask] /= n_data[mask].unsqueeze(1)
 
                 if torch.any(~mask):
@@ -263,27 +242,32 @@ class LindeBuzoGrayAlgorithm(nn.Module):
                     centroids[~mask] = copied_centroids - r
                     centroids[m] += r.mean(0)
 
-                self.vq.codebook[: self.curr_codebook_size] = centroids
+                codebook = codebook.to(centroids.dtype)
+                codebook[: self.curr_codebook_size] = centroids
 
             if self.metric != "none":
                 gmm = GaussianMixtureModeling(self.order, self.curr_codebook_size)
-                gmm.set_params((None, centroids, None))
+                gmm.set_params((None, codebook[: self.curr_codebook_size], None))
                 _, log_likelihood = gmm._e_step(x)
                 n_param = self.curr_codebook_size * (self.order + 1)
                 if self.metric == "aic":
                     metric = -2 * log_likelihood + n_param * 2
                 elif self.metric == "bic":
-                    metric = -2 * log_likelihood + n_param * math.log(len(indices))
+                    metric = -2 * log_likelihood + n_param * math.log(T)
                 else:
                     raise ValueError(f"metric {self.metric} is not supported.")
                 if self.verbose:
                     self.logger.info(f"  {self.metric.upper()} = {metric:g}")
 
+        self.vq.codebook[:] = codebook
         ret = [self.vq.codebook]
 
         if return_indices:
-            indices, _ = e_step(x)
-            ret.append(indices)
+            indices = []
+            for (batch_x,) in tqdm(x, disable=self.hide_progress_bar):
+                _, batch_indices = self.transform(batch_x.to(device))
+                indices.append(batch_indices)
+            ret.append(torch.cat(indices))
 
         ret.append(distance)
         return ret
@@ -313,5 +297,99 @@ class LindeBuzoGrayAlgorithm(nn.Module):
         >>> xq, indices = lbg.transform(x)
 
         """
-        xq, indices, _ = self.vq(x)
+        codebook = self.vq.codebook
+        indices, _ = self._nearest(x.to(codebook.dtype), codebook)
+        xq = codebook[indices]
         return xq, indices
+
+    def _nearest(self, x, codebook):
+        """Find the nearest codewords in blocks without storing all distances.
+
+        Parameters
+        ----------
+        x : Tensor [shape=(..., M+1)]
+            Input vectors.
+
+        codebook : Tensor [shape=(K, M+1)]
+            Codebook.
+
+        Returns
+        -------
+        indices : Tensor [shape=(...,)]
+            Codebook indices.
+
+        distance : Tensor [shape=(...,)]
+            Squared distance to the nearest codeword.
+
+        """
+        shape = x.shape[:-1]
+        x = x.reshape(-1, x.size(-1))
+        T, K = x.size(0), codebook.size(0)
+        K_chunk = min(K, self.chunk_size)
+        T_chunk = max(1, self.chunk_size**2 // K_chunk)
+
+        # The squared norm of input is omitted as it does not affect argmin.
+        cc = codebook.square().sum(-1)
+        indices = []
+        distance = []
+        for t in range(0, T, T_chunk):
+            xt = x[t : t + T_chunk]
+            best_d = best_k = None
+            for k in range(0, K, K_chunk):
+                d = cc[k : k + K_chunk] - 2 * torch.matmul(
+                    xt, codebook[k : k + K_chunk].T
+                )
+                d, idx = d.min(-1)
+                if best_d is None:
+                    best_d, best_k = d, idx
+                else:
+                    update = d < best_d
+                    best_d = torch.where(update, d, best_d)
+                    best_k = torch.where(update, idx + k, best_k)
+            indices.append(best_k)
+            distance.append((xt - codebook[best_k]).square().sum(-1))
+        indices = torch.cat(indices).view(shape)
+        distance = torch.cat(distance).view(shape)
+        return indices, distance
+
+    def _accumulate(self, x, codebook):
+        """Accumulate statistics of the nearest neighbour assignment in one pass.
+
+        Parameters
+        ----------
+        x : DataLoader
+            Input vectors.
+
+        codebook : Tensor [shape=(K, M+1)]
+            Codebook.
+
+        Returns
+        -------
+        T : int
+            Number of input vectors.
+
+        n_data : Tensor [shape=(K,)]
+            Number of input vectors assigned to each codeword.
+
+        centroids : Tensor [shape=(K, M+1)]
+            Sum of input vectors assigned to each codeword.
+
+        distance : Tensor [scalar]
+            Total squared distance.
+
+        """
+        K = codebook.size(0)
+        T = 0
+        distance = 0
+        for (batch_x,) in tqdm(x, disable=self.hide_progress_bar):
+            if T == 0:
+                codebook = codebook.to(batch_x.dtype)
+                n_data = torch.zeros(K, dtype=codebook.dtype, device=codebook.device)
+                centroids = torch.zeros_like(codebook)
+            xp = batch_x.to(codebook.device, codebook.dtype)
+            indices, d = self._nearest(xp, codebook)
+            T += xp.size(0)
+            n_data += torch.bincount(indices, minlength=K)
+            centroids.index_add_(0, indices, xp)
+            distance = distance + d.sum()
+        return T, n_data, centroids, distance
@@ -17,13 +17,15 @@
 import torch
 from torch import nn
 
+from ..misc.cache import cached
 from ..misc.utils import check_size
 from ..misc.utils import symmetric_toeplitz
+from .lpc2par import LinearPredictiveCoefficientsToParcorCoefficients
 
 
 class LevinsonDurbin(nn.Module):
     """See `this page <https://sp-nitech.github.io/sptk/latest/main/levdur.html>`_
-    for details. The implementation is based on a simple matrix inversion.
+    for details.
 
     Parameters
     ----------
@@ -33,17 +35,28 @@ class LevinsonDurbin(nn.Module):
     eps : float >= 0
         A small value to improve numerical stability.
 
+    algorithm : ['recursive', 'inverse']
+        'recursive' performs the Levinson-Durbin recursion in :math:`O(M^2)`
+        operations. 'inverse' solves the system by a simple matrix inversion in
+        :math:`O(M^3)` operations.
+
     """
 
-    def __init__(self, lpc_order, eps=0):
+    def __init__(self, lpc_order, eps=0, algorithm="recursive"):
         super().__init__()
 
         assert 0 <= lpc_order
+        assert 0 <= eps
+
+        if algorithm not in ("recursive", "inverse"):
+            raise ValueError(f"algorithm {algorithm} is not supported.")
 
         self.lpc_order = lpc_order
+        self.eps = eps
+        self.algorithm = algorithm
         self.register_buffer("eye", self._precompute(self.lpc_order, eps))
 
-    def forward(self, r):
+    def forward(self, r, return_parcor=False):
         """Solve a Yule-Walker linear system.
 
         Parameters
@@ -51,11 +64,17 @@ class LevinsonDurbin(nn.Module):
         r : Tensor [shape=(..., M+1)]
             Autocorrelation.
 
+        return_parcor : bool
+            If True, return PARCOR coefficients in addition to LPC coefficients.
+
         Returns
         -------
-        out : Tensor [shape=(..., M+1)]
+        a : Tensor [shape=(..., M+1)]
             Gain and LPC coefficients.
 
+        k : Tensor [shape=(..., M+1)]
+            Gain and PARCOR coefficients, returned only if **return_parcor** is True.
+
         Examples
         --------
         >>> x = diffsptk.nrand(4)
@@ -69,10 +88,47 @@ class LevinsonDurbin(nn.Module):
 
         """
         check_size(r.size(-1), self.lpc_order + 1, "dimension of autocorrelation")
-        return self._forward(r, self.eye)
+        return self._forward(r, self.eps, self.eye, self.algorithm, return_parcor)
+
+    @staticmethod
+    def _forward(r, eps, eye, algorithm, return_parcor=False):
+        if algorithm == "recursive":
+            a, k = LevinsonDurbin._recursion(r, eps)
+        elif algorithm == "inverse":
+            a = LevinsonDurbin._inversion(r, eye)
+            if return_parcor:
+                k = LinearPredictiveCoefficientsToParcorCoefficients._func(a)
+        else:
+            raise ValueError(f"algorithm {algorithm} is not supported.")
+
+        if return_parcor:
+            return a, k
+        return a
+
+    @staticmethod
+    def _recursion(r, eps):
+        r0, r1 = torch.split(r, [1, r.size(-1) - 1], dim=-1)
+
+        # Perform the recursion for all frames in parallel.
+        a = r1[..., :0]
+        e = r0 + eps
+        ks = []
+        for m in range(r1.size(-1)):
+            k = -(r1[..., m : m + 1] + (a * r1[..., :m].flip(-1)).sum(-1, keepdim=True))
+            k = k / e
+            a = torch.cat((a + k * a.flip(-1), k), dim=-1)
+            e = e * (1 - k * k)
+            ks.append(k)
+
+        # Compute gain.
+        K = torch.sqrt((r1 * a).sum(-1, keepdim=True) + r0)
+
+        a = torch.cat((K, a), dim=-1)
+        k = torch.cat([K] + ks, dim=-1)
+        return a, k
 
     @staticmethod
-    def _forward(r, eye):
+    def _inversion(r, eye):
         r0, r1 = torch.split(r, [1, r.size(-1) - 1], dim=-1)
 
         # Make Toeplitz matrix.
@@ -88,11 +144,17 @@ class LevinsonDurbin(nn.Module):
         return a
 
     @staticmethod
-    def _func(r, eps):
-        eye = LevinsonDurbin._precompute(
-            r.size(-1) - 1, eps, dtype=r.dtype, device=r.device
-        )
-        return LevinsonDurbin._forward(r, eye)
+    def _func(r, eps, algorithm="recursive", return_parcor=False):
+        eye = None
+        if algorithm == "inverse":
+            eye = cached(
+                LevinsonDurbin._precompute,
+                r.size(-1) - 1,
+                eps,
+                dtype=r.dtype,
+                device=r.device,
+            )
+        return LevinsonDurbin._forward(r, eps, eye, algorithm, return_parcor)
 
     @staticmethod
     def _precompute(order, eps, dtype=None, device=None):
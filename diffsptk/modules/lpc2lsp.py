@@ -18,9 +18,11 @@ import torch
 from torch import nn
 import torch.nn.functional as F
 
+from ..misc.cache import cached
 from ..misc.utils import TWO_PI
 from ..misc.utils import check_size
 from ..misc.utils import deconv1d
+from ..misc.utils import to
 from .root_pol import PolynomialToRoots
 
 
@@ -42,21 +44,45 @@ class LinearPredictiveCoefficientsToLineSpectralPairs(nn.Module):
     out_format : ['radian', 'cycle', 'khz', 'hz']
         Output format.
 
+    algorithm : ['chebyshev', 'eig']
+        Root finding algorithm. 'chebyshev' brackets the roots of the symmetric
+        polynomials on the Chebyshev grid and refines them by Newton's method. If
+        the roots of a frame are not bracketed, e.g., the LPC is not minimum phase,
+        the frame falls back to 'eig', which computes the eigenvalues of the
+        companion matrices.
+
+    n_split : int >= 1
+        Number of splits of the interval :math:`[0, \\pi]` used for bracketing.
+
+    n_iter : int >= 1
+        Number of iterations of Newton's method.
+
     """
 
     def __init__(
-        self, lpc_order, log_gain=False, sample_rate=None, out_format="radian"
+        self,
+        lpc_order,
+        log_gain=False,
+        sample_rate=None,
+        out_format="radian",
+        algorithm="chebyshev",
+        n_split=128,
+        n_iter=8,
     ):
         super().__init__()
 
         assert 0 <= lpc_order
+        assert 1 <= n_split
+        assert 1 <= n_iter
 
         self.lpc_order = lpc_order
         self.log_gain = log_gain
+        self.n_iter = n_iter
         self.formatter = self._formatter(out_format, sample_rate)
-        kernel_p, kernel_q = self._precompute(self.lpc_order)
+        kernel_p, kernel_q, basis = self._precompute(self.lpc_order, algorithm, n_split)
         self.register_buffer("kernel_p", kernel_p)
         self.register_buffer("kernel_q", kernel_q)
+        self.register_buffer("basis", basis, persistent=False)
 
     def forward(self, a):
         """Convert LPC to LSP.
@@ -88,11 +114,17 @@ class LinearPredictiveCoefficientsToLineSpectralPairs(nn.Module):
         """
         check_size(a.size(-1), self.lpc_order + 1, "dimension of LPC")
         return self._forward(
-            a, self.log_gain, self.formatter, self.kernel_p, self.kernel_q
+            a,
+            self.log_gain,
+            self.formatter,
+            self.kernel_p,
+            self.kernel_q,
+            self.basis,
+            self.n_iter,
         )
 
     @staticmethod
-    def _forward(a, log_gain, formatter, kernel_p, kernel_q):
+    def _forward(a, log_gain, formatter, kernel_p, kernel_q, basis, n_iter):
         M = a.size(-1) - 1
         K, a = torch.split(a, [1, M], dim=-1)
 
@@ -104,19 +136,24 @@ class LinearPredictiveCoefficientsToLineSpectralPairs(nn.Module):
         a0 = F.pad(a, (1, 0), value=1)
         a1 = F.pad(a0, (0, 1), value=0)
         a2 = a1.flip(-1)
-        p = a1 - a2
-        q = a1 + a2
-        if M == 1:
-            q = PolynomialToRoots._func(q)
-            w = torch.angle(q[..., 0])
+        p = deconv1d(a1 - a2, kernel_p)
+        q = deconv1d(a1 + a2, kernel_q)
+
+        if basis is None:
+            w = LinearPredictiveCoefficientsToLineSpectralPairs._eig(p, q)
         else:
-            p = deconv1d(p, kernel_p)
-            q = deconv1d(q, kernel_q)
-            p = PolynomialToRoots._func(p)
-            q = PolynomialToRoots._func(q)
-            p = torch.angle(p[..., 0::2])
-            q = torch.angle(q[..., 0::2])
-            w, _ = torch.sort(torch.cat((p, q), dim=-1))
+            find_roots = LinearPredictiveCoefficientsToLineSpectralPairs._find_roots
+            wp, ok_p = find_roots(p, basis, n_iter)
+            wq, ok_q = find_roots(q, basis, n_iter)
+            w, _ = torch.sort(torch.cat((wp, wq), dim=-1))
+
+            # Fall back to the eigenvalue decomposition if bracketing fails.
+            ng = ~torch.logical_and(ok_p, ok_q)
+            if torch.any(ng):
+                w = w.index_put(
+                    (ng,),
+                    LinearPredictiveCoefficientsToLineSpectralPairs._eig(p[ng], q[ng]),
+                )
 
         w = w.view_as(a)
         w = formatter(w)
@@ -124,26 +161,100 @@ class LinearPredictiveCoefficientsToLineSpectralPairs(nn.Module):
         return w
 
     @staticmethod
-    def _func(a, log_gain, sample_rate, out_format):
+    def _eig(p, q):
+        q = PolynomialToRoots._func(q)
+        q = torch.angle(q[..., 0::2])
+        if p.size(-1) == 1:
+            return q
+        p = PolynomialToRoots._func(p)
+        p = torch.angle(p[..., 0::2])
+        w, _ = torch.sort(torch.cat((p, q), dim=-1))
+        return w
+
+    @staticmethod
+    def _find_roots(c, basis, n_iter):
+        # The symmetric polynomial of degree 2N is written on the unit circle as
+        # z^{-N} C(z) = sum_k d_k cos(k w) = sum_k d_k T_k(cos w), whose N roots
+        # are in (0, pi) and correspond to the LSP frequencies.
+        N = (c.size(-1) - 1) // 2
+        ok = torch.ones(c.shape[:-1], dtype=torch.bool, device=c.device)
+        if N == 0:
+            return c[..., :0], ok
+        d = torch.cat((c[..., N : N + 1], 2 * c[..., N + 1 :]), dim=-1)
+        k = torch.arange(N + 1, dtype=c.dtype, device=c.device)
+
+        def evaluate(d, w):
+            kw = w.unsqueeze(-1) * k
+            f = (d.unsqueeze(-2) * torch.cos(kw)).sum(-1)
+            df = -(d.unsqueeze(-2) * k * torch.sin(kw)).sum(-1)
+            return f, df
+
+        with torch.no_grad():
+            d_ = d.detach()
+
+            # Bracket the roots by the sign changes on the grid.
+            S = basis.size(-1) - 1
+            g = torch.matmul(d_, basis[: N + 1])
+            b = 0 <= g
+            change = b[..., :-1] != b[..., 1:]
+            ok = change.sum(-1) == N
+            j = torch.arange(S, device=c.device)
+            j = torch.where(change, j, S).sort(-1).values[..., :N].clamp(max=S - 1)
+            lo = j * (torch.pi / S)
+            hi = lo + torch.pi / S
+            neg = g.gather(-1, j) < 0
+
+            # Refine the roots by Newton's method safeguarded by bisection.
+            w = 0.5 * (lo + hi)
+            for _ in range(n_iter):
+                f, df = evaluate(d_, w)
+                left = (f < 0) == neg
+                lo = torch.where(left, w, lo)
+                hi = torch.where(left, hi, w)
+                w = w - f / df
+                w = torch.where((lo <= w) & (w <= hi), w, 0.5 * (lo + hi))
+
+        # Make the roots differentiable by the implicit function theorem.
+        f, df = evaluate(d, w)
+        w = w - f / df.detach()
+        return w, ok
+
+    @staticmethod
+    def _func(a, log_gain, sample_rate, out_format, algorithm, n_split, n_iter):
         formatter = LinearPredictiveCoefficientsToLineSpectralPairs._formatter(
             out_format, sample_rate
         )
-        kernels = LinearPredictiveCoefficientsToLineSpectralPairs._precompute(
-            a.size(-1) - 1, dtype=a.dtype, device=a.device
+        params = cached(
+            LinearPredictiveCoefficientsToLineSpectralPairs._precompute,
+            a.size(-1) - 1,
+            algorithm,
+            n_split,
+            dtype=a.dtype,
+            device=a.device,
         )
         return LinearPredictiveCoefficientsToLineSpectralPairs._forward(
-            a, log_gain, formatter, *kernels
+            a, log_gain, formatter, *params, n_iter
         )
 
     @staticmethod
-    def _precompute(lpc_order, dtype=None, device=None):
+    def _precompute(lpc_order, algorithm, n_split, dtype=None, device=None):
         if lpc_order % 2 == 0:
             kernel_p = torch.tensor([1.0, -1.0], device=device)
             kernel_q = torch.tensor([1.0, 1.0], device=device)
         else:
             kernel_p = torch.tensor([1.0, 0.0, -1.0], device=device)
             kernel_q = torch.tensor([1.0], device=device)
-        return kernel_p, kernel_q
+
+        if algorithm == "eig":
+            basis = None
+        elif algorithm == "chebyshev":
+            k = torch.arange(lpc_order // 2 + 2, dtype=torch.double, device=device)
+            w = torch.linspace(0, torch.pi, n_split + 1, dtype=torch.double)
+            basis = torch.cos(k.unsqueeze(-1) * w.to(device))
+            basis = to(basis, dtype=dtype)
+        else:
+            raise ValueError(f"algorithm {algorithm} is not supported.")
+        return kernel_p, kernel_q, basis
 
     @staticmethod
     def _formatter(out_format, sample_rate):
@@ -18,6 +18,7 @@ import numpy as np
 import torch
 from torch import nn
 
+from ..misc.cache import cached
 from ..misc.utils import check_size
 from ..misc.utils import to
 
@@ -138,8 +139,14 @@ class LineSpectralPairsToSpectrum(nn.Module):
     @staticmethod
     def _func(w, fft_length, alpha, gamma, log_gain, out_format):
         formatter = LineSpectralPairsToSpectrum._formatter(out_format)
-        precomputes = LineSpectralPairsToSpectrum._precompute(
-            w.size(-1) - 1, fft_length, alpha, gamma, dtype=w.dtype, device=w.device
+        precomputes = cached(
+            LineSpectralPairsToSpectrum._precompute,
+            w.size(-1) - 1,
+            fft_length,
+            alpha,
+            gamma,
+            dtype=w.dtype,
+            device=w.device,
         )
         return LineSpectralPairsToSpectrum._forward(
             w, log_gain, formatter, *precomputes
@@ -95,56 +95,25 @@ class MagicNumberInterpolationImpl(torch.autograd.Function):
         elif d == 2:
             x = x.unsqueeze(0)
         assert x.dim() == 3, "Input must be 3D tensor."
-        B, T, D = x.shape
-
-        def compute_lerp_inputs(x, magic_number):
-            is_magic_number = x == magic_number
-
-            starts = []
-            ends = []
-            weights = []
-            for i in range(x.size(0)):
-                uniques, counts = torch.unique_consecutive(
-                    is_magic_number[i],
-                    return_inverse=False,
-                    return_counts=True,
-                    dim=-1,
-                )
-                w = torch.repeat_interleave(uniques / (counts + 1), counts, dim=-1)
-                if uniques[0]:
-                    w[..., : counts[0]] = 0
-                w = torch.cumsum(w, dim=-1)
-                w = w - torch.cummax(w * ~is_magic_number[i], dim=-1)[0]
-                if uniques[0]:
-                    w[..., : counts[0]] = 1
-                if uniques[-1]:
-                    w[..., -counts[-1] :] = 0
-
-                uniques, indices = torch.unique_consecutive(
-                    x[i],
-                    return_inverse=True,
-                    return_counts=False,
-                    dim=-1,
-                )
-                pos = uniques == magic_number
-                uniques[pos] = torch.roll(uniques, 1, dims=-1)[pos]
-                s = uniques[indices]
-                uniques[pos] = torch.roll(uniques, -1, dims=-1)[pos]
-                e = uniques[indices]
-
-                starts.append(s)
-                ends.append(e)
-                weights.append(w)
-
-            starts = torch.stack(starts)
-            ends = torch.stack(ends)
-            weights = torch.stack(weights)
-            return starts, ends, weights
-
-        x = x.transpose(-2, -1).reshape(B * D, T)
-        starts, ends, weights = compute_lerp_inputs(x, magic_number)
-        y = torch.lerp(starts, ends, weights)
-        y = y.reshape(B, D, T).transpose(-2, -1)
+        T = x.size(-2)
+
+        # Find the nearest non-magic positions on both sides of each point.
+        is_valid = x != magic_number
+        pos = torch.arange(T, device=x.device).view(1, -1, 1)
+        prev_pos = torch.where(is_valid, pos, -1).cummax(dim=1)[0]
+        next_pos = torch.where(is_valid, pos, T).flip(1).cummin(dim=1)[0].flip(1)
+        has_prev = 0 <= prev_pos
+        has_next = next_pos < T
+
+        starts = torch.gather(x, 1, prev_pos.clamp(min=0))
+        ends = torch.gather(x, 1, next_pos.clamp(max=T - 1))
+        weights = (pos - prev_pos) / (next_pos - prev_pos).clamp(min=1)
+        y = torch.lerp(starts, ends, weights.to(x.dtype))
+
+        # Extrapolate leading and trailing magic numbers by the nearest value.
+        y = torch.where(has_next, y, starts)
+        y = torch.where(has_prev, y, ends)
+        y = torch.where(is_valid, x, y)
 
         if d == 1:
             y = y.view(-1)
@@ -17,8 +17,11 @@
 import torch
 from torch import nn
 
+from ..misc.cache import cached
 from ..misc.utils import check_size
+from ..misc.utils import fill_warping_matrix
 from ..misc.utils import hankel
+from ..misc.utils import iterate_until_convergence
 from ..misc.utils import symmetric_toeplitz
 from ..misc.utils import to
 from .freqt import FrequencyTransform
@@ -28,19 +31,22 @@ class CoefficientsFrequencyTransform(nn.Module):
     def __init__(self, in_order, out_order, alpha):
         super().__init__()
 
+        A = cached(
+            self._precompute, in_order, out_order, alpha, torch.get_default_dtype()
+        )
+        # Copy the cached matrix to protect it from in-place modification.
+        self.register_buffer("A", A.clone())
+
+    @staticmethod
+    def _precompute(in_order, out_order, alpha, dtype):
         L1 = in_order + 1
         L2 = out_order + 1
 
         # Make transform matrix.
         A = torch.zeros((L2, L1), dtype=torch.double)
         A[:, 0] = (-alpha) ** torch.arange(L2, dtype=torch.double)
-        for i in range(1, L2):
-            i1 = i - 1
-            for j in range(1, L1):
-                j1 = j - 1
-                A[i, j] = A[i1, j1] + alpha * (A[i, j1] - A[i1, j])
-
-        self.register_buffer("A", to(A.T))
+        A = fill_warping_matrix(A, alpha, 1)
+        return to(A.T, dtype=dtype)
 
     def forward(self, x):
         return torch.matmul(x, self.A)
@@ -65,17 +71,31 @@ class MelCepstralAnalysis(nn.Module):
     n_iter : int >= 0
         Number of iterations.
 
+    convergence_threshold : float >= 0
+        Convergence threshold on the relative change of the residual energy. The
+        iteration of each frame is stopped when the change is less than this value.
+        If zero, all frames are updated **n_iter** times.
+
     """
 
-    def __init__(self, cep_order, fft_length, alpha=0, n_iter=0):
+    def __init__(
+        self,
+        cep_order,
+        fft_length,
+        alpha=0,
+        n_iter=0,
+        convergence_threshold=0,
+    ):
         super().__init__()
 
         assert 0 <= cep_order <= fft_length // 2
         assert 0 <= n_iter
+        assert 0 <= convergence_threshold
 
         self.cep_order = cep_order
         self.fft_length = fft_length
         self.n_iter = n_iter
+        self.convergence_threshold = convergence_threshold
 
         self.freqt = FrequencyTransform(self.fft_length // 2, self.cep_order, alpha)
         self.ifreqt = FrequencyTransform(self.cep_order, self.fft_length // 2, -alpha)
@@ -86,7 +106,7 @@ class MelCepstralAnalysis(nn.Module):
         alpha_vector = (-alpha) ** torch.arange(self.cep_order + 1, dtype=torch.double)
         self.register_buffer("alpha_vector", to(alpha_vector))
 
-    def forward(self, x):
+    def forward(self, x, return_n_iter=False):
         """Estimate mel-cepstrum from spectrum.
 
         Parameters
@@ -94,11 +114,17 @@ class MelCepstralAnalysis(nn.Module):
         x : Tensor [shape=(..., L/2+1)]
             Power spectrum.
 
+        return_n_iter : bool
+            If True, return the number of iterations of each frame.
+
         Returns
         -------
         out : Tensor [shape=(..., M+1)]
             Mel-cepstrum.
 
+        n_iter : Tensor [shape=(...,)]
+            Number of iterations, returned only if **return_n_iter** is True.
+
         Examples
         --------
         >>> x = diffsptk.ramp(19)
@@ -120,7 +146,7 @@ class MelCepstralAnalysis(nn.Module):
         c[..., H] *= 0.5
         mc = self.freqt(c[..., : H + 1])
 
-        for _ in range(self.n_iter):
+        def step(log_x, mc):
             c = self.ifreqt(mc)
             d = torch.fft.rfft(c, n=self.fft_length).real
             d = torch.exp(log_x - d - d)
@@ -133,6 +159,19 @@ class MelCepstralAnalysis(nn.Module):
             R = symmetric_toeplitz(r)
             Q = hankel(rt)
             gradient = torch.linalg.solve(R + Q, ra)
-            mc = mc + gradient
+            return (mc + gradient,), r[..., 0]
+
+        # Only the frames that have not converged yet are updated.
+        batch_shape = x.shape[:-1]
+        (mc,), n_iter = iterate_until_convergence(
+            step,
+            log_x.reshape(-1, H + 1),
+            (mc.reshape(-1, M + 1),),
+            self.n_iter,
+            self.convergence_threshold,
+        )
 
+        mc = mc.reshape(*batch_shape, M + 1)
+        if return_n_iter:
+            return mc, n_iter.reshape(batch_shape)
         return mc
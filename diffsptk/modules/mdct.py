@@ -14,12 +14,14 @@
 # limitations under the License.                                           #
 # ------------------------------------------------------------------------ #
 
-import torch
 from torch import nn
 import torch.nn.functional as F
 
+from ..misc.cache import cached
 from ..misc.utils import check_size
-from ..misc.utils import to
+from ..misc.utils import precompute_trigonometric_transform
+from ..misc.utils import register_trigonometric_transform
+from ..misc.utils import trigonometric_transform
 from .frame import Frame
 from .window import Window
 
@@ -35,9 +37,12 @@ class ModifiedDiscreteCosineTransform(nn.Module):
     window : ['sine', 'vorbis', 'kbd', 'rectangular']
         Window type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long frame.
+
     """
 
-    def __init__(self, frame_length, window="sine", **kwargs):
+    def __init__(self, frame_length, window="sine", algorithm="auto", **kwargs):
         super().__init__()
 
         self.frame_period = frame_length // 2
@@ -45,7 +50,9 @@ class ModifiedDiscreteCosineTransform(nn.Module):
         self.mdct = nn.Sequential(
             Frame(frame_length, self.frame_period),
             Window(frame_length, window=window, norm="none"),
-            ModifiedDiscreteTransform(frame_length, window, **kwargs),
+            ModifiedDiscreteTransform(
+                frame_length, window, algorithm=algorithm, **kwargs
+            ),
         )
 
     def forward(self, x):
@@ -79,12 +86,12 @@ class ModifiedDiscreteCosineTransform(nn.Module):
         return self.mdct(x)
 
     @staticmethod
-    def _func(x, frame_length, window, **kwargs):
+    def _func(x, frame_length, window, algorithm="auto", **kwargs):
         frame_period = frame_length // 2
         x = F.pad(x, (0, frame_period))
         y = Frame._func(x, frame_length, frame_period, True, False)
         y = Window._func(y, None, window, "none")
-        y = ModifiedDiscreteTransform._func(y, window, **kwargs)
+        y = ModifiedDiscreteTransform._func(y, window, algorithm=algorithm, **kwargs)
         return y
 
 
@@ -102,16 +109,22 @@ class ModifiedDiscreteTransform(nn.Module):
     transform : ['cosine', 'sine']
         Transform type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long input.
+
     """
 
-    def __init__(self, length, window, transform="cosine"):
+    def __init__(self, length, window, transform="cosine", algorithm="auto"):
         super().__init__()
 
         assert 2 <= length
         assert length % 2 == 0
 
         self.length = length
-        self.register_buffer("W", self._precompute(length, window, transform))
+        W, u, v, self.fft_length = self._precompute(
+            length, window, transform, algorithm
+        )
+        register_trigonometric_transform(self, W, u, v)
 
     def forward(self, x):
         """Apply MDCT/MDST to input.
@@ -128,26 +141,36 @@ class ModifiedDiscreteTransform(nn.Module):
 
         """
         check_size(x.size(-1), self.length, "dimension of input")
-        return self._forward(x, self.W)
+        return self._forward(x, self.W, self.u, self.v, self.fft_length)
 
     @staticmethod
-    def _forward(x, W):
-        return torch.matmul(x, W)
+    def _forward(x, W, u, v, fft_length):
+        return trigonometric_transform(x, W, u, v, fft_length)
 
     @staticmethod
     def _func(x, window, **kwargs):
-        W = ModifiedDiscreteTransform._precompute(
-            x.size(-1), window, dtype=x.dtype, device=x.device, **kwargs
+        params = cached(
+            ModifiedDiscreteTransform._precompute,
+            x.size(-1),
+            window,
+            dtype=x.dtype,
+            device=x.device,
+            **kwargs,
         )
-        return ModifiedDiscreteTransform._forward(x, W)
+        return ModifiedDiscreteTransform._forward(x, *params)
 
     @staticmethod
-    def _precompute(length, window, transform="cosine", dtype=None, device=None):
+    def _precompute(
+        length,
+        window,
+        transform="cosine",
+        algorithm="auto",
+        inverse=False,
+        dtype=None,
+        device=None,
+    ):
         L2 = length
         L = L2 // 2
-        n = torch.arange(L2, dtype=torch.double, device=device) + 0.5
-        k = (torch.pi / L) * n[:L]
-        n += L / 2
 
         z = 2 / L
         if window != "rectangular" or window is True:
@@ -155,9 +178,26 @@ class ModifiedDiscreteTransform(nn.Module):
         z **= 0.5
 
         if transform == "cosine":
-            W = z * torch.cos(k.unsqueeze(0) * n.unsqueeze(1))
+            kernel = "cos"
         elif transform == "sine":
-            W = z * torch.sin(k.unsqueeze(0) * n.unsqueeze(1))
+            kernel = "sin"
         else:
             raise ValueError("transform must be either 'cosine' or 'sine'.")
-        return to(W, dtype=dtype)
+
+        # The time and frequency indices are swapped in the inverse transform.
+        params = [(L2, 0.5 + L / 2), (L, 0.5)]
+        if inverse:
+            params.reverse()
+        (in_length, in_offset), (out_length, out_offset) = params
+        return precompute_trigonometric_transform(
+            in_length,
+            out_length,
+            L2,
+            in_offset=in_offset,
+            out_offset=out_offset,
+            in_scale=z,
+            kernel=kernel,
+            algorithm=algorithm,
+            dtype=dtype,
+            device=device,
+        )
@@ -30,12 +30,15 @@ class ModifiedDiscreteSineTransform(nn.Module):
     window : ['sine', 'vorbis', 'kbd', 'rectangular']
         Window type.
 
+    algorithm : ['auto', 'dense', 'fft']
+        Algorithm. If 'auto', the FFT-based algorithm is used for long frame.
+
     """
 
-    def __init__(self, frame_length, window="sine"):
+    def __init__(self, frame_length, window="sine", algorithm="auto"):
         super().__init__()
 
-        self.mdst = MDST(frame_length, window, transform="sine")
+        self.mdst = MDST(frame_length, window, algorithm=algorithm, transform="sine")
 
     def forward(self, x):
         """Compute modified discrete sine transform.
@@ -66,5 +69,7 @@ class ModifiedDiscreteSineTransform(nn.Module):
         return self.mdst(x)
 
     @staticmethod
-    def _func(x, frame_length, window):
-        return MDST._func(x, frame_length, window, transform="sine")
+    def _func(x, frame_length, window, algorithm="auto"):
+        return MDST._func(
+            x, frame_length, window, algorithm=algorithm, transform="sine"
+        )
@@ -18,6 +18,7 @@ import torch
 from torch import nn
 import torch.nn.functional as F
 
+from ..misc.cache import cached
 from ..misc.utils import cexp
 from ..misc.utils import check_size
 from ..misc.utils import clog
@@ -254,7 +255,8 @@ class MelGeneralizedCepstrumToMelGeneralizedCepstrum(nn.Module):
         out_mul,
         n_fft,
     ):
-        seq = MelGeneralizedCepstrumToMelGeneralizedCepstrum._precompute(
+        seq = cached(
+            MelGeneralizedCepstrumToMelGeneralizedCepstrum._precompute,
             False,
             mc.size(-1) - 1,
             out_order,
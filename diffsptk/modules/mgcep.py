@@ -17,8 +17,11 @@
 import torch
 from torch import nn
 
+from ..misc.cache import cached
 from ..misc.utils import check_size
+from ..misc.utils import fill_warping_matrix
 from ..misc.utils import hankel
+from ..misc.utils import iterate_until_convergence
 from ..misc.utils import symmetric_toeplitz
 from ..misc.utils import to
 from .b2mc import MLSADigitalFilterCoefficientsToMelCepstrum
@@ -33,6 +36,14 @@ class CoefficientsFrequencyTransform(nn.Module):
     def __init__(self, in_order, out_order, alpha):
         super().__init__()
 
+        A = cached(
+            self._precompute, in_order, out_order, alpha, torch.get_default_dtype()
+        )
+        # Copy the cached matrix to protect it from in-place modification.
+        self.register_buffer("A", A.clone())
+
+    @staticmethod
+    def _precompute(in_order, out_order, alpha, dtype):
         beta = 1 - alpha * alpha
         L1 = in_order + 1
         L2 = out_order + 1
@@ -42,13 +53,8 @@ class CoefficientsFrequencyTransform(nn.Module):
         A[0, 0] = 1
         if 1 < L2 and 1 < L1:
             A[1, 1:] = alpha ** torch.arange(L1 - 1, dtype=torch.double) * beta
-        for i in range(2, L2):
-            i1 = i - 1
-            for j in range(1, L1):
-                j1 = j - 1
-                A[i, j] = A[i1, j1] + alpha * (A[i, j1] - A[i1, j])
-
-        self.register_buffer("A", to(A.T))
+        A = fill_warping_matrix(A, alpha, 2)
+        return to(A.T, dtype=dtype)
 
     def forward(self, x):
         y = torch.matmul(x, self.A)
@@ -114,22 +120,43 @@ class MelGeneralizedCepstralAnalysis(nn.Module):
     n_iter : int >= 0
         Number of iterations.
 
+    convergence_threshold : float >= 0
+        Convergence threshold on the relative change of the residual energy. The
+        iteration of each frame is stopped when the change is less than this value.
+        If zero, all frames are updated **n_iter** times.
+
     """
 
-    def __init__(self, cep_order, fft_length, alpha=0, gamma=0, n_iter=0):
+    def __init__(
+        self,
+        cep_order,
+        fft_length,
+        alpha=0,
+        gamma=0,
+        n_iter=0,
+        convergence_threshold=0,
+    ):
         super().__init__()
 
         assert 0 <= cep_order <= fft_length // 2
         assert gamma <= 0
         assert 0 <= n_iter
+        assert 0 <= convergence_threshold
 
         self.cep_order = cep_order
         self.fft_length = fft_length
         self.gamma = gamma
         self.n_iter = n_iter
+        self.convergence_threshold = convergence_threshold
 
         if gamma == 0:
-            self.mcep = MelCepstralAnalysis(cep_order, fft_length, alpha, n_iter=n_iter)
+            self.mcep = MelCepstralAnalysis(
+                cep_order,
+                fft_length,
+                alpha,
+                n_iter=n_iter,
+                convergence_threshold=convergence_threshold,
+            )
         else:
             self.cfreqt = CoefficientsFrequencyTransform(
                 cep_order, fft_length - 1, -alpha
@@ -159,7 +186,7 @@ class MelGeneralizedCepstralAnalysis(nn.Module):
                 MLSADigitalFilterCoefficientsToMelCepstrum(cep_order, alpha),
             )
 
-    def forward(self, x):
+    def forward(self, x, return_n_iter=False):
         """Estimate mel-generalized cepstrum from spectrum.
 
         Parameters
@@ -167,11 +194,17 @@ class MelGeneralizedCepstralAnalysis(nn.Module):
         x : Tensor [shape=(..., L/2+1)]
             Power spectrum.
 
+        return_n_iter : bool
+            If True, return the number of iterations of each frame.
+
         Returns
         -------
         out : Tensor [shape=(..., M+1)]
             Mel-generalized cepstrum.
 
+        n_iter : Tensor [shape=(...,)]
+            Number of iterations, returned only if **return_n_iter** is True.
+
         Examples
         --------
         >>> x = diffsptk.ramp(19)
@@ -184,14 +217,13 @@ class MelGeneralizedCepstralAnalysis(nn.Module):
 
         """
         if self.gamma == 0:
-            mc = self.mcep(x)
-            return mc
+            return self.mcep(x, return_n_iter=return_n_iter)
 
         M = self.cep_order
         H = self.fft_length // 2
         check_size(x.size(-1), H + 1, "dimension of spectrum")
 
-        def newton(gamma, b1):
+        def newton(gamma, x, b1):
             def epsilon(gamma, r, b):
                 eps = r[..., 0] + gamma * (r[..., 1:] * b).sum(-1)
                 return eps
@@ -249,15 +281,35 @@ class MelGeneralizedCepstralAnalysis(nn.Module):
             return b0, b1
 
         b1 = torch.zeros(*x.shape[:-1], M, device=x.device)
-        b0, b1 = newton(-1, b1)
+        b0, b1 = newton(-1, x, b1)
+
+        batch_shape = x.shape[:-1]
+        n_iter = torch.zeros(batch_shape, dtype=torch.long, device=x.device)
 
         if self.gamma != -1:
             b = torch.cat((b0, b1), dim=-1)
             b = self.b2b(b)
             _, b1 = torch.split(b, [1, M], dim=-1)
-            for _ in range(self.n_iter):
-                b0, b1 = newton(self.gamma, b1)
+
+            def step(x, b0, b1):
+                b0, b1 = newton(self.gamma, x, b1)
+                return (b0, b1), b0[..., 0] ** 2
+
+            # Only the frames that have not converged yet are updated.
+            (b0, b1), n_iter = iterate_until_convergence(
+                step,
+                x.reshape(-1, H + 1),
+                (b0.reshape(-1, 1), b1.reshape(-1, M)),
+                self.n_iter,
+                self.convergence_threshold,
+            )
+
+            b0 = b0.reshape(*batch_shape, 1)
+            b1 = b1.reshape(*batch_shape, M)
+            n_iter = n_iter.reshape(batch_shape)
 
         b = torch.cat((b0, b1), dim=-1)
         mc = self.b2mc(b)
+        if return_n_iter:
+            return mc, n_iter
         return mc
@@ -14,13 +14,19 @@
 # limitations under the License.                                           #
 # ------------------------------------------------------------------------ #
 
+from abc import ABC
+from abc import abstractmethod
+import math
+
 import torch
 from torch import nn
 
 from ..misc.utils import Lambda
 from ..misc.utils import check_size
 from ..misc.utils import get_gamma
+from ..misc.utils import next_power_of_two
 from ..misc.utils import remove_gain
+from ..misc.utils import time_varying_fir
 from .b2mc import MLSADigitalFilterCoefficientsToMelCepstrum
 from .gnorm import GeneralizedCepstrumGainNormalization
 from .istft import InverseShortTimeFourierTransform
@@ -55,6 +61,69 @@ def mirror(x, half=False):
     return y
 
 
+def frame_wise_fir(x, H, frame_period, filter_length):
+    """Apply a time-varying FIR filter whose coefficients are linearly interpolated
+    between frames using frame-wise overlap-save convolution.
+
+    Parameters
+    ----------
+    x : Tensor [shape=(..., T+L-1)]
+        Padded input signal.
+
+    H : tuple[Tensor, Tensor] [shape=(..., T/P, N/2+1)]
+        Spectra of the filters at the current and the next frames.
+
+    frame_period : int >= 1
+        Frame period, :math:`P`.
+
+    filter_length : int >= 1
+        Length of filter, :math:`L`.
+
+    Returns
+    -------
+    out : Tensor [shape=(..., T)]
+        Output signal.
+
+    """
+    P = frame_period
+    L = filter_length
+    n_fft = 2 * (H[0].size(-1) - 1)
+    # Output samples of each frame depend on P+L-1 input samples, so the circular
+    # aliasing of the FFT does not affect them if N >= P+L-1.
+    x = x.unfold(-1, P + L - 1, P)
+    X = torch.fft.rfft(x, n=n_fft)
+    y0 = torch.fft.irfft(X * H[0], n=n_fft)[..., L - 1 : L - 1 + P]
+    y1 = torch.fft.irfft(X * H[1], n=n_fft)[..., L - 1 : L - 1 + P]
+    # The output of the filter is linear in its coefficients, so the interpolation
+    # of the coefficients is equivalent to that of the outputs.
+    w = torch.arange(P, dtype=y0.dtype, device=y0.device) / P
+    y = y0 + w * (y1 - y0)
+    y = y.flatten(-2)
+    return y
+
+
+def frame_wise_spectrum(h, fft_length=None):
+    """Compute the spectra used in :func:`frame_wise_fir`.
+
+    Parameters
+    ----------
+    h : Tensor [shape=(..., T/P, L)]
+        Frame-wise filter coefficients applied as a correlation.
+
+    fft_length : int >= P+L-1
+        Number of FFT bins, :math:`N`.
+
+    Returns
+    -------
+    out : tuple[Tensor, Tensor] [shape=(..., T/P, N/2+1)]
+        Spectra of the filters at the current and the next frames.
+
+    """
+    H0 = torch.fft.rfft(h.flip(-1), n=fft_length)
+    H1 = torch.cat((H0[..., 1:, :], H0[..., -1:, :]), dim=-2)
+    return H0, H1
+
+
 class PseudoMGLSADigitalFilter(nn.Module):
     """See `this page <https://sp-nitech.github.io/sptk/latest/main/mglsadf.html>`_
     for details.
@@ -94,12 +163,26 @@ class PseudoMGLSADigitalFilter(nn.Module):
     cep_order : int >= 0
         Order of linear cepstrum (valid only if **mode** is 'multi-stage').
 
+    algorithm : ['direct', 'fft']
+        Algorithm of time-varying FIR filtering (valid only if **mode** is
+        'multi-stage'). 'direct' convolves each frame with the filters at the
+        current and the next frames in the time domain. 'fft' performs frame-wise
+        overlap-save convolution. Both interpolate the outputs instead of the
+        coefficients, so that their memory usage does not grow with the product of
+        the filter length and the signal length.
+
     ir_length : int >= 1
         Length of impulse response (valid only if **mode** is 'single-stage').
 
     n_fft : int >= 1
         Number of FFT bins for conversion (valid only if **mode** is 'single-stage').
 
+    chunk_length : int >= 1 or None
+        Number of frames filtered at once (valid only if **mode** is 'single-stage').
+        If given, the waveform is processed chunk by chunk so that the peak memory is
+        determined by the chunk length instead of the sequence length. If None, all
+        frames are filtered at once.
+
     **kwargs : additional keyword arguments
         See :func:`~diffsptk.ShortTimeFourierTransform` (valid only if **mode** is
         'freq-domain').
@@ -164,6 +247,10 @@ class PseudoMGLSADigitalFilter(nn.Module):
         else:
             raise ValueError(f"mode {mode} is not supported.")
 
+        # Number of frames to be given before the output of a frame is ready.
+        right = self.mglsadf.receptive_field[1]
+        self.lookahead = math.ceil(right / frame_period) + 1
+
     def forward(self, x, mc):
         """Apply an MGLSA digital filter.
 
@@ -200,8 +287,244 @@ class PseudoMGLSADigitalFilter(nn.Module):
         y = self.mglsadf(x, mc)
         return y
 
+    def init_state(self):
+        """Initialize the state of streaming filtering.
+
+        Returns
+        -------
+        out : dict
+            Initial state.
+
+        """
+        return self.mglsadf.init_state()
+
+    def process(self, x, mc, state):
+        """Apply an MGLSA digital filter to a chunk of streaming input.
+
+        The output of each frame is the same as that of :func:`forward` and is emitted
+        once the following **lookahead** frames have been given, which is the
+        latency of the streaming filtering.
+
+        Parameters
+        ----------
+        x : Tensor [shape=(..., NxP)]
+            Chunk of excitation signal.
+
+        mc : Tensor [shape=(..., N, M+1)]
+            Chunk of mel-generalized cepstrum.
+
+        state : dict
+            State returned by :func:`init_state` or the previous call.
+
+        Returns
+        -------
+        out : Tensor [shape=(..., N'xP)]
+            Output signal of the frames that have become ready.
+
+        state : dict
+            Updated state.
+
+        Examples
+        --------
+        >>> M = 4
+        >>> x = diffsptk.step(3)
+        >>> mc = diffsptk.nrand(2, M)
+        >>> mglsadf = diffsptk.MLSA(M, frame_period=2)
+        >>> state = mglsadf.init_state()
+        >>> y1, state = mglsadf.process(x[:2], mc[:1], state)
+        >>> y2, state = mglsadf.process(x[2:], mc[1:], state)
+        >>> y3 = mglsadf.flush(state)
+        >>> y = torch.cat([y1, y2, y3])
+        >>> torch.allclose(y, mglsadf(x, mc))
+        True
+
+        """
+        check_size(mc.size(-1), self.filter_order + 1, "dimension of mel-cepstrum")
+        check_size(x.size(-1), mc.size(-2) * self.frame_period, "sequence length")
+
+        return self.mglsadf.process(x, mc, state)
+
+    def flush(self, state):
+        """Output the remaining frames of streaming input.
+
+        Parameters
+        ----------
+        state : dict
+            State returned by :func:`process`.
+
+        Returns
+        -------
+        out : Tensor [shape=(..., N'xP)]
+            Output signal of the remaining frames.
+
+        """
+        return self.mglsadf.flush(state)
+
+
+class TimeVaryingFIRFilter(nn.Module, ABC):
+    """Base class of the filters that cascade time-varying FIR filters.
+
+    A subclass defines **padding**, the number of samples required before and after
+    each stage, and **n_stage**, and implements :func:`_coefficients`, :func:`_stage`,
+    and :func:`_output`. The streaming filtering carries the output signal of every
+    stage so that each sample of each stage is computed only once.
+
+    """
+
+    def init_state(self):
+        return {"u": None}
+
+    def process(self, x, mc, state):
+        return self._stream(x, mc, state)
+
+    def flush(self, state):
+        if state["u"] is None:
+            ref = next(self.buffers(), None)
+            return torch.empty(0) if ref is None else ref.new_empty(0)
+        y, _ = self._stream(None, None, state)
+        return y
+
+    @abstractmethod
+    def _coefficients(self, mc):
+        """Compute filter coefficients.
+
+        Parameters
+        ----------
+        mc : Tensor [shape=(..., T/P, M+1)]
+            Mel-cepstral coefficients.
+
+        Returns
+        -------
+        c : Tensor [shape=(..., T/P, L)]
+            Filter coefficients of each frame.
+
+        g : Tensor [shape=(..., T/P, 1)] or None
+            Gain of each frame.
+
+        """
+
+    @abstractmethod
+    def _stage(self, x, c, a):
+        """Compute output signal of a stage.
+
+        Parameters
+        ----------
+        x : Tensor [shape=(..., N*P+padding)]
+            Input signal of the stage including the padded samples.
+
+        c : Tensor [shape=(..., N+1, L)]
+            Filter coefficients of the frames.
+
+        a : int >= 1
+            Index of the stage.
+
+        Returns
+        -------
+        out : Tensor [shape=(..., N*P)]
+            Output signal of the stage.
+
+        """
 
-class MultiStageFIRFilter(nn.Module):
+    @abstractmethod
+    def _output(self, u, g):
+        """Compute final output signal.
+
+        Parameters
+        ----------
+        u : list[Tensor [shape=(..., T)]]
+            Input signal and output signals of all the stages.
+
+        g : Tensor [shape=(..., T/P+1, 1)] or None
+            Gain of each frame.
+
+        Returns
+        -------
+        out : Tensor [shape=(..., T)]
+            Output signal.
+
+        """
+
+    def _stream(self, x, mc, state):
+        P = self.frame_period
+        left, right = self.padding
+        K = self.n_stage
+        final = x is None
+
+        if state["u"] is None:
+            c, g = self._coefficients(mc)
+            batch_size = torch.broadcast_shapes(x.shape[:-1], c.shape[:-2])
+            # The signals of all the stages are given by (stage, start sample) and
+            # begin with the zeros padded before the first sample.
+            u = [x.new_zeros(batch_size + (left,))] * (K + 1)
+            begin = [-left] * (K + 1)
+            frame = n_frame = emitted = 0
+        else:
+            u = list(state["u"])
+            begin = list(state["begin"])
+            c, g = state["c"], state["g"]
+            frame = state["frame"]
+            n_frame = state["n_frame"]
+            emitted = state["emitted"]
+            if not final:
+                c_new, g_new = self._coefficients(mc)
+                c = torch.cat((c, c_new), dim=-2)
+                if g is not None:
+                    g = torch.cat((g, g_new), dim=-2)
+
+        if not final:
+            u[0] = torch.cat((u[0], x.expand(u[0].shape[:-1] + x.shape[-1:])), dim=-1)
+            n_frame += mc.size(-2)
+
+        def end_of(a):
+            return begin[a] + u[a].size(-1)
+
+        # Compute the frames of each stage whose input samples are available. The next
+        # frame is needed to interpolate the coefficients of the last frame.
+        for a in range(1, K + 1):
+            s = end_of(a) // P
+            if final:
+                e = n_frame
+            else:
+                e = min((end_of(a - 1) - right) // P, n_frame - 1)
+            if e <= s:
+                continue
+            v = u[a - 1][..., s * P - left - begin[a - 1] :]
+            if final:
+                v = nn.functional.pad(v, (0, right))
+            v = v[..., : (e - s) * P + left + right]
+            y = self._stage(v, c[..., s - frame : e + 1 - frame, :], a)
+            u[a] = torch.cat((u[a], y), dim=-1)
+
+        E = min(end_of(K), (n_frame if final else n_frame - 1) * P)
+        E = max(E, emitted)
+        if E == emitted:
+            y = u[K][..., :0]
+        else:
+            ys = [u[a][..., emitted - begin[a] : E - begin[a]] for a in range(K + 1)]
+            gs = g
+            if g is not None:
+                gs = g[..., emitted // P - frame : E // P + 1 - frame, :]
+            y = self._output(ys, gs)
+
+        # Keep the samples needed to compute the following frames.
+        for a in range(K + 1):
+            keep = E if a == K else min(end_of(a + 1) - left, E)
+            u[a] = u[a][..., keep - begin[a] :]
+            begin[a] = keep
+        drop = E // P - frame
+        state = {
+            "u": u,
+            "begin": begin,
+            "c": c[..., drop:, :],
+            "g": None if g is None else g[..., drop:, :],
+            "frame": frame + drop,
+            "n_frame": n_frame,
+            "emitted": E,
+        }
+        return y, state
+
+
+class MultiStageFIRFilter(TimeVaryingFIRFilter):
     def __init__(
         self,
         filter_order,
@@ -213,6 +536,7 @@ class MultiStageFIRFilter(nn.Module):
         phase="minimum",
         taylor_order=20,
         cep_order=199,
+        algorithm="direct",
     ):
         super().__init__()
 
@@ -221,18 +545,36 @@ class MultiStageFIRFilter(nn.Module):
         self.ignore_gain = ignore_gain
         self.phase = phase
         self.taylor_order = taylor_order
+        self.frame_period = frame_period
+        self.algorithm = algorithm
 
         if alpha == 0 and gamma == 0:
             cep_order = filter_order
 
+        delay = taylor_order * cep_order
+        self.receptive_field = (
+            0 if phase == "maximum" else delay,
+            0 if phase == "minimum" else delay,
+        )
+
+        if self.algorithm == "direct":
+            pass
+        elif self.algorithm == "fft":
+            filter_length = 2 * cep_order + 1 if phase == "zero" else cep_order + 1
+            self.fft_length = next_power_of_two(frame_period + filter_length - 1)
+        else:
+            raise ValueError(f"algorithm {algorithm} is not supported.")
+
         if self.phase == "minimum":
-            self.pad = nn.ConstantPad1d((cep_order, 0), 0)
+            self.padding = (cep_order, 0)
         elif self.phase == "maximum":
-            self.pad = nn.ConstantPad1d((0, cep_order), 0)
+            self.padding = (0, cep_order)
         elif self.phase == "zero":
-            self.pad = nn.ConstantPad1d((cep_order, cep_order), 0)
+            self.padding = (cep_order, cep_order)
         else:
             raise ValueError(f"phase {phase} is not supported.")
+        self.pad = nn.ConstantPad1d(self.padding, 0)
+        self.n_stage = taylor_order
 
         self.mgc2c = MelGeneralizedCepstrumToMelGeneralizedCepstrum(
             filter_order,
@@ -243,6 +585,32 @@ class MultiStageFIRFilter(nn.Module):
         self.linear_intpl = LinearInterpolation(frame_period)
 
     def forward(self, x, mc):
+        c, c0 = self._coefficients(mc)
+
+        if self.algorithm == "direct":
+            y = x.clone()
+            for a in range(1, self.taylor_order + 1):
+                x = self.pad(x)
+                x = time_varying_fir(x, c, self.frame_period) / a
+                y += x
+        elif self.algorithm == "fft":
+            L = c.size(-1)
+            H = frame_wise_spectrum(c, self.fft_length)
+
+            y = x.clone()
+            for a in range(1, self.taylor_order + 1):
+                x = self.pad(x)
+                x = frame_wise_fir(x, H, self.frame_period, L) / a
+                y += x
+        else:
+            raise RuntimeError
+
+        if not self.ignore_gain:
+            K = torch.exp(self.linear_intpl(c0))
+            y *= K.squeeze(-1)
+        return y
+
+    def _coefficients(self, mc):
         c = self.mgc2c(mc)
         c0, c = remove_gain(c, value=0, return_gain=True)
 
@@ -254,23 +622,32 @@ class MultiStageFIRFilter(nn.Module):
             c = mirror(c, half=True)
         else:
             raise RuntimeError
-
-        c = self.linear_intpl(c)
-
-        y = x.clone()
-        for a in range(1, self.taylor_order + 1):
-            x = self.pad(x)
-            x = x.unfold(-1, c.size(-1), 1)
-            x = (x * c).sum(-1) / a
-            y += x
-
-        if not self.ignore_gain:
-            K = torch.exp(self.linear_intpl(c0))
-            y *= K.squeeze(-1)
+        return c, None if self.ignore_gain else c0
+
+    def _stage(self, x, c, a):
+        if self.algorithm == "direct":
+            x = time_varying_fir(x, c, self.frame_period)
+        elif self.algorithm == "fft":
+            L = c.size(-1)
+            N = (x.size(-1) - L + 1) // self.frame_period
+            H0, H1 = frame_wise_spectrum(c, self.fft_length)
+            H = (H0[..., :N, :], H1[..., :N, :])
+            x = frame_wise_fir(x, H, self.frame_period, L)
+        else:
+            raise RuntimeError
+        return x / a
+
+    def _output(self, u, g):
+        y = u[0]
+        for x in u[1:]:
+            y = y + x
+        if g is not None:
+            K = torch.exp(self.linear_intpl(g))
+            y = y * K[..., : y.size(-1), 0]
         return y
 
 
-class SingleStageFIRFilter(nn.Module):
+class SingleStageFIRFilter(TimeVaryingFIRFilter):
     def __init__(
         self,
         filter_order,
@@ -282,21 +659,33 @@ class SingleStageFIRFilter(nn.Module):
         phase="minimum",
         ir_length=2000,
         n_fft=4096,
+        chunk_length=None,
     ):
         super().__init__()
 
+        assert chunk_length is None or 1 <= chunk_length
+
         self.ignore_gain = ignore_gain
         self.phase = phase
+        self.frame_period = frame_period
+        self.chunk_length = chunk_length
 
         taps = ir_length - 1
+        self.receptive_field = (
+            0 if phase == "maximum" else taps,
+            0 if phase == "minimum" else taps,
+        )
+
         if self.phase == "minimum":
-            self.pad = nn.ConstantPad1d((taps, 0), 0)
+            self.padding = (taps, 0)
         elif self.phase == "maximum":
-            self.pad = nn.ConstantPad1d((0, taps), 0)
+            self.padding = (0, taps)
         elif self.phase == "zero":
-            self.pad = nn.ConstantPad1d((taps, taps), 0)
+            self.padding = (taps, taps)
         else:
             raise ValueError(f"phase {phase} is not supported.")
+        self.pad = nn.ConstantPad1d(self.padding, 0)
+        self.n_stage = 1
 
         if self.phase in ["minimum", "maximum"]:
             self.mgc2ir = MelGeneralizedCepstrumToMelGeneralizedCepstrum(
@@ -323,6 +712,34 @@ class SingleStageFIRFilter(nn.Module):
         self.linear_intpl = LinearInterpolation(frame_period)
 
     def forward(self, x, mc):
+        h = self._impulse_response(mc)
+
+        x = self.pad(x)
+        if self.chunk_length is None:
+            return self._filter(x, h)
+
+        # Filter each chunk using the padded input overlapped with the previous chunk,
+        # which plays the role of the filter state.
+        P = self.frame_period
+        L = h.size(-1)
+        N = h.size(-2)
+        y = []
+        for s in range(0, N, self.chunk_length):
+            e = min(s + self.chunk_length, N)
+            # Include the next frame to interpolate the last frame of the chunk.
+            y.append(self._filter(x[..., s * P : e * P + L - 1], h[..., s : e + 1, :]))
+        y = torch.cat(y, dim=-1)
+        return y
+
+    def _filter(self, x, h):
+        y = time_varying_fir(x, h, self.frame_period)
+        K = self._gain(h)
+        if K is not None:
+            K = self.linear_intpl(K)[..., : y.size(-1), 0]
+            y = y / K
+        return y
+
+    def _impulse_response(self, mc):
         if self.phase == "zero":
             c = self.mgc2c(mc)
             c[..., 1:] *= 0.5
@@ -340,22 +757,30 @@ class SingleStageFIRFilter(nn.Module):
             h = mirror(h)
         else:
             raise RuntimeError
+        return h
 
-        h = self.linear_intpl(h)
+    def _gain(self, h):
+        if not self.ignore_gain or self.phase == "zero":
+            return None
+        if self.phase == "minimum":
+            return h[..., -1:]
+        elif self.phase == "maximum":
+            return h[..., :1]
+        else:
+            raise RuntimeError
 
-        if self.ignore_gain:
-            if self.phase == "minimum":
-                h = h / h[..., -1:]
-            elif self.phase == "maximum":
-                h = h / h[..., :1]
-            elif self.phase == "zero":
-                pass
-            else:
-                raise RuntimeError
+    def _coefficients(self, mc):
+        h = self._impulse_response(mc)
+        return h, self._gain(h)
 
-        x = self.pad(x)
-        x = x.unfold(-1, h.size(-1), 1)
-        y = (x * h).sum(-1)
+    def _stage(self, x, h, a):
+        return time_varying_fir(x, h, self.frame_period)
+
+    def _output(self, u, g):
+        y = u[1]
+        if g is not None:
+            K = self.linear_intpl(g)[..., : y.size(-1), 0]
+            y = y / K
         return y
 
 
@@ -379,6 +804,12 @@ class FrequencyDomainFIRFilter(nn.Module):
         assert 2 * frame_period < frame_length
 
         self.ignore_gain = ignore_gain
+        self.frame_period = frame_period
+        self.receptive_field = (frame_length, frame_length)
+
+        # Number of frames required before and after the frames to be output.
+        self.context = math.ceil(frame_length / frame_period)
+        self.lookahead = self.context + 1
 
         if self.ignore_gain:
             self.gnorm = GeneralizedCepstrumGainNormalization(filter_order, gamma=gamma)
@@ -416,3 +847,39 @@ class FrequencyDomainFIRFilter(nn.Module):
         Y = H * X
         y = self.istft(Y, out_length=x.size(-1))
         return y
+
+    def init_state(self):
+        return {"x": None, "mc": None, "offset": 0}
+
+    def process(self, x, mc, state):
+        # The spectra of all the frames overlapping with the output frames are
+        # recomputed, so only the frames within the receptive field are kept.
+        if state["x"] is not None:
+            x = torch.cat((state["x"], x), dim=-1)
+            mc = torch.cat((state["mc"], mc), dim=-2)
+
+        start = state["offset"]
+        end = max(start, mc.size(-2) - self.lookahead)
+        y = self._process(x, mc, start, end)
+
+        begin = max(0, end - self.context)
+        state = {
+            "x": x[..., begin * self.frame_period :],
+            "mc": mc[..., begin:, :],
+            "offset": end - begin,
+        }
+        return y, state
+
+    def flush(self, state):
+        if state["x"] is None:
+            ref = next(self.buffers(), None)
+            return torch.empty(0) if ref is None else ref.new_empty(0)
+        return self._process(state["x"], state["mc"], state["offset"], None)
+
+    def _process(self, x, mc, start, end):
+        if start == end:
+            return x[..., :0]
+        y = self.forward(x, mc)
+        P = self.frame_period
+        y = y[..., start * P : None if end is None else end * P]
+        return y
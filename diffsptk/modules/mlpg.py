@@ -16,15 +16,18 @@
 
 import torch
 from torch import nn
+import torch.nn.functional as F
 
+from ..misc.cache import cached
 from ..misc.utils import check_size
+from ..misc.utils import solve_block_tridiagonal
 from ..misc.utils import to
 from .delta import Delta
 
 
 class MaximumLikelihoodParameterGeneration(nn.Module):
     """See `this page <https://sp-nitech.github.io/sptk/latest/main/mlpg.html>`_
-    for details. Currently, only global unit variance is supported.
+    for details.
 
     Parameters
     ----------
@@ -34,18 +37,34 @@ class MaximumLikelihoodParameterGeneration(nn.Module):
     seed : list[list[float]] or list[int]
         Delta coefficients or width(s) of 1st (and 2nd) regression coefficients.
 
+    algorithm : ['dense', 'banded']
+        Algorithm to solve the linear system. 'dense' multiplies the precomputed
+        inverse matrix, which requires :math:`O(T^2)` memory. 'banded' exploits the
+        band structure of the system and solves it by the block cyclic reduction,
+        which requires :math:`O(T)` memory and is suitable for long sequences.
+
     """
 
-    def __init__(self, size, seed=[[-0.5, 0, 0.5], [1, -2, 1]]):
+    def __init__(self, size, seed=[[-0.5, 0, 0.5], [1, -2, 1]], algorithm="dense"):
         super().__init__()
 
         assert 1 <= size
 
+        if algorithm not in ("dense", "banded"):
+            raise ValueError(f"algorithm {algorithm} is not supported.")
+
         self.size = size
+        self.algorithm = algorithm
 
-        self.register_buffer("M", self._precompute(size, seed))
+        window, th, M = self._precompute(size, seed, algorithm)
+        self.register_buffer("window", window, persistent=False)
+        self.register_buffer("th", th, persistent=False)
+        if algorithm == "dense":
+            self.register_buffer("M", M)
+        else:
+            self.M = None
 
-    def forward(self, u):
+    def forward(self, u, v=None):
         """Perform MLPG to obtain smoothed static sequence.
 
         Parameters
@@ -53,6 +72,10 @@ class MaximumLikelihoodParameterGeneration(nn.Module):
         u : Tensor [shape=(..., T, DxH)]
             Time-variant mean vectors with delta components.
 
+        v : Tensor [shape=(..., T, DxH)] or None
+            Time-variant variance vectors with delta components. If None, unit
+            variance is assumed.
+
         Returns
         -------
         out : Tensor [shape=(..., T, D)]
@@ -83,25 +106,101 @@ class MaximumLikelihoodParameterGeneration(nn.Module):
 
         """
         check_size(u.size(-2), self.size, "length of input")
-        return self._forward(u, self.M)
+        if v is not None:
+            check_size(v.size(-1), u.size(-1), "dimension of variance")
+        return self._forward(u, v, self.window, self.th, self.M)
 
     @staticmethod
-    def _forward(mean, M):
+    def _forward(mean, var, window, th, M):
         T = mean.size(-2)
-        H = M.size(-1) // T
+        H = window.size(0)
         u = mean.reshape(*mean.shape[:-2], T * H, -1)
-        c = torch.einsum("...Td,tT->...td", u, M)
+
+        if M is None:
+            return MaximumLikelihoodParameterGeneration._solve_banded(
+                u, var, window, th
+            )
+
+        if var is None:
+            c = torch.einsum("...Td,tT->...td", u, M)
+            return c
+
+        # Solve the system for each dimension.
+        W = MaximumLikelihoodParameterGeneration._window_matrix(window, th, T)
+        s = 1 / var.reshape(u.shape)
+        WSW = torch.einsum("Tt,...Td,Ts->...dts", W, s, W)
+        WSu = torch.einsum("Tt,...Td->...dt", W, s * u)
+        c = torch.linalg.solve(WSW, WSu).mT
+        return c
+
+    @staticmethod
+    def _solve_banded(u, var, window, th):
+        H, L = window.shape
+        N = (L - 1) // 2
+        T = u.size(-2) // H
+        u = u.unflatten(-2, (T, H))  # (..., T, H, D)
+
+        # Remove the rows of the window matrix at the edges.
+        t = torch.arange(T, device=u.device).unsqueeze(-1)
+        mask = (th <= t) & (th < T - t)  # (T, H)
+        s = mask.unsqueeze(-1).to(u.dtype)
+        if var is not None:
+            s = s / var.reshape(u.shape)
+        su = s * u
+
+        # Compute the upper band of W^T S W and W^T S u.
+        P = u.new_zeros(*u.shape[:-3], T, 2 * N + 1, u.size(-1))
+        b = u.new_zeros(*u.shape[:-3], T, u.size(-1))
+        for k1 in range(L):
+            t0 = max(0, N - k1)
+            t1 = min(T, T + N - k1)
+            if t1 <= t0:
+                continue
+            wsu = torch.einsum("h,...thd->...td", window[:, k1], su[..., t0:t1, :, :])
+            b[..., t0 + k1 - N : t1 + k1 - N, :] += wsu
+            for k2 in range(k1, L):
+                t1 = min(T, T + N - k2)
+                if t1 <= t0:
+                    continue
+                ww = window[:, k1] * window[:, k2]
+                wsw = torch.einsum("h,...thd->...td", ww, s[..., t0:t1, :, :])
+                P[..., t0 + k1 - N : t1 + k1 - N, k2 - k1, :] += wsw
+
+        # Convert the band matrix into a block tridiagonal one.
+        K = max(2 * N, 1)
+        n = (T + K - 1) // K
+        P = F.pad(P.movedim(-1, -3), (0, 2 * K - (2 * N + 1), 0, n * K - T))
+        P[..., T:, 0] = 1
+        b = F.pad(b.movedim(-1, -2), (0, n * K - T))
+
+        i = torch.arange(n, device=u.device).view(-1, 1, 1)
+        r = torch.arange(K, device=u.device).view(-1, 1)
+        c = torch.arange(K, device=u.device)
+        D_index = (i * K + torch.minimum(r, c)) * (2 * K) + (r - c).abs()
+        L_index = ((i - 1) * K + c).clamp(min=0) * (2 * K) + (K + r - c)
+        P = P.flatten(-2)
+        D = P[..., D_index]
+        L = P[..., L_index]
+
+        # Solve the system for each dimension.
+        x = solve_block_tridiagonal(D, L, b.unflatten(-1, (n, K)).unsqueeze(-1))
+        c = x.flatten(-3)[..., :T].mT
         return c
 
     @staticmethod
-    def _func(u, seed):
-        M = MaximumLikelihoodParameterGeneration._precompute(
-            u.size(-2), seed, dtype=u.dtype, device=u.device
+    def _func(u, v, seed, algorithm):
+        const = cached(
+            MaximumLikelihoodParameterGeneration._precompute,
+            u.size(-2),
+            seed,
+            algorithm,
+            dtype=u.dtype,
+            device=u.device,
         )
-        return MaximumLikelihoodParameterGeneration._forward(u, M)
+        return MaximumLikelihoodParameterGeneration._forward(u, v, *const)
 
     @staticmethod
-    def _precompute(size, seed, dtype=None, device=None):
+    def _precompute(size, seed, algorithm, dtype=None, device=None):
         # Make window.
         window = Delta._precompute(seed, True, dtype=torch.double, device=device)
 
@@ -110,28 +209,31 @@ class MaximumLikelihoodParameterGeneration(nn.Module):
             th = [0] + [len(coefficients) // 2 for coefficients in seed]
         else:
             th = [0] + list(seed)
-        th = torch.tensor(th, dtype=torch.double, device=device).unsqueeze(1)
+        th = torch.tensor(th, device=device)
 
-        H, L = window.shape
-        N = (L - 1) // 2
-        T = size
-        W = torch.zeros((T * H, T), dtype=torch.double, device=device)
-
-        # Make window matrix
-        for t in range(T):
-            hs = H * t
-            he = hs + H
-            ts = t - N
-            te = ts + L
-            if ts < 0:
-                W[hs:he, :te] = window[:, -ts:] * (th <= t)
-            elif T < te:
-                W[hs:he, ts:] = window[:, : T - ts] * (th < T - t)
-            else:
-                W[hs:he, ts:te] = window
+        if algorithm == "banded":
+            return to(window, dtype=dtype), th, None
 
+        W = MaximumLikelihoodParameterGeneration._window_matrix(window, th, size)
         WS = W.T  # Assume unit variance.
         WSW = torch.matmul(WS, W)
         WSW = torch.linalg.inv(WSW)
         M = torch.matmul(WSW, WS)  # (T, TxH)
-        return to(M, dtype=dtype)
+        return to(window, dtype=dtype), th, to(M, dtype=dtype)
+
+    @staticmethod
+    def _window_matrix(window, th, size):
+        H, L = window.shape
+        N = (L - 1) // 2
+        T = size
+
+        # Make window matrix, whose rows at the edges are removed if the window does
+        # not fit in the sequence.
+        t = torch.arange(T, device=window.device)
+        k = t - t.unsqueeze(-1) + N  # (T, T)
+        W = window[:, k.clamp(0, L - 1)] * ((0 <= k) & (k < L))  # (H, T, T)
+        th = th.unsqueeze(-1)
+        mask = (th <= t) & (th < T - t)  # (H, T)
+        W = W * mask.unsqueeze(-1)
+        W = W.transpose(0, 1).reshape(T * H, T)
+        return W
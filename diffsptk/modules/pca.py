@@ -16,13 +16,15 @@
 
 import torch
 from torch import nn
+from tqdm import tqdm
 
 from ..misc.utils import check_size
 
 
 class PrincipalComponentAnalysis(nn.Module):
     """See `this page <https://sp-nitech.github.io/sptk/latest/main/pca.html>`_
-    for details.
+    for details. The statistics are accumulated in a streaming manner, so that
+    the input can be a DataLoader yielding a huge number of vectors.
 
     Parameters
     ----------
@@ -38,39 +40,72 @@ class PrincipalComponentAnalysis(nn.Module):
     sort : ['ascending', 'descending']
         Order of eigenvalues and eigenvectors.
 
+    solver : ['eigh', 'randomized']
+        Eigen solver. 'randomized' computes only the top-:math:`N` eigenpairs by
+        the randomized subspace iteration, which is fast for high-dimensional input.
+
+    batch_size : int >= 1 or None
+        Batch size.
+
+    verbose : bool
+        If True, show progress bar.
+
     """
 
-    def __init__(self, order, n_comp, cov_type="sample", sort="descending"):
+    def __init__(
+        self,
+        order,
+        n_comp,
+        cov_type="sample",
+        sort="descending",
+        *,
+        solver="eigh",
+        batch_size=None,
+        verbose=False,
+    ):
         super().__init__()
 
         assert 0 <= order
         assert 1 <= n_comp <= order + 1
         assert sort in ["ascending", "descending"]
+        assert solver in ["eigh", "randomized"]
 
         self.order = order
         self.n_comp = n_comp
-        self.cov_type = cov_type
         self.sort = sort
+        self.solver = solver
+        self.batch_size = batch_size
+        self.hide_progress_bar = not verbose
 
         if cov_type in (0, "sample"):
-            self.cov = lambda x: torch.cov(x, correction=0)
+            self.cov_type = "sample"
         elif cov_type in (1, "unbiased"):
-            self.cov = lambda x: torch.cov(x, correction=1)
+            self.cov_type = "unbiased"
         elif cov_type in (2, "correlation"):
-            self.cov = lambda x: torch.corrcoef(x)
+            self.cov_type = "correlation"
         else:
             raise ValueError(f"cov_type {cov_type} is not supported.")
 
         self.register_buffer("v", torch.eye(self.order + 1, self.n_comp))
         self.register_buffer("m", torch.zeros(self.order + 1))
 
+        # Sufficient statistics: number of data, mean, and scatter matrix. They are
+        # kept in double precision to avoid the loss of precision over long streams.
+        self.register_buffer("n_data", torch.zeros((), dtype=torch.long))
+        self.register_buffer("mean", torch.zeros(self.order + 1, dtype=torch.double))
+        self.register_buffer(
+            "scatter",
+            torch.zeros(self.order + 1, self.order + 1, dtype=torch.double),
+        )
+        self._register_load_state_dict_pre_hook(_fill_statistics, with_module=True)
+
     def forward(self, x):
         """Perform PCA.
 
         Parameters
         ----------
-        x : Tensor [shape=(..., M+1)]
-            Input vectors.
+        x : Tensor [shape=(..., M+1)] or DataLoader
+            Input vectors or dataloader yielding input vectors.
 
         Returns
         -------
@@ -97,20 +132,77 @@ class PrincipalComponentAnalysis(nn.Module):
         torch.Size([10, 3])
 
         """
-        check_size(x.size(-1), self.order + 1, "dimension of input")
+        self.n_data.zero_()
+        self.mean.zero_()
+        self.scatter.zero_()
+        return self.partial_fit(x)
+
+    def partial_fit(self, x):
+        """Update PCA with additional input vectors.
+
+        Parameters
+        ----------
+        x : Tensor [shape=(..., M+1)] or DataLoader
+            Input vectors or dataloader yielding input vectors.
 
-        x = x.reshape(-1, x.size(-1)).T
-        assert self.n_comp + 1 <= x.size(1), "Number of data samples is too small"
+        Returns
+        -------
+        e : Tensor [shape=(N,)]
+            Eigenvalues.
+
+        v : Tensor [shape=(M+1, N)]
+            Eigenvectors.
+
+        m : Tensor [shape=(M+1,)]
+            Mean vector.
 
-        e, v = torch.linalg.eigh(self.cov(x))
+        Examples
+        --------
+        >>> x = diffsptk.nrand(10, 3)
+        >>> pca = diffsptk.PCA(3, 3)
+        >>> _ = pca(x[:5])
+        >>> e, _, _ = pca.partial_fit(x[5:])
+        >>> e
+        tensor([1.3465, 0.7497, 0.4447])
+
+        """
+        if torch.is_tensor(x):
+            check_size(x.size(-1), self.order + 1, "dimension of input")
+            x = x.reshape(-1, x.size(-1))
+            # Avoid the overhead of DataLoader for in-memory data.
+            batches = x.split(self.batch_size or max(1, len(x)))
+        elif isinstance(x, torch.utils.data.DataLoader):
+            batches = (batch_x for (batch_x,) in x)
+        else:
+            raise ValueError(f"Unsupported input type: {type(x)}.")
+
+        for batch_x in tqdm(batches, disable=self.hide_progress_bar):
+            check_size(batch_x.size(-1), self.order + 1, "dimension of input")
+            self._accumulate(batch_x.reshape(-1, batch_x.size(-1)))
+
+        n = self.n_data.item()
+        assert self.n_comp + 1 <= n, "Number of data samples is too small"
+
+        if self.cov_type == "sample":
+            cov = self.scatter / n
+        elif self.cov_type == "unbiased":
+            cov = self.scatter / (n - 1)
+        else:
+            d = torch.rsqrt(torch.diagonal(self.scatter))
+            cov = (self.scatter * d.unsqueeze(0) * d.unsqueeze(1)).clamp(-1, 1)
+
+        if self.solver == "eigh":
+            e, v = torch.linalg.eigh(cov)
+        else:
+            e, v = self._randomized_eigh(cov, self.n_comp)
         e = e[-self.n_comp :]
         v = v[:, -self.n_comp :]
         if self.sort == "descending":
             e = e.flip(-1)
             v = v.flip(-1)
         self.v[:] = v
-        self.m[:] = x.mean(1)
-        return e, self.v, self.m
+        self.m[:] = self.mean
+        return e.to(self.v.dtype), self.v, self.m
 
     def transform(self, x):
         """Transform input vectors using estimated eigenvectors.
@@ -128,3 +220,38 @@ class PrincipalComponentAnalysis(nn.Module):
         """
         v = self.v.flip(-1) if self.sort == "ascending" else self.v
         return torch.matmul(x - self.m, v)
+
+    def _accumulate(self, x):
+        # Merge the statistics of the batch by the parallel algorithm of Chan et al.
+        x = x.to(self.scatter)
+        n1 = self.n_data.item()
+        n2 = x.size(0)
+        if n2 == 0:
+            return
+        n = n1 + n2
+        m2 = x.mean(0)
+        xc = x - m2
+        delta = m2 - self.mean
+        self.scatter += torch.matmul(xc.T, xc)
+        self.scatter += torch.outer(delta, delta) * (n1 * n2 / n)
+        self.mean += delta * (n2 / n)
+        self.n_data += n2
+
+    @staticmethod
+    def _randomized_eigh(A, k, n_oversample=10, n_iter=4):
+        # Compute the top-k eigenpairs of the symmetric positive semidefinite matrix
+        # via the randomized subspace iteration (Halko et al., 2011).
+        p = min(k + n_oversample, A.size(-1))
+        Q = torch.randn(A.size(-1), p, dtype=A.dtype, device=A.device)
+        for _ in range(n_iter):
+            Q, _ = torch.linalg.qr(torch.matmul(A, Q))
+        e, u = torch.linalg.eigh(torch.matmul(Q.T, torch.matmul(A, Q)))
+        return e, torch.matmul(Q, u)
+
+
+def _fill_statistics(module, state_dict, prefix, *args):
+    # The state dicts saved by older versions do not have the statistics.
+    for name in ("n_data", "mean", "scatter"):
+        key = prefix + name
+        if key not in state_dict:
+            state_dict[key] = torch.zeros_like(getattr(module, name))
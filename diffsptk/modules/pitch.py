@@ -18,17 +18,22 @@ from abc import ABC
 from abc import abstractmethod
 import importlib
 
+import numpy as np
 import torch
 from torch import nn
+import torch.nn.functional as F
 
 from ..misc.utils import UNVOICED_SYMBOL
 from ..misc.utils import numpy_to_torch
+from ..misc.utils import to
+from .acorr import Autocorrelation
 from .frame import Frame
 from .stft import ShortTimeFourierTransform
+from .yingram import Yingram
 
 
 class Pitch(nn.Module):
-    """Pitch extraction module using external neural models.
+    """Pitch extraction module using external neural models or probabilistic YIN.
 
     Parameters
     ----------
@@ -38,11 +43,11 @@ class Pitch(nn.Module):
     sample_rate : int >= 1
         Sample rate in Hz.
 
-    algorithm : ['crepe']
+    algorithm : ['crepe', 'yin']
         Algorithm.
 
     out_format : ['pitch', 'f0', 'log-f0', 'prob', 'embed']
-        Output format.
+        Output format. `embed` is not supported by YIN.
 
     f_min : float >= 0
         Minimum frequency in Hz.
@@ -51,22 +56,38 @@ class Pitch(nn.Module):
         Maximum frequency in Hz.
 
     voicing_threshold : float
-        Voiced/unvoiced threshold.
+        Voiced/unvoiced threshold (CREPE only).
 
     silence_threshold : float
         Silence threshold in dB.
 
     filter_length : int >= 1
-        Window length of median and moving average filters.
+        Window length of median and moving average filters (CREPE only).
 
     model : ['tiny', 'full']
-        Model size.
+        Model size (CREPE only).
+
+    frame_length : int >= 1 or None
+        Frame length of YIN. If None, twice the maximum period is used.
+
+    n_bin : int >= 1
+        Number of pitch bins per semitone (YIN only).
+
+    switch_prob : float in (0, 1)
+        Probability of switching between voiced and unvoiced states (YIN only).
+
+    max_transition_rate : float > 0
+        Maximum pitch transition rate in octaves per second (YIN only).
 
     References
     ----------
     .. [1] J. W. Kim et al., "CREPE: A Convolutional Representation for Pitch
            Estimation," *Proceedings of ICASSP*, pp. 161-165, 2018.
 
+    .. [2] M. Mauch and S. Dixon, "pYIN: A fundamental frequency estimator using
+           probabilistic threshold distributions," *Proceedings of ICASSP*,
+           pp. 659-663, 2014.
+
     """
 
     def __init__(
@@ -84,6 +105,8 @@ class Pitch(nn.Module):
 
         if algorithm == "crepe":
             self.extractor = PitchExtractionByCrepe(frame_period, sample_rate, **kwargs)
+        elif algorithm == "yin":
+            self.extractor = PitchExtractionByYin(frame_period, sample_rate, **kwargs)
         else:
             raise ValueError(f"algorithm {algorithm} is not supported.")
 
@@ -105,6 +128,8 @@ class Pitch(nn.Module):
         elif out_format == "prob":
             self.convert = lambda x: self.extractor.calc_prob(x)
         elif out_format == "embed":
+            if algorithm == "yin":
+                raise ValueError(f"out_format {out_format} is not supported by YIN.")
             self.convert = lambda x: self.extractor.calc_embed(x)
         else:
             raise ValueError(f"out_format {out_format} is not supported.")
@@ -291,3 +316,178 @@ class PitchExtractionByCrepe(PitchExtractionInterface, nn.Module):
         )
         pitch[mask] = UNVOICED_SYMBOL
         return pitch
+
+
+class PitchExtractionByYin(PitchExtractionInterface, nn.Module):
+    """Pitch extraction by probabilistic YIN."""
+
+    def __init__(
+        self,
+        frame_period,
+        sample_rate,
+        f_min=60,
+        f_max=500,
+        silence_threshold=-60,
+        frame_length=None,
+        n_bin=10,
+        switch_prob=0.01,
+        max_transition_rate=35.92,
+        n_threshold=100,
+        beta_parameters=(2, 18),
+        no_trough_prob=0.01,
+    ):
+        super().__init__()
+
+        assert 0 < f_min < f_max <= sample_rate / 2
+        assert 1 <= n_bin
+        assert 0 < switch_prob < 1
+        assert 0 < max_transition_rate
+        assert 1 <= n_threshold
+
+        # Periods are searched in [lag_min, lag_max - 2].
+        lag_min = max(2, int(sample_rate / f_max))
+        lag_max = int(np.ceil(sample_rate / f_min)) + 2
+        if frame_length is None:
+            frame_length = 2 * lag_max
+        assert lag_max < frame_length
+
+        self.sample_rate = sample_rate
+        self.silence_threshold = silence_threshold
+        self.lag_min = lag_min
+        self.lag_max = lag_max
+        self.no_trough_prob = no_trough_prob
+        self.n_semitone = 12 * n_bin
+        self.n_pitch = int(self.n_semitone * np.log2(f_max / f_min)) + 1
+        self.f_min = f_min
+
+        self.frame = Frame(frame_length, frame_period)
+        self.acorr = Autocorrelation(frame_length, lag_max - 1)
+
+        # Normalize the difference function by the number of overlapping samples.
+        overlap = torch.arange(frame_length, frame_length - lag_max, -1)
+        self.register_buffer("overlap", to(overlap.double().reciprocal()))
+        self.register_buffer("ramp", to(torch.arange(1, lag_max)))
+
+        # Compute the prior distribution of thresholds.
+        thresholds = torch.linspace(0, 1, n_threshold + 1, dtype=torch.double)
+        mid = (thresholds[1:] + thresholds[:-1]) / 2
+        beta = torch.distributions.Beta(*map(float, beta_parameters))
+        prior = beta.log_prob(mid).exp()
+        prior = F.pad(torch.cumsum(prior / prior.sum(), dim=0), (1, 0))
+        self.n_threshold = n_threshold
+        self.register_buffer("threshold_cdf", to(prior))
+
+        # Compute the triangular pitch transition in the log domain.
+        max_semitone = round(max_transition_rate * 12 * frame_period / sample_rate)
+        width = max(1, max_semitone * n_bin // 2)
+        distance = torch.arange(-width, width + 1, dtype=torch.double)
+        kernel = 1 - distance.abs() / (width + 1)
+        index = torch.arange(self.n_pitch, dtype=torch.double)
+        distance = (index.unsqueeze(0) - index.unsqueeze(1)).abs()
+        Z = torch.clip(1 - distance / (width + 1), min=0).sum(-1)
+        switch = np.array(
+            [[1 - switch_prob, switch_prob], [switch_prob, 1 - switch_prob]]
+        )
+        self.width = width
+        self.register_buffer("log_kernel", to(kernel.log()))
+        self.register_buffer("log_norm", to(Z.log()))
+        self.register_buffer("log_switch", numpy_to_torch(np.log(switch)))
+
+    def forward(self, x):
+        # Compute cumulative mean normalized difference function.
+        y = self.frame(x)
+        d = Yingram._difference(y, self.acorr, self.lag_max) * self.overlap.to(y.dtype)
+        d = d[..., 1:]
+        d = self.ramp.to(y.dtype) * d / (torch.cumsum(d, dim=-1) + 1e-7)
+
+        # Refine lags by parabolic interpolation.
+        d0, d1, d2 = d[..., :-2], d[..., 1:-1], d[..., 2:]
+        a = d0 - 2 * d1 + d2
+        shift = torch.where(a.abs() < 1e-12, 0, (d0 - d2) / (2 * a + 1e-12))
+        shift = torch.clip(shift, min=-1, max=1)
+        d = d1[..., self.lag_min - 2 :]
+        lag = self.ramp[self.lag_min - 1 : -1].to(y.dtype)
+        lag = lag + shift[..., self.lag_min - 2 :]
+
+        # Find troughs.
+        is_trough = F.pad(
+            torch.logical_and(d[..., 1:-1] < d[..., :-2], d[..., 1:-1] <= d[..., 2:]),
+            (1, 1),
+        )
+        is_trough[..., 0] = d[..., 0] < d[..., 1]
+
+        # Compute the probability that each trough is the first one below the
+        # threshold.
+        value = torch.where(is_trough, d, torch.inf)
+        upper = F.pad(value[..., :-1], (1, 0), value=torch.inf)
+        upper = torch.cummin(upper, dim=-1).values
+        cdf = self.threshold_cdf.to(y.dtype)
+        n = self.n_threshold
+        # The thresholds are evenly spaced in (0, 1].
+        upper = cdf[torch.clip(upper * n, max=n).long()]
+        lower = cdf[torch.clip(value * n, max=n).long()]
+        prob = torch.clip(upper - lower, min=0)
+
+        # Assign the remaining probability to the global minimum.
+        rest = (1 - prob.sum(-1, keepdim=True)) * self.no_trough_prob
+        prob = prob.scatter_add(-1, d.argmin(-1, keepdim=True), rest)
+
+        # Accumulate the probability in pitch bins.
+        f0 = self.sample_rate / lag
+        index = torch.round(self.n_semitone * torch.log2(f0 / self.f_min)).long()
+        index = torch.clip(index, min=0, max=self.n_pitch - 1)
+        voiced = torch.zeros(
+            *prob.shape[:-1], self.n_pitch, dtype=prob.dtype, device=prob.device
+        )
+        voiced = voiced.scatter_add(-1, index, prob)
+
+        # Remove silent frames.
+        power = 10 * torch.log10(torch.mean(y * y, dim=-1, keepdim=True) + 1e-10)
+        voiced = torch.where(power < self.silence_threshold, 0, voiced)
+        return voiced
+
+    def calc_prob(self, x):
+        return self.forward(x)
+
+    def calc_embed(self, x):
+        raise NotImplementedError("Embedding is not supported by YIN.")
+
+    def calc_pitch(self, x):
+        voiced = self.calc_prob(x)
+        voiced_prob = torch.clip(voiced.sum(-1, keepdim=True), min=0, max=1)
+        unvoiced = ((1 - voiced_prob) / self.n_pitch).expand_as(voiced)
+        obs = torch.stack([voiced, unvoiced], dim=-2)
+        states = self._viterbi(torch.log(obs + 1e-30))
+        pitch = self.f_min * 2 ** ((states % self.n_pitch) / self.n_semitone)
+        pitch = torch.where(states < self.n_pitch, pitch, UNVOICED_SYMBOL)
+        return pitch.to(x.dtype)
+
+    def _viterbi(self, log_obs):
+        # The states are the pitch bins of voiced and unvoiced frames. The pitch
+        # transition is band-limited, so the maximization over the source states is
+        # performed in the band.
+        B, N, _, K = log_obs.shape
+        W = self.width
+        log_kernel = self.log_kernel.to(log_obs.dtype)
+        log_norm = self.log_norm.to(log_obs.dtype)
+        log_switch = self.log_switch.to(log_obs.dtype).unsqueeze(-1)
+        offset = torch.arange(K, device=log_obs.device) - W
+
+        delta = log_obs[:, 0]
+        pointers = []
+        for n in range(1, N):
+            v = F.pad(delta - log_norm, (W, W), value=-torch.inf)
+            v = v.unfold(-1, 2 * W + 1, 1) + log_kernel
+            v, source = v.max(-1)
+            source = source + offset
+            v = v.unsqueeze(2) + log_switch
+            v, switch = v.max(1)
+            source = torch.gather(source, 1, switch) + switch * K
+            pointers.append(source.view(B, -1))
+            delta = v + log_obs[:, n]
+            delta = delta - delta.amax(dim=(-2, -1), keepdim=True)
+
+        states = [delta.view(B, -1).argmax(-1, keepdim=True)]
+        for pointer in reversed(pointers):
+            states.append(torch.gather(pointer, 1, states[-1]))
+        return torch.cat(states[::-1], dim=-1)
@@ -37,6 +37,16 @@ class AllPoleDigitalFilter(nn.Module):
     ignore_gain : bool
         If True, perform filtering without gain.
 
+    algorithm : ['sequential', 'scan']
+        Algorithm of time-varying all-pole filtering. 'sequential' runs the
+        recursion sample by sample. 'scan' splits the signal into chunks, filters
+        all of them at once, and connects their states by a parallel prefix scan,
+        so that the number of sequential steps is reduced from the signal length to
+        about the chunk length plus the logarithm of the number of chunks.
+
+    chunk_length : int >= 1
+        Chunk length, :math:`L`, used only when **algorithm** is 'scan'.
+
     References
     ----------
     .. [1] C.-Y. Yu et al., "Differentiable time-varying linear prediction in the
@@ -45,15 +55,27 @@ class AllPoleDigitalFilter(nn.Module):
 
     """
 
-    def __init__(self, filter_order, frame_period, ignore_gain=False):
+    def __init__(
+        self,
+        filter_order,
+        frame_period,
+        ignore_gain=False,
+        algorithm="sequential",
+        chunk_length=256,
+    ):
         super().__init__()
 
         assert 0 <= filter_order
         assert 1 <= frame_period
+        assert 1 <= chunk_length
+        if algorithm not in ("sequential", "scan"):
+            raise ValueError(f"algorithm {algorithm} is not supported.")
 
         self.filter_order = filter_order
         self.frame_period = frame_period
         self.ignore_gain = ignore_gain
+        self.algorithm = algorithm
+        self.chunk_length = chunk_length
 
     def forward(self, x, a):
         """Apply an all-pole digital filter.
@@ -83,10 +105,17 @@ class AllPoleDigitalFilter(nn.Module):
         """
         check_size(a.size(-1), self.filter_order + 1, "dimension of LPC coefficients")
         check_size(x.size(-1), a.size(-2) * self.frame_period, "sequence length")
-        return self._forward(x, a, self.frame_period, self.ignore_gain)
+        return self._forward(
+            x,
+            a,
+            self.frame_period,
+            self.ignore_gain,
+            self.algorithm,
+            self.chunk_length,
+        )
 
     @staticmethod
-    def _forward(x, a, frame_period, ignore_gain):
+    def _forward(x, a, frame_period, ignore_gain, algorithm, chunk_length):
         d = x.dim()
         if d == 1:
             a = a.unsqueeze(0)
@@ -97,9 +126,96 @@ class AllPoleDigitalFilter(nn.Module):
         if not ignore_gain:
             x = K[..., 0] * x
 
-        y = sample_wise_lpc(x, a)
+        y = AllPoleDigitalFilter._filter(x, a, algorithm, chunk_length)
         if d == 1:
             y = y.squeeze(0)
         return y
 
-    _func = _forward
+    @staticmethod
+    def _func(x, a, frame_period, ignore_gain, algorithm, chunk_length):
+        return AllPoleDigitalFilter._forward(
+            x, a, frame_period, ignore_gain, algorithm, chunk_length
+        )
+
+    @staticmethod
+    def _filter(x, a, algorithm, chunk_length):
+        if algorithm == "sequential":
+            return sample_wise_lpc(x, a)
+        elif algorithm == "scan":
+            return ParallelScanLPC.apply(x, a, chunk_length)
+        raise ValueError(f"algorithm {algorithm} is not supported.")
+
+
+class ParallelScanLPC(torch.autograd.Function):
+    @staticmethod
+    def forward(ctx, x, a, chunk_length):
+        y = ParallelScanLPC._scan(x, a, chunk_length)
+        ctx.save_for_backward(a, y)
+        ctx.chunk_length = chunk_length
+        return y
+
+    @staticmethod
+    @torch.autograd.function.once_differentiable
+    def backward(ctx, grad_output):
+        a, y = ctx.saved_tensors
+        _, T, M = a.shape
+        if M == 0:
+            return grad_output, torch.zeros_like(a), None
+
+        # The adjoint of the filter is the all-pole filter running backward in
+        # time whose m-th coefficient at time t is a_m(t+m).
+        grad_x = grad_a = None
+        if ctx.needs_input_grad[0] or ctx.needs_input_grad[1]:
+            a = nn.functional.pad(a, (0, 0, 0, M))
+            shifted_a = torch.stack(
+                [a[:, m : m + T, m - 1] for m in range(1, M + 1)], dim=-1
+            )
+            grad_x = ParallelScanLPC._scan(
+                grad_output.flip(-1), shifted_a.flip(-2), ctx.chunk_length
+            ).flip(-1)
+        if ctx.needs_input_grad[1]:
+            y = nn.functional.pad(y, (M, 0))
+            past_y = torch.stack(
+                [y[:, M - m : M - m + T] for m in range(1, M + 1)], dim=-1
+            )
+            grad_a = -grad_x.unsqueeze(-1) * past_y
+        return grad_x, grad_a, None
+
+    @staticmethod
+    def _scan(x, a, chunk_length):
+        B, T, M = a.shape
+        if M == 0:
+            return x.clone()
+
+        # Split the signal into C chunks of length L.
+        L = min(chunk_length, T)
+        C = (T + L - 1) // L
+        x = nn.functional.pad(x, (0, C * L - T)).view(B, C, L)
+        a = nn.functional.pad(a, (0, 0, 0, C * L - T)).view(B, C, L, M)
+
+        # Filter all the chunks from the zero state and the unit initial states.
+        # The last column corresponds to the response to the input.
+        h = torch.zeros(B, C, M + L, M + 1, dtype=x.dtype, device=x.device)
+        h[:, :, :M, :M] = torch.eye(M, dtype=x.dtype, device=x.device).flip(0)
+        a = a.flip(-1).unsqueeze(-2)
+        for t in range(L):
+            y = torch.matmul(a[:, :, t], h[:, :, t : t + M])
+            h[:, :, M + t] = -y[..., 0, :]
+            h[:, :, M + t, M] += x[..., t]
+        state = h[:, :, L:].flip(-2)  # (B, C, M, M+1)
+        h = h[:, :, M:]  # (B, C, L, M+1)
+
+        # Connect the states at the chunk boundaries by the prefix scan of the
+        # affine maps s -> Phi s + b.
+        Phi, b = torch.split(state, [M, 1], dim=-1)
+        k = 1
+        while k < C:
+            Phi_prev = Phi[:, :-k]
+            b = torch.cat((b[:, :k], torch.matmul(Phi[:, k:], b[:, :-k]) + b[:, k:]), 1)
+            Phi = torch.cat((Phi[:, :k], torch.matmul(Phi[:, k:], Phi_prev)), 1)
+            k *= 2
+        s = nn.functional.pad(b[:, :-1], (0, 0, 0, 0, 1, 0))  # (B, C, M, 1)
+
+        y = h[..., M] + torch.matmul(h[..., :M], s)[..., 0]
+        y = y.reshape(B, C * L)[:, :T]
+        return y
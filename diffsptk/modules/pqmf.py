@@ -18,8 +18,8 @@ import warnings
 
 import numpy as np
 from torch import nn
-import torch.nn.functional as F
 
+from ..misc.utils import conv1d
 from ..misc.utils import next_power_of_two
 from ..misc.utils import numpy_to_torch
 
@@ -157,18 +157,41 @@ class PseudoQuadratureMirrorFilterBanks(nn.Module):
     learnable : bool
         Whether to make filter-bank coefficients learnable.
 
+    polyphase : bool
+        If True, the subband waveforms are decimated by :math:`K`. Only the retained
+        samples are computed, which reduces the computational cost by :math:`K`
+        times compared to the decimation of the full-rate outputs.
+
+    algorithm : ['auto', 'direct', 'fft']
+        Algorithm of the convolution. 'fft' performs the overlap-save convolution,
+        which is faster for high filter orders. If 'auto', the faster one is
+        selected based on the estimated number of operations.
+
     **kwargs : additional keyword arguments
         Parameters to find optimal filter-bank coefficients.
 
     """
 
-    def __init__(self, n_band, filter_order, alpha=100, learnable=False, **kwargs):
+    def __init__(
+        self,
+        n_band,
+        filter_order,
+        alpha=100,
+        learnable=False,
+        polyphase=False,
+        algorithm="auto",
+        **kwargs,
+    ):
         super().__init__()
 
         assert 1 <= n_band
         assert 2 <= filter_order
         assert 0 < alpha
 
+        self.n_band = n_band
+        self.polyphase = polyphase
+        self.algorithm = algorithm
+
         # Make filterbanks.
         filters, is_converged = make_filter_banks(
             n_band, filter_order, mode="analysis", alpha=alpha, **kwargs
@@ -205,8 +228,9 @@ class PseudoQuadratureMirrorFilterBanks(nn.Module):
 
         Returns
         -------
-        out : Tensor [shape=(B, K, T)]
-            Subband waveforms.
+        out : Tensor [shape=(B, K, T) or (B, K, T/K)]
+            Subband waveforms. If **polyphase** is True, the length is
+            :math:`\\lceil T/K \\rceil`.
 
         Examples
         --------
@@ -224,5 +248,6 @@ class PseudoQuadratureMirrorFilterBanks(nn.Module):
             x = x.unsqueeze(1)
         assert x.dim() == 3, "Input must be 3D tensor."
 
-        y = F.conv1d(self.pad(x), self.filters)
+        stride = self.n_band if self.polyphase else 1
+        y = conv1d(self.pad(x), self.filters, stride=stride, algorithm=self.algorithm)
         return y
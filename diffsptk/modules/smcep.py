@@ -19,6 +19,7 @@ from torch import nn
 
 from ..misc.utils import check_size
 from ..misc.utils import hankel
+from ..misc.utils import iterate_until_convergence
 from ..misc.utils import symmetric_toeplitz
 from ..misc.utils import to
 from .freqt2 import SecondOrderAllPassFrequencyTransform
@@ -76,19 +77,33 @@ class SecondOrderAllPassMelCepstralAnalysis(nn.Module):
     accuracy_factor : int >= 1
         Accuracy factor multiplied by FFT length.
 
+    convergence_threshold : float >= 0
+        Convergence threshold on the relative change of the residual energy. The
+        iteration of each frame is stopped when the change is less than this value.
+        If zero, all frames are updated **n_iter** times.
+
     """
 
     def __init__(
-        self, cep_order, fft_length, alpha=0, theta=0, n_iter=0, accuracy_factor=4
+        self,
+        cep_order,
+        fft_length,
+        alpha=0,
+        theta=0,
+        n_iter=0,
+        accuracy_factor=4,
+        convergence_threshold=0,
     ):
         super().__init__()
 
         assert 0 <= cep_order <= fft_length // 2
         assert 0 <= n_iter
+        assert 0 <= convergence_threshold
 
         self.cep_order = cep_order
         self.fft_length = fft_length
         self.n_iter = n_iter
+        self.convergence_threshold = convergence_threshold
 
         n_fft = fft_length * accuracy_factor
 
@@ -124,7 +139,7 @@ class SecondOrderAllPassMelCepstralAnalysis(nn.Module):
         )(seed)
         self.register_buffer("alpha_vector", alpha_vector)
 
-    def forward(self, x):
+    def forward(self, x, return_n_iter=False):
         """Estimate mel-cepstrum from spectrum.
 
         Parameters
@@ -132,11 +147,17 @@ class SecondOrderAllPassMelCepstralAnalysis(nn.Module):
         x : Tensor [shape=(..., L/2+1)]
             Power spectrum.
 
+        return_n_iter : bool
+            If True, return the number of iterations of each frame.
+
         Returns
         -------
         out : Tensor [shape=(..., M+1)]
             Mel-cepstrum.
 
+        n_iter : Tensor [shape=(...,)]
+            Number of iterations, returned only if **return_n_iter** is True.
+
         Examples
         --------
         >>> x = diffsptk.ramp(19)
@@ -158,7 +179,7 @@ class SecondOrderAllPassMelCepstralAnalysis(nn.Module):
         c[..., H] *= 0.5
         mc = self.freqt(c[..., : H + 1])
 
-        for _ in range(self.n_iter):
+        def step(log_x, mc):
             c = self.ifreqt(mc)
             d = torch.fft.rfft(c, n=self.fft_length).real
             d = torch.exp(log_x - d - d)
@@ -171,6 +192,19 @@ class SecondOrderAllPassMelCepstralAnalysis(nn.Module):
             R = symmetric_toeplitz(r)
             Q = hankel(rt)
             gradient = torch.linalg.solve(R + Q, ra)
-            mc = mc + gradient
+            return (mc + gradient,), r[..., 0]
+
+        # Only the frames that have not converged yet are updated.
+        batch_shape = x.shape[:-1]
+        (mc,), n_iter = iterate_until_convergence(
+            step,
+            log_x.reshape(-1, H + 1),
+            (mc.reshape(-1, M + 1),),
+            self.n_iter,
+            self.convergence_threshold,
+        )
 
+        mc = mc.reshape(*batch_shape, M + 1)
+        if return_n_iter:
+            return mc, n_iter.reshape(batch_shape)
         return mc
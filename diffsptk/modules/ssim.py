@@ -18,6 +18,7 @@ import torch
 from torch import nn
 import torch.nn.functional as F
 
+from ..misc.cache import cached
 from ..misc.utils import to
 
 
@@ -223,8 +224,12 @@ class StructuralSimilarityIndex(nn.Module):
         padding,
         dynamic_range,
     ):
-        kernel = StructuralSimilarityIndex._precompute(
-            kernel_size, sigma, dtype=x.dtype, device=x.device
+        kernel = cached(
+            StructuralSimilarityIndex._precompute,
+            kernel_size,
+            sigma,
+            dtype=x.dtype,
+            device=x.device,
         )
         return StructuralSimilarityIndex._forward(
             x,
@@ -17,6 +17,7 @@
 from torch import nn
 import torch.nn.functional as F
 
+from ..misc.cache import cached
 from .window import Window
 
 
@@ -142,8 +143,13 @@ class Unframe(nn.Module):
 
     @staticmethod
     def _func(y, out_length, frame_length, frame_period, center, window, norm):
-        window = Unframe._precompute(
-            frame_length, window, norm, dtype=y.dtype, device=y.device
+        window = cached(
+            Unframe._precompute,
+            frame_length,
+            window,
+            norm,
+            dtype=y.dtype,
+            device=y.device,
         )
         return Unframe._forward(y, out_length, frame_period, center, window)
 
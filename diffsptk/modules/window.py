@@ -18,6 +18,7 @@ import torch
 from torch import nn
 import torch.nn.functional as F
 
+from ..misc.cache import cached
 from ..misc.utils import check_size
 from ..misc.utils import to
 
@@ -87,8 +88,8 @@ class Window(nn.Module):
 
     @staticmethod
     def _func(x, out_length, window, norm):
-        window = Window._precompute(
-            x.size(-1), window, norm, dtype=x.dtype, device=x.device
+        window = cached(
+            Window._precompute, x.size(-1), window, norm, dtype=x.dtype, device=x.device
         )
         return Window._forward(x, out_length, window)
 
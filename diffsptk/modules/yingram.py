@@ -19,6 +19,7 @@ import torch
 from torch import nn
 import torch.nn.functional as F
 
+from ..misc.cache import cached
 from ..misc.utils import check_size
 from ..misc.utils import to
 from .acorr import Autocorrelation
@@ -119,15 +120,8 @@ class Yingram(nn.Module):
 
     @staticmethod
     def _forward(x, acorr, lag_max, lags, lags_ceil, lags_floor, ramp):
-        W = x.size(-1)
-        x0 = F.pad(x, (1, 0))
-        s = torch.cumsum(x0 * x0, dim=-1)
-        term1 = (s[..., W - lag_max + 1 :]).flip(-1)
-        term2 = s[..., W:] - s[..., :lag_max]
-        term3 = -2 * acorr(x)
-
         # Compute Eq. (7).
-        d = (term1 + term2 + term3)[..., 1:]
+        d = Yingram._difference(x, acorr, lag_max)[..., 1:]
 
         # Compute Eq. (8).
         d = ramp * d / (torch.cumsum(d, dim=-1) + 1e-7)
@@ -139,12 +133,28 @@ class Yingram(nn.Module):
         y = numer / denom + d0[..., lags_floor]
         return y
 
+    @staticmethod
+    def _difference(x, acorr, lag_max):
+        W = x.size(-1)
+        x0 = F.pad(x, (1, 0))
+        s = torch.cumsum(x0 * x0, dim=-1)
+        term1 = (s[..., W - lag_max + 1 :]).flip(-1)
+        term2 = s[..., W:] - s[..., :lag_max]
+        term3 = -2 * acorr(x)
+        return term1 + term2 + term3
+
     @staticmethod
     def _func(x, sample_rate, lag_min, lag_max, n_bin):
         if lag_max is None:
             lag_max = x.size(-1) - 1
-        const = Yingram._precompute(
-            sample_rate, lag_min, lag_max, n_bin, dtype=x.dtype, device=x.device
+        const = cached(
+            Yingram._precompute,
+            sample_rate,
+            lag_min,
+            lag_max,
+            n_bin,
+            dtype=x.dtype,
+            device=x.device,
         )
         return Yingram._forward(
             x, lambda x: Autocorrelation._func(x, lag_max - 1), lag_max, *const
@@ -18,6 +18,7 @@ from torch import nn
 import torch.nn.functional as F
 
 from ..misc.utils import check_size
+from ..misc.utils import time_varying_fir
 from .linear_intpl import LinearInterpolation
 
 
@@ -82,11 +83,11 @@ class AllZeroDigitalFilter(nn.Module):
     def _forward(x, b, frame_period, ignore_gain):
         M = b.size(-1) - 1
         x = F.pad(x, (M, 0))
-        x = x.unfold(-1, M + 1, 1)
-        h = LinearInterpolation._func(b.flip(-1), frame_period)
+        h = b.flip(-1)
+        y = time_varying_fir(x, h, frame_period)
         if ignore_gain:
-            h = h / h[..., -1:]
-        y = (x * h).sum(-1)
+            K = LinearInterpolation._func(h[..., -1:], frame_period)
+            y = y / K[..., 0]
         return y
 
     _func = _forward
@@ -16,6 +16,7 @@
 
 import numpy as np
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -61,3 +62,46 @@ def test_compatibility(device, out_format, M=24, P=80, sr=16000, L=512, B=2):
     )
 
     U.check_differentiability(device, ap, [(B, sr), (B, sr // P)], checks=[True, False])
+
+
+def test_ill_conditioned(P=80, sr=16000, L=512, B=2):
+    ap = diffsptk.Aperiodicity(P, sr, L)
+    x = torch.full((B, sr), 3e4)
+    f0 = torch.full((B, sr // P), 120.0)
+    assert torch.all(torch.isfinite(ap(x, f0)))
+
+    x[:, sr // 2] = torch.nan
+    with pytest.raises(RuntimeError):
+        ap(x, f0)
+
+
+def test_regression(P=80, sr=16000, L=512, T=3200):
+    if torch.get_default_dtype() != torch.double:
+        pytest.skip("The reference values are computed in double precision.")
+
+    ap = diffsptk.Aperiodicity(P, sr, L)
+    generator = torch.Generator().manual_seed(0)
+    t = torch.arange(T) / sr
+    x = torch.sin(2 * torch.pi * 120 * t) + 0.1 * torch.randn(T, generator=generator)
+    f0 = torch.full((T // P,), 120.0)
+    f0[:5] = 0
+
+    # Values computed by the per-band implementation with retried regularization.
+    y = ap(x, f0)[::8, ::64]
+    y_hat = [
+        [0.1240645005, 0.9295342849, 0.9606185856, 0.9746894070, 0.9889663331],
+        [0.0617780352, 0.9853203661, 0.9724615692, 0.9825049130, 0.9926519820],
+        [0.0480145077, 0.8154078391, 0.9479876436, 0.9720198363, 0.9966612629],
+        [0.0420998409, 0.8885190011, 0.9680104583, 0.9818678328, 0.9959235799],
+        [0.0544175869, 0.9488410238, 0.9694883480, 0.9790947949, 0.9887964299],
+    ]
+    assert U.allclose(y, y_hat)
+
+
+def test_state_dict(P=80, sr=16000, L=512):
+    ap = diffsptk.Aperiodicity(P, sr, L)
+    state_dict = ap.state_dict()
+
+    # The state dicts saved by older versions have the ramp buffer.
+    state_dict["extractor.ramp"] = torch.arange(-1, 10)
+    ap.load_state_dict(state_dict)
@@ -0,0 +1,106 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import threading
+
+import torch
+
+import diffsptk
+import tests.utils as U
+
+
+def test_cache(m=9, M=19, alpha=0.1):
+    diffsptk.clear_cache()
+    x = diffsptk.ramp(m)
+    y1 = diffsptk.functional.freqt(x, M, alpha)
+    y2 = diffsptk.functional.freqt(x, M, alpha)
+    diffsptk.functional.freqt(x, M, -alpha)
+    assert U.allclose(y1, y2)
+    info = diffsptk.cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
+    assert info.currsize == 2
+
+    # Check that the cached constants are usable outside of the inference mode.
+    diffsptk.clear_cache()
+    with torch.inference_mode():
+        diffsptk.functional.freqt(x, M, alpha)
+    x.requires_grad_(True)
+    diffsptk.functional.freqt(x, M, alpha).sum().backward()
+    assert diffsptk.cache_info().hits == 1
+
+
+def test_cache_size(M=19):
+    diffsptk.clear_cache()
+    diffsptk.set_cache_size(2)
+    try:
+        x = diffsptk.ramp(M)
+        for alpha in [0.1, 0.2, 0.3]:
+            diffsptk.functional.freqt(x, M, alpha)
+        assert diffsptk.cache_info().currsize == 2
+        diffsptk.functional.freqt(x, M, 0.1)
+        assert diffsptk.cache_info().hits == 0
+
+        diffsptk.set_cache_size(0)
+        diffsptk.functional.freqt(x, M, 0.1)
+        assert diffsptk.cache_info().currsize == 0
+    finally:
+        diffsptk.set_cache_size(128)
+        diffsptk.clear_cache()
+
+
+def test_cache_bytes(T=100):
+    diffsptk.clear_cache()
+    diffsptk.set_cache_size(maxbytes=2**20)
+    try:
+        # The dense MLPG matrix has T x 3T elements.
+        x = diffsptk.nrand(T, 5)
+        diffsptk.functional.mlpg(x, seed=[[-0.5, 0, 0.5]])
+        info = diffsptk.cache_info()
+        assert info.currsize == 1
+        assert 0 < info.currbytes <= info.maxbytes
+
+        x = diffsptk.nrand(10 * T, 5)
+        diffsptk.functional.mlpg(x, seed=[[-0.5, 0, 0.5]])
+        assert diffsptk.cache_info().currsize == 1
+
+        diffsptk.set_cache_size(maxbytes=0)
+        assert diffsptk.cache_info().currsize == 0
+        assert diffsptk.cache_info().currbytes == 0
+    finally:
+        diffsptk.set_cache_size(maxbytes=2**27)
+        diffsptk.clear_cache()
+
+
+def test_thread_safety(n_thread=8, n_call=50):
+    diffsptk.clear_cache()
+    x = diffsptk.nrand(100, 19)
+    y = diffsptk.functional.mlpg(x, seed=[[-0.5, 0, 0.5]])
+
+    errors = []
+
+    def run():
+        for _ in range(n_call):
+            if not U.allclose(diffsptk.functional.mlpg(x, seed=[[-0.5, 0, 0.5]]), y):
+                errors.append(True)
+
+    threads = [threading.Thread(target=run) for _ in range(n_thread)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    assert diffsptk.cache_info().currsize == 1
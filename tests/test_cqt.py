@@ -59,3 +59,22 @@ def test_compatibility(device, fp, K, scale, B=12, f_min=32.7):
     assert np.corrcoef(c1.imag.flatten(), c2.imag.flatten())[0, 1] > 0.99
 
     U.check_differentiability(device, [torch.abs, cqt], [fp])
+
+
+def test_state_dict(P=80, sr=22050):
+    cqt = diffsptk.CQT(P, sr)
+    state_dict = cqt.state_dict()
+
+    # The state dicts saved by older versions have the full FFT bases and windows.
+    old_state_dict = dict(state_dict)
+    for i, (lo, hi) in enumerate(cqt.bands):
+        L = cqt.frames[i].frame_length
+        W = state_dict[f"fft_basis_{i}"]
+        old_state_dict[f"fft_basis_{i}"] = torch.nn.functional.pad(
+            W, (0, 0, lo, L // 2 + 1 - hi)
+        )
+        old_state_dict[f"transforms.{i}.stft.1.window"] = torch.ones(L)
+
+    cqt.load_state_dict(old_state_dict)
+    for key, value in cqt.state_dict().items():
+        assert torch.equal(value, state_dict[key])
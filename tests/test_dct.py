@@ -56,3 +56,9 @@ def test_compatibility(device, module, dct_type, L=8, B=2):
     )
 
     U.check_differentiability(device, dct, [B, L])
+
+
+@pytest.mark.parametrize("dct_type", [1, 2, 3, 4])
+@pytest.mark.parametrize("L", [2, 7, 8])
+def test_algorithm(dct_type, L, B=2):
+    U.check_algorithm(diffsptk.DCT, diffsptk.IDCT, [B, L], L, dct_type)
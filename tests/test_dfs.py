@@ -57,3 +57,13 @@ def test_compatibility_func(b=[-0.42, 1], a=[1, -0.42], T=20):
 def test_learnable(b=[-0.42, 1], T=20):
     dfs = diffsptk.IIR(b, learnable=True)
     U.check_learnable(dfs, (T,))
+
+
+@pytest.mark.parametrize("learnable", [False, True])
+def test_algorithm(learnable, b=[1, 0.5], a=[1, -1.8, 0.9], T=100):
+    dfs1 = diffsptk.IIR(b, a, ir_length=50, algorithm="direct")
+    dfs2 = diffsptk.IIR(b, a, ir_length=50, learnable=learnable, algorithm="fft")
+    x = diffsptk.nrand(T)
+    assert U.allclose(dfs1(x), dfs2(x).detach())
+    if learnable:
+        U.check_learnable(dfs2, (T,))
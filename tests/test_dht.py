@@ -47,3 +47,9 @@ def test_convolution(device, module, dht_type, L=8, B=2):
         )
 
     U.check_differentiability(device, dht, [B, L])
+
+
+@pytest.mark.parametrize("dht_type", [1, 2, 3, 4])
+@pytest.mark.parametrize("L", [2, 7, 8])
+def test_algorithm(dht_type, L, B=2):
+    U.check_algorithm(diffsptk.DHT, diffsptk.IDHT, [B, L], L, dht_type)
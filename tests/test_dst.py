@@ -44,3 +44,9 @@ def test_compatibility(device, module, dst_type, L=8, B=2):
     )
 
     U.check_differentiability(device, dst, [B, L])
+
+
+@pytest.mark.parametrize("dst_type", [1, 2, 3, 4])
+@pytest.mark.parametrize("L", [2, 7, 8])
+def test_algorithm(dst_type, L, B=2):
+    U.check_algorithm(diffsptk.DST, diffsptk.IDST, [B, L], L, dst_type)
@@ -15,6 +15,7 @@
 # ------------------------------------------------------------------------ #
 
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -55,3 +56,12 @@ def test_compatibility(
     )
 
     U.check_differentiability(device, [fbank, spec], [B, L])
+
+
+@pytest.mark.parametrize("B", [1, 1000])
+def test_algorithm(B, C=80, L=1024, sr=16000):
+    x = torch.rand(B, L // 2 + 1)
+    y = diffsptk.functional.fbank(x, C, sr, f_min=300)
+    for algorithm in ["dense", "banded", "auto"]:
+        fbank = diffsptk.MelFilterBankAnalysis(C, L, sr, f_min=300, algorithm=algorithm)
+        assert U.allclose(y, fbank(x))
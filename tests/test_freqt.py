@@ -15,6 +15,7 @@
 # ------------------------------------------------------------------------ #
 
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -43,3 +44,20 @@ def test_compatibility(device, module, m=19, M=29, alpha=0.1, B=2):
     )
 
     U.check_differentiability(device, freqt, [B, m + 1])
+
+
+@pytest.mark.parametrize("m, M", [(0, 5), (5, 0), (7, 29), (29, 7)])
+@pytest.mark.parametrize("alpha", [0, 0.42, -0.9])
+def test_precompute(m, M, alpha):
+    # Construct the transform matrix by the naive recurrence.
+    A = torch.zeros(M + 1, m + 1, dtype=torch.double)
+    A[0] = alpha ** torch.arange(m + 1, dtype=torch.double)
+    for i in range(1, M + 1):
+        for j in range(1, m + 1):
+            if i == 1:
+                A[i, j] = (1 - alpha * alpha) * j * A[0, j - 1]
+            else:
+                A[i, j] = A[i - 1, j - 1] + alpha * (A[i, j - 1] - A[i - 1, j])
+
+    B = diffsptk.FrequencyTransform._precompute(m, M, alpha, dtype=torch.double)
+    assert U.allclose(A.T.numpy(), B.numpy())
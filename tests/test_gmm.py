@@ -158,3 +158,18 @@ def test_posterior(M=3, K=4, B=32, n_iter=50):
     gmm = diffsptk.GMM(M, K, n_iter=10)
     _, posterior, _ = gmm(x, return_posterior=True)
     assert posterior.sum().item() == pytest.approx(B)
+
+
+def test_single_pass(M=3, K=4, B=32, n_iter=5):
+    class CountingDataset(torch.utils.data.TensorDataset):
+        n_access = 0
+
+        def __getitem__(self, index):
+            CountingDataset.n_access += 1
+            return super().__getitem__(index)
+
+    x = torch.randn(B, M + 1)
+    data_loader = torch.utils.data.DataLoader(CountingDataset(x), batch_size=8)
+    gmm = diffsptk.GMM(M, K, n_iter=n_iter, eps=0)
+    gmm(data_loader)
+    assert CountingDataset.n_access == B * n_iter
@@ -77,3 +77,21 @@ def test_compatibility(device, fp, K, scale, B=36, f_min=32.7, verbose=False):
     assert error < 1e-4, f"Mean error: {error}"
 
     U.check_differentiability(device, icqt, [1, K], dtype=c2.dtype)
+
+
+@pytest.mark.parametrize("fp", [127, 128])
+def test_resampling(fp, K=84, B=12):
+    x, sr = diffsptk.read(
+        "assets/data.wav", double=torch.get_default_dtype() == torch.double
+    )
+    T = x.size(0)
+
+    cqt = diffsptk.CQT(fp, sr, n_bin=K, n_bin_per_octave=B)
+    c = cqt(x)
+
+    ys = []
+    for resampling in ["direct", "cascade"]:
+        icqt = diffsptk.ICQT(fp, sr, n_bin=K, n_bin_per_octave=B, resampling=resampling)
+        ys.append(icqt(c, out_length=T))
+    error = (ys[0] - ys[1]).abs().mean()
+    assert error < 1e-4, f"Mean error: {error}"
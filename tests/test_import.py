@@ -0,0 +1,70 @@
+# ------------------------------------------------------------------------ #
+# Copyright 2022 SPTK Working Group                                        #
+#                                                                          #
+# Licensed under the Apache License, Version 2.0 (the "License");          #
+# you may not use this file except in compliance with the License.         #
+# You may obtain a copy of the License at                                  #
+#                                                                          #
+#     http://www.apache.org/licenses/LICENSE-2.0                           #
+#                                                                          #
+# Unless required by applicable law or agreed to in writing, software      #
+# distributed under the License is distributed on an "AS IS" BASIS,        #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. #
+# See the License for the specific language governing permissions and      #
+# limitations under the License.                                           #
+# ------------------------------------------------------------------------ #
+
+import subprocess
+import sys
+
+import pytest
+
+import diffsptk
+
+HEAVY_MODULES = [
+    "soundfile",
+    "torchaudio",
+    "torchcomp",
+    "torchlpc",
+    "vector_quantize_pytorch",
+]
+
+
+def run(code):
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip().split("\n")[-1]
+
+
+def test_lazy_import():
+    code = f"""
+import sys
+import diffsptk
+diffsptk.MelCepstralAnalysis(fft_length=512, cep_order=24, alpha=0.42)
+diffsptk.functional.stft(diffsptk.ramp(1023), frame_length=400, frame_period=80, fft_length=512)
+print(sorted(set({HEAVY_MODULES}) & set(sys.modules)))
+"""
+    assert run(code) == "[]"
+
+
+def test_startup_time(limit=1.0):
+    code = """
+import time
+import torch
+start = time.perf_counter()
+import diffsptk
+print(time.perf_counter() - start)
+"""
+    # Exclude the loading time of PyTorch, which is out of our control.
+    assert float(run(code)) < limit
+
+
+@pytest.mark.parametrize("package", [diffsptk, diffsptk.modules])
+def test_public_names(package):
+    for name in package.__all__:
+        assert hasattr(package, name)
+        assert name in dir(package)
+    assert diffsptk.DCT is diffsptk.modules.dct.DiscreteCosineTransform
+    with pytest.raises(AttributeError):
+        _ = package.undefined_name
@@ -15,6 +15,7 @@
 # ------------------------------------------------------------------------ #
 
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -42,3 +43,23 @@ def test_compatibility(device, a, M, tau=0.01, eps=0.01, K=4, T=20):
 def test_learnable(K=4, M=10, T=20):
     ipqmf = diffsptk.IPQMF(K, M, learnable=True)
     U.check_learnable(ipqmf, (K, T))
+
+
+@pytest.mark.parametrize("M", [10, 11])
+def test_polyphase(M, K=4, T=20):
+    ipqmf1 = diffsptk.IPQMF(K, M)
+    ipqmf2 = diffsptk.IPQMF(K, M, polyphase=True)
+    y = diffsptk.nrand(K, T - 1)
+    z = torch.zeros(K, K * T)
+    z[..., ::K] = y * K
+    assert U.allclose(ipqmf1(z), ipqmf2(y))
+    U.check_learnable(diffsptk.IPQMF(K, M, learnable=True, polyphase=True), (K, T))
+
+
+@pytest.mark.parametrize("polyphase", [False, True])
+def test_algorithm(polyphase, K=4, M=63, T=200):
+    ipqmf1 = diffsptk.IPQMF(K, M, polyphase=polyphase, algorithm="direct")
+    ipqmf2 = diffsptk.IPQMF(K, M, polyphase=polyphase, algorithm="fft")
+    y = diffsptk.nrand(K, T - 1)
+    assert U.allclose(ipqmf1(y), ipqmf2(y))
+    U.check_learnable(diffsptk.IPQMF(K, M, learnable=True, algorithm="fft"), (K, T))
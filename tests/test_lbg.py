@@ -80,3 +80,37 @@ def test_special_case(M=1, K=4, B=10, n_iter=10):
     )
     _, extra_dist = extra_lbg(x)
     assert extra_dist < dist
+
+
+def test_chunked_search(M=3, K=64, T=100, B=7):
+    x = torch.randn(T, M + 1)
+    codebook = torch.randn(K, M + 1)
+    lbg = diffsptk.LBG(M, K, chunk_size=5)
+
+    indices, distance = lbg._nearest(x, codebook)
+    target_distance, target_indices = torch.cdist(x, codebook).min(-1)
+    assert torch.all(indices == target_indices)
+    assert U.allclose(distance, target_distance**2)
+
+    x_loader = diffsptk.misc.utils.to_dataloader(x, B)
+    n, n_data, centroids, total_distance = lbg._accumulate(x_loader, codebook)
+    assert n == T
+    assert U.allclose(n_data, torch.bincount(indices, minlength=K))
+    assert U.allclose(centroids, torch.zeros_like(codebook).index_add(0, indices, x))
+    assert U.allclose(total_distance, distance.sum())
+
+
+def test_iterable_dataset(M=1, K=4, B=10, n_iter=10):
+    x = torch.randn(B, M + 1)
+
+    class Dataset(torch.utils.data.IterableDataset):
+        def __iter__(self):
+            return iter(zip(x))
+
+    lbg1 = diffsptk.LBG(M, K, n_iter=n_iter, batch_size=5, seed=1234)
+    lbg2 = diffsptk.LBG(M, K, n_iter=n_iter, seed=1234)
+    x_loader = torch.utils.data.DataLoader(Dataset(), batch_size=5)
+    codebook, distance = lbg1(x_loader)
+    target_codebook, target_distance = lbg2(x)
+    assert U.allclose(codebook, target_codebook)
+    assert U.allclose(distance, target_distance)
@@ -22,12 +22,14 @@ import tests.utils as U
 
 @pytest.mark.parametrize("device", ["cpu", "cuda"])
 @pytest.mark.parametrize("module", [False, True])
-def test_compatibility(device, module, M=30, L=52, B=2):
+@pytest.mark.parametrize("algorithm", ["recursive", "inverse"])
+def test_compatibility(device, module, algorithm, M=30, L=52, B=2):
     levdur = U.choice(
         module,
         diffsptk.LevinsonDurbin,
         diffsptk.functional.levdur,
         {"lpc_order": M},
+        {"algorithm": algorithm},
     )
 
     U.check_compatibility(
@@ -43,3 +45,14 @@ def test_compatibility(device, module, M=30, L=52, B=2):
 
     acorr = diffsptk.Autocorrelation(L, M)
     U.check_differentiability(device, [levdur, acorr], [B, L])
+
+
+@pytest.mark.parametrize("algorithm", ["recursive", "inverse"])
+def test_parcor(algorithm, M=10, L=32, B=2):
+    acorr = diffsptk.Autocorrelation(L, M)
+    levdur = diffsptk.LevinsonDurbin(M, algorithm=algorithm)
+    lpc2par = diffsptk.LinearPredictiveCoefficientsToParcorCoefficients(M)
+
+    r = acorr(diffsptk.nrand(B, L - 1))
+    a, k = levdur(r, return_parcor=True)
+    assert U.allclose(k.cpu().numpy(), lpc2par(a).cpu().numpy())
@@ -15,8 +15,10 @@
 # ------------------------------------------------------------------------ #
 
 import pytest
+import torch
 
 import diffsptk
+from diffsptk.misc.utils import time_varying_fir
 import tests.utils as U
 
 
@@ -52,3 +54,20 @@ def test_compatibility(device, module, P, N=10):
 def test_various_shape(P=4, N=10):
     linear_intpl = diffsptk.LinearInterpolation(P)
     U.check_various_shape(linear_intpl, [(N,), (N, 1), (1, N, 1)])
+
+
+@pytest.mark.parametrize("P", [1, 4])
+@pytest.mark.parametrize("L", [1, 9])
+def test_time_varying_fir(P, L, N=10, B=2):
+    x = torch.randn(B, N * P + L - 1)
+    h = torch.randn(B, N + 1, L)
+
+    # The last frame is used only for the interpolation.
+    for n in (N, N + 1):
+        y1 = time_varying_fir(x, h[:, :n], P)
+        H = diffsptk.LinearInterpolation(P)(h[:, :n])[:, : N * P]
+        y2 = (x.unfold(-1, L, 1) * H).sum(-1)
+        assert U.allclose(y1, y2)
+
+    y = time_varying_fir(x[0], h, P)
+    assert U.allclose(y, time_varying_fir(x[:1].expand(B, -1), h, P))
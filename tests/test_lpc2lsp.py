@@ -15,6 +15,7 @@
 # ------------------------------------------------------------------------ #
 
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -45,3 +46,40 @@ def test_compatibility(device, module, M, out_format, L=32, B=2):
     )
 
     U.check_differentiability(device, lpc2lsp, [B, M + 1])
+
+
+@pytest.mark.parametrize("M", [1, 2, 7, 8])
+@pytest.mark.parametrize("dtype", [torch.float, torch.double])
+def test_algorithm(M, dtype, L=32, B=4):
+    default_dtype = torch.get_default_dtype()
+    torch.set_default_dtype(dtype)
+    try:
+        _check_algorithm(M, L, B)
+    finally:
+        torch.set_default_dtype(default_dtype)
+
+
+def _check_algorithm(M, L, B):
+    lpc = diffsptk.LPC(L, M)
+    lpc2lsp = diffsptk.LinearPredictiveCoefficientsToLineSpectralPairs(M)
+    eig_lpc2lsp = diffsptk.LinearPredictiveCoefficientsToLineSpectralPairs(
+        M, algorithm="eig"
+    )
+
+    # The last frame is not minimum phase and falls back to the eigenvalues.
+    a = lpc(torch.randn(B, L))
+    a[-1, 1:] = 10 * torch.randn(M)
+    assert U.allclose(eig_lpc2lsp(a), lpc2lsp(a))
+
+    a = lpc(torch.randn(B, L)).requires_grad_()
+    (g1,) = torch.autograd.grad(eig_lpc2lsp(a).sum(), a)
+    (g2,) = torch.autograd.grad(lpc2lsp(a).sum(), a)
+    assert U.allclose(g1, g2)
+
+
+def test_state_dict(M=8):
+    # The basis is not saved so that checkpoints of older versions can be loaded.
+    lpc2lsp = diffsptk.LinearPredictiveCoefficientsToLineSpectralPairs(M)
+    state_dict = lpc2lsp.state_dict()
+    assert list(state_dict) == ["kernel_p", "kernel_q"]
+    lpc2lsp.load_state_dict(state_dict)
@@ -15,6 +15,7 @@
 # ------------------------------------------------------------------------ #
 
 import pytest
+import torch
 import torch.nn.functional as F
 
 import diffsptk
@@ -58,3 +59,17 @@ def test_compatibility(device, module, data, L, N=10, magic_number=0):
 def test_various_shape(N=10):
     magic_intpl = diffsptk.MagicNumberInterpolation()
     U.check_various_shape(magic_intpl, [(N,), (N, 1), (1, N, 1)], preprocess=F.dropout)
+
+
+def test_batch(B=2, N=14, D=3):
+    x = torch.tensor([0.0, 9, 0, 0, 0, 0, 2, 1, 0, 0, 4, 5, 0, 0])
+    y = torch.tensor([9, 9, 7.6, 6.2, 4.8, 3.4, 2, 1, 2, 3, 4, 5, 5, 5])
+    magic_intpl = diffsptk.MagicNumberInterpolation(0)
+    assert U.allclose(magic_intpl(x), y)
+
+    x = torch.randn(B, N, D) * (torch.rand(B, N, D) < 0.5)
+    x[0, :, 0] = 0
+    y = magic_intpl(x)
+    for b in range(B):
+        for d in range(D):
+            assert U.allclose(y[b, :, d], magic_intpl(x[b, :, d]))
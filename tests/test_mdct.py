@@ -15,6 +15,7 @@
 # ------------------------------------------------------------------------ #
 
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -44,3 +45,17 @@ def test_compatibility(device, module, window, L=512):
     )
 
     U.check_differentiability(device, mdct, [L])
+
+
+@pytest.mark.parametrize("transform", ["cosine", "sine"])
+def test_algorithm(transform, L=16, B=2):
+    mdt = diffsptk.modules.mdct.ModifiedDiscreteTransform
+    imdt = diffsptk.modules.imdct.InverseModifiedDiscreteTransform
+    params = {"length": L, "window": "sine", "transform": transform}
+
+    x = torch.randn(B, L)
+    y = torch.randn(B, L // 2)
+    assert U.allclose(mdt(**params)(x), mdt(**params, algorithm="fft")(x))
+    assert U.allclose(imdt(**params)(y), imdt(**params, algorithm="fft")(y))
+
+    U.check_differentiability("cpu", mdt(**params, algorithm="fft"), [B, L])
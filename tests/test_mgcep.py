@@ -15,6 +15,7 @@
 # ------------------------------------------------------------------------ #
 
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -39,3 +40,24 @@ def test_compatibility(device, n_iter, gamma, M=8, L=32, B=2, alpha=0.1):
     )
 
     U.check_differentiability(device, [mgcep, spec], [B, L])
+
+
+@pytest.mark.parametrize("gamma", [0, -0.5])
+def test_convergence(gamma, M=8, L=32, B=10, alpha=0.1):
+    spec = diffsptk.Spectrum(L, eps=0)
+    params = {"alpha": alpha, "gamma": gamma}
+    mgcep = diffsptk.MelGeneralizedCepstralAnalysis(
+        M, L, n_iter=30, convergence_threshold=1e-4, **params
+    )
+
+    # Average periodograms to avoid spectral nulls that slow down the convergence.
+    generator = torch.Generator().manual_seed(0)
+    x = spec(torch.randn(B, 4, L, generator=generator)).mean(-2)
+    y, n_iter = mgcep(x, return_n_iter=True)
+    assert (n_iter < 30).all()
+    for n in n_iter.unique().tolist():
+        mask = n_iter == n
+        mgcep_n = diffsptk.MelGeneralizedCepstralAnalysis(M, L, n_iter=n, **params)
+        assert U.allclose(y[mask].cpu().numpy(), mgcep_n(x[mask]).cpu().numpy())
+
+    U.check_differentiability("cpu", [mgcep, spec], [B, L])
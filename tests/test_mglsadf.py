@@ -18,6 +18,7 @@ import os
 
 import numpy as np
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -87,3 +88,65 @@ def test_differentiable(device, ignore_gain, phase, mode, B=4, T=20, P=2, M=4):
         M, P, ignore_gain=ignore_gain, phase=phase, mode=mode, **params
     )
     U.check_differentiability(device, mglsadf, [(B, T), (B, T // P, M + 1)])
+
+
+@pytest.mark.parametrize("ignore_gain", [False, True])
+@pytest.mark.parametrize("phase", ["minimum", "maximum", "zero"])
+def test_multi_stage_algorithm(ignore_gain, phase, B=2, T=40, P=4, M=4):
+    params = {"ignore_gain": ignore_gain, "phase": phase, "cep_order": 10}
+    mglsadf1 = diffsptk.MLSA(M, P, alpha=0.1, algorithm="direct", **params)
+    mglsadf2 = diffsptk.MLSA(M, P, alpha=0.1, algorithm="fft", **params)
+
+    x = diffsptk.nrand(B, T - 1)
+    mc = diffsptk.nrand(B, T // P, M) * 0.1
+    y1 = mglsadf1(x, mc).cpu().numpy()
+    y2 = mglsadf2(x, mc).cpu().numpy()
+    assert U.allclose(y1, y2)
+
+    U.check_differentiability("cpu", mglsadf2, [(B, T), (B, T // P, M + 1)])
+
+
+@pytest.mark.parametrize("ignore_gain", [False, True])
+@pytest.mark.parametrize("phase", ["minimum", "maximum", "zero"])
+def test_single_stage_chunk(ignore_gain, phase, B=2, T=40, P=4, M=4):
+    params = {"ignore_gain": ignore_gain, "phase": phase, "ir_length": 20}
+    mglsadf1 = diffsptk.MLSA(M, P, mode="single-stage", n_fft=32, **params)
+    mglsadf2 = diffsptk.MLSA(
+        M, P, mode="single-stage", n_fft=32, chunk_length=3, **params
+    )
+
+    x = diffsptk.nrand(B, T - 1)
+    mc = diffsptk.nrand(B, T // P, M) * 0.1
+    y1 = mglsadf1(x, mc).cpu().numpy()
+    y2 = mglsadf2(x, mc).cpu().numpy()
+    assert U.allclose(y1, y2)
+
+    U.check_differentiability("cpu", mglsadf2, [(B, T), (B, T // P, M + 1)])
+
+
+@pytest.mark.parametrize("phase", ["minimum", "maximum", "zero"])
+@pytest.mark.parametrize("mode", ["multi-stage", "single-stage", "freq-domain"])
+def test_streaming(phase, mode, B=2, N=15, P=4, M=4):
+    if mode == "multi-stage":
+        params = {"cep_order": 10, "taylor_order": 5}
+    elif mode == "single-stage":
+        params = {"ir_length": 20, "n_fft": 32}
+    elif mode == "freq-domain":
+        params = {"frame_length": 12, "fft_length": 16}
+
+    mglsadf = diffsptk.MLSA(M, P, alpha=0.1, phase=phase, mode=mode, **params)
+
+    x = diffsptk.nrand(B, N * P - 1)
+    mc = diffsptk.nrand(B, N, M) * 0.1
+    y1 = mglsadf(x, mc).cpu().numpy()
+
+    y2 = []
+    state = mglsadf.init_state()
+    for n in range(N):
+        y, state = mglsadf.process(
+            x[..., n * P : (n + 1) * P], mc[..., n : n + 1, :], state
+        )
+        y2.append(y)
+    y2.append(mglsadf.flush(state))
+    y2 = torch.cat(y2, dim=-1).cpu().numpy()
+    assert U.allclose(y1, y2)
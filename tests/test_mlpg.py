@@ -15,6 +15,7 @@
 # ------------------------------------------------------------------------ #
 
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -30,13 +31,16 @@ import tests.utils as U
         [2, 3],
     ],
 )
-def test_compatibility(device, module, seed, T=100, D=2):
+@pytest.mark.parametrize("algorithm", ["dense", "banded"])
+@pytest.mark.parametrize("unit_variance", [False, True])
+def test_compatibility(device, module, seed, algorithm, unit_variance, T=100, D=2):
     mlpg = U.choice(
         module,
         diffsptk.MaximumLikelihoodParameterGeneration,
-        diffsptk.functional.mlpg,
+        lambda u, v, **kwargs: diffsptk.functional.mlpg(u, v=v, **kwargs),
         {"size": T},
-        {"seed": seed},
+        {"seed": seed, "algorithm": algorithm},
+        n_input=2,
     )
 
     if U.is_array(seed[0]):
@@ -53,19 +57,49 @@ def test_compatibility(device, module, seed, T=100, D=2):
         mlpg,
         [
             f"nrand -s 1 -l {T*D*H} > {tmp1}",  # mean
-            f"step -l {T*D*H} > {tmp2}",  # unit variance
+            (
+                f"step -l {T*D*H} > {tmp2}"
+                if unit_variance
+                else f"nrand -s 2 -l {T*D*H} | sopr -ABS -a 0.1 > {tmp2}"
+            ),
             f"merge -l {D*H} -L {D*H} {tmp1} {tmp2} > {tmp3}",
         ],
-        f"cat {tmp1}",
+        [f"cat {tmp1}", f"cat {tmp2}"],
         f"mlpg -l {D} {opt} -R 1 {tmp3}",
         [f"rm {tmp1} {tmp2} {tmp3}"],
-        dx=D * H,
+        dx=[D * H, D * H],
         dy=D,
     )
 
 
 @pytest.mark.parametrize("device", ["cpu", "cuda"])
-def test_differentiable(device, B=2, T=20, D=2):
+@pytest.mark.parametrize("algorithm", ["dense", "banded"])
+def test_differentiable(device, algorithm, B=2, T=20, D=2):
     delta = diffsptk.Delta()
-    mlpg = diffsptk.MLPG(T)
+    mlpg = diffsptk.MLPG(T, algorithm=algorithm)
     U.check_differentiability(device, [mlpg, delta], [B, T, D])
+
+
+@pytest.mark.parametrize("seed", [[[-0.5, 0, 0.5], [1, -2, 1]], [2, 3], [1]])
+def test_algorithm(seed, B=2, T=50, D=3):
+    H = len(seed) + 1
+    mlpg1 = diffsptk.MLPG(T, seed, algorithm="dense")
+    mlpg2 = diffsptk.MLPG(T, seed, algorithm="banded")
+
+    u = torch.randn(B, T, D * H)
+    v = torch.rand(B, T, D * H) + 0.1
+    assert U.allclose(mlpg1(u), mlpg2(u))
+    assert U.allclose(mlpg1(u, v), mlpg2(u, v))
+
+
+def test_positional_seed(T=20, D=2):
+    seed = [[-0.5, 0, 0.5]]
+    u = torch.randn(T, D * 2)
+    assert U.allclose(diffsptk.functional.mlpg(u, seed), diffsptk.MLPG(T, seed)(u))
+
+
+def test_state_dict(T=20):
+    # Only the matrix is saved so that checkpoints of older versions can be loaded.
+    mlpg = diffsptk.MLPG(T)
+    assert list(mlpg.state_dict()) == ["M"]
+    mlpg.load_state_dict({"M": mlpg.M.clone()})
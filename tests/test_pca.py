@@ -52,3 +52,50 @@ def test_compatibility(device, cov_type, B=10, M=4, N=3):
     assert U.allclose(e1, e2)
     assert U.allclose(np.abs(v1), np.abs(v2))
     assert U.allclose(np.abs(y1), np.abs(y2))
+
+
+@pytest.mark.parametrize("cov_type", [0, 1, 2])
+def test_incremental(cov_type, B=100, M=4, N=3):
+    x = torch.randn(B, M + 1) * torch.arange(1, M + 2)
+    pca1 = diffsptk.PCA(M, N, cov_type=cov_type)
+    e1, v1, m1 = pca1(x)
+
+    pca2 = diffsptk.PCA(M, N, cov_type=cov_type, batch_size=7)
+    pca2(x[: B // 2])
+    e2, v2, m2 = pca2.partial_fit(diffsptk.misc.utils.to_dataloader(x[B // 2 :], 9))
+    assert U.allclose(e1, e2)
+    assert U.allclose(v1.abs(), v2.abs())
+    assert U.allclose(m1, m2)
+
+
+def test_precision(B=1000, M=4, N=3):
+    # Double input keeps its precision since the statistics are in double.
+    x = torch.randn(B, M + 1, dtype=torch.double) * torch.arange(1, M + 2) + 1e6
+    pca = diffsptk.PCA(M, N, batch_size=10)
+    e, _, _ = pca(x)
+    target = torch.linalg.eigvalsh(torch.cov(x.T, correction=0))
+    assert U.allclose(e, target.flip(-1)[:N])
+
+
+def test_randomized(B=1000, M=49, N=3):
+    torch.manual_seed(1234)
+
+    # The number of random vectors, N + 10, is much smaller than the dimension.
+    x = torch.randn(B, M + 1) * 0.8 ** torch.arange(M + 1)
+    pca1 = diffsptk.PCA(M, N)
+    e1, v1, _ = pca1(x)
+
+    pca2 = diffsptk.PCA(M, N, solver="randomized")
+    e2, v2, _ = pca2(x)
+    assert U.allclose(e1, e2)
+    assert U.allclose(v1.abs(), v2.abs())
+
+
+def test_state_dict(B=10, M=4, N=3):
+    pca1 = diffsptk.PCA(M, N)
+    pca1(torch.randn(B, M + 1))
+
+    # The state dicts saved by older versions have only the results.
+    pca2 = diffsptk.PCA(M, N)
+    pca2.load_state_dict({"v": pca1.v, "m": pca1.m})
+    assert U.allclose(pca1.v, pca2.v)
@@ -14,8 +14,10 @@
 # limitations under the License.                                           #
 # ------------------------------------------------------------------------ #
 
+import librosa
 import numpy as np
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -76,3 +78,47 @@ def test_compatibility(device, out_format, P=80, sr=16000, L=80, H=180):
 def test_differentiable(device, out_format, P=80, sr=16000, B=2, T=1000):
     pitch = diffsptk.Pitch(P, sr, out_format=out_format, model="tiny")
     U.check_differentiability(device, pitch, [B, T])
+
+
+@pytest.mark.parametrize("out_format", [0, 1, 2])
+def test_yin(out_format, P=80, L=60, H=500):
+    x, sr = diffsptk.read("assets/data.wav")
+    pitch = diffsptk.Pitch(
+        P, sr, algorithm="yin", out_format=out_format, f_min=L, f_max=H
+    )
+    y = pitch(x).numpy()
+    assert np.all(pitch(torch.stack([x, x])).numpy() == y)
+
+    lag_max = int(np.ceil(sr / L)) + 2
+    f0, _, _ = librosa.pyin(
+        x.numpy(),
+        fmin=L,
+        fmax=H,
+        sr=sr,
+        frame_length=2 * lag_max,
+        hop_length=P,
+    )
+    f0 = np.nan_to_num(f0)[: len(y)]
+
+    if out_format == 0:
+        y[y != 0] = sr / y[y != 0]
+    elif out_format == 2:
+        y[y != -1e10] = np.exp(y[y != -1e10])
+        y[y == -1e10] = 0
+
+    voiced = np.logical_and(0 < f0, 0 < y)
+    assert np.sum((0 < f0) != (0 < y)) < 5
+    assert np.mean(np.abs(f0[voiced] - y[voiced])) < 1
+
+
+def test_yin_prob(P=80, B=2):
+    x, sr = diffsptk.read("assets/data.wav")
+    x = torch.stack([x] * B)
+    pitch = diffsptk.Pitch(P, sr, algorithm="yin", out_format="prob")
+    N = diffsptk.Pitch(P, sr, algorithm="yin")(x).size(-1)
+    y = pitch(x)
+    assert y.shape == (B, N, pitch.extractor.n_pitch)
+    assert torch.all(0 <= y)
+
+    with pytest.raises(ValueError):
+        diffsptk.Pitch(P, sr, algorithm="yin", out_format="embed")
@@ -14,10 +14,12 @@
 # limitations under the License.                                           #
 # ------------------------------------------------------------------------ #
 
+import io
 import os
 
 import numpy as np
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -59,3 +61,37 @@ def test_compatibility(device, module, ignore_gain, M=24, P=80, L=400):
     )
 
     U.check_differentiability(device, poledf, [(P,), (1, M + 1)])
+
+
+@pytest.mark.parametrize("M", [0, 1, 8])
+@pytest.mark.parametrize("L", [3, 16, 100])
+def test_algorithm(M, L, P=5, N=10, B=2):
+    poledf = diffsptk.AllPoleDigitalFilter(M, P)
+    scan_poledf = diffsptk.AllPoleDigitalFilter(M, P, algorithm="scan", chunk_length=L)
+
+    x = torch.randn(B, N * P, requires_grad=True)
+    a = torch.randn(B, N, M + 1) * 0.1
+    a[..., 0] = 1
+    a.requires_grad_()
+    y1 = poledf(x, a)
+    y2 = scan_poledf(x, a)
+    assert U.allclose(y1.detach(), y2.detach())
+
+    g1 = torch.autograd.grad(y1.sum(), (x, a))
+    g2 = torch.autograd.grad(y2.sum(), (x, a))
+    assert U.allclose(g1[0], g2[0])
+    assert U.allclose(g1[1], g2[1])
+
+    U.check_differentiability("cpu", scan_poledf, [(P,), (1, M + 1)])
+
+
+def test_pickle(M=4, P=5, N=10):
+    poledf = diffsptk.AllPoleDigitalFilter(M, P, algorithm="scan", chunk_length=8)
+    buffer = io.BytesIO()
+    torch.save(poledf, buffer)
+    buffer.seek(0)
+    loaded = torch.load(buffer, weights_only=False)
+
+    x = torch.randn(N * P)
+    a = torch.randn(N, M + 1) * 0.1
+    assert U.allclose(poledf(x, a), loaded(x, a))
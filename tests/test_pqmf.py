@@ -48,3 +48,21 @@ def test_various_shape(K=4, M=10, T=20):
 def test_learnable(K=4, M=10, T=20):
     pqmf = diffsptk.PQMF(K, M, learnable=True)
     U.check_learnable(pqmf, (T,))
+
+
+@pytest.mark.parametrize("M", [10, 11])
+def test_polyphase(M, K=4, T=20):
+    pqmf1 = diffsptk.PQMF(K, M)
+    pqmf2 = diffsptk.PQMF(K, M, polyphase=True)
+    x = diffsptk.nrand(T - 1)
+    assert U.allclose(pqmf1(x)[..., ::K], pqmf2(x))
+    U.check_learnable(diffsptk.PQMF(K, M, learnable=True, polyphase=True), (T,))
+
+
+@pytest.mark.parametrize("polyphase", [False, True])
+def test_algorithm(polyphase, K=4, M=63, T=200):
+    pqmf1 = diffsptk.PQMF(K, M, polyphase=polyphase, algorithm="direct")
+    pqmf2 = diffsptk.PQMF(K, M, polyphase=polyphase, algorithm="fft")
+    x = diffsptk.nrand(T - 1)
+    assert U.allclose(pqmf1(x), pqmf2(x))
+    U.check_learnable(diffsptk.PQMF(K, M, learnable=True, algorithm="fft"), (T,))
@@ -15,6 +15,7 @@
 # ------------------------------------------------------------------------ #
 
 import pytest
+import torch
 
 import diffsptk
 import tests.utils as U
@@ -41,3 +42,25 @@ def test_compatibility(device, n_iter, theta, M=8, L=32, F=4, B=2, alpha=0.1):
     )
 
     U.check_differentiability(device, [smcep, spec], [B, L])
+
+
+def test_convergence(M=8, L=32, B=10, alpha=0.1, theta=0.5):
+    spec = diffsptk.Spectrum(L, eps=0)
+    params = {"alpha": alpha, "theta": theta}
+    smcep = diffsptk.SecondOrderAllPassMelCepstralAnalysis(
+        M, L, n_iter=30, convergence_threshold=1e-4, **params
+    )
+
+    # Average periodograms to avoid spectral nulls that slow down the convergence.
+    generator = torch.Generator().manual_seed(0)
+    x = spec(torch.randn(B, 4, L, generator=generator)).mean(-2)
+    y, n_iter = smcep(x, return_n_iter=True)
+    assert (n_iter < 30).all()
+    for n in n_iter.unique().tolist():
+        mask = n_iter == n
+        smcep_n = diffsptk.SecondOrderAllPassMelCepstralAnalysis(
+            M, L, n_iter=n, **params
+        )
+        assert U.allclose(y[mask].cpu().numpy(), smcep_n(x[mask]).cpu().numpy())
+
+    U.check_differentiability("cpu", [smcep, spec], [B, L])
@@ -265,3 +265,21 @@ def check_learnable(module, shape):
 
     for pb, pa in zip(params_before, params_after):
         assert not torch.allclose(pb, pa)
+
+
+def check_algorithm(module, inverse, shape, *args):
+    dense = module(*args, algorithm="dense")
+    fast = module(*args, algorithm="fft")
+    fast_inverse = inverse(*args, algorithm="fft")
+
+    x = torch.randn(*shape)
+    y = fast(x)
+    assert allclose(dense(x), y)
+    assert allclose(x, fast_inverse(y))
+
+    # Only the transform matrix of the dense algorithm is saved.
+    assert list(dense.state_dict()) == ["W"]
+    assert list(fast.state_dict()) == []
+    fast.load_state_dict(dense.state_dict())
+
+    check_differentiability("cpu", fast, shape)